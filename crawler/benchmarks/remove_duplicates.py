@@ -0,0 +1,72 @@
+"""
+Compares FilterRemoveDuplicates with the previous O(n^2) implementation
+on a synthetic URL list.
+
+Usage (from the repository root):
+    python -m crawler.benchmarks.remove_duplicates [size] [legacy size]
+"""
+import random
+import sys
+import time
+from typing import List, Callable
+
+from crawler.core.types import PageUrl, ListType
+from crawler.filters.remove_duplicates import FilterRemoveDuplicates
+
+
+def legacy_remove_duplicates(url_list: List[PageUrl]) -> List[PageUrl]:
+    """
+    Previous implementation (predicate with list.index and a tail scan)
+    """
+
+    def predicate(source: PageUrl):
+        for i in range(url_list.index(source) + 1, len(url_list)):
+            if url_list[i].url == source.url:
+                return False
+
+        return True
+
+    return list(filter(predicate, url_list))
+
+
+def generate_url_list(size: int, unique_ratio: float = 0.75) -> \
+        List[PageUrl]:
+    """
+    Generates URL list, like several merged lists
+    """
+    rand = random.Random(size)
+    unique = max(1, int(size * unique_ratio))
+
+    return [
+        PageUrl(url=f'/wiki/Function{index}',
+                name=f'function{index}',
+                category=f'Category {index % 40}',
+                type=rand.choice([ListType.CLIENT, ListType.SERVER]))
+        for index in (rand.randrange(unique) for _ in range(size))
+    ]
+
+
+def measure(function: Callable[[List[PageUrl]], List[PageUrl]],
+            url_list: List[PageUrl]) -> float:
+    start = time.perf_counter()
+    function(url_list)
+    return time.perf_counter() - start
+
+
+def main(size: int, legacy_size: int):
+    url_list = generate_url_list(size)
+    current = measure(FilterRemoveDuplicates.remove_duplicates, url_list)
+    print(f'Single pass, {size} URLs: {current:.4f}s')
+
+    legacy_list = generate_url_list(legacy_size)
+    legacy = measure(legacy_remove_duplicates, legacy_list)
+    print(f'Legacy, {legacy_size} URLs: {legacy:.4f}s')
+
+    estimated = legacy * (size / legacy_size) ** 2
+    print(f'Legacy, {size} URLs (estimated as O(n^2)): {estimated:.1f}s')
+    print(f'Speedup: ~{estimated / current:.0f}x')
+
+
+if __name__ == '__main__':
+    main(size=int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         legacy_size=int(sys.argv[2]) if len(sys.argv) > 2 else 5_000)
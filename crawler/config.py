@@ -3,7 +3,25 @@ from typing import Optional, Tuple, Set
 from crawler.core.types import ListType
 
 HOST_URL: str
+LIST_SOURCE: str
 BATCH_SIZE: int
+BATCH_SIZE_LIMIT: int
+ADAPTIVE_BATCH_SIZE: bool
+BATCH_TARGET_LATENCY: float
+BATCH_MAX_PAYLOAD: int
+FETCH_WORKERS: int
+HOST_MAX_CONNECTIONS: int
+HOST_REQUEST_INTERVAL: float
+REQUEST_TIMEOUT: float
+REQUEST_RETRIES: int
+REQUEST_BACKOFF_FACTOR: float
+REQUEST_MAXLAG: Optional[int]
+INCREMENTAL_FETCH: bool
+ISOLATE_FETCH_FAILURES: bool
+WRITE_QUEUE_SIZE: int
+DUMP_STORAGE: str
+DUMP_COMPRESSION: Optional[str]
+DUMP_URL_LIST_PY: bool
 
 FUNCTION_SUBFOLDER: str
 FUNCTION_START_FROM: Optional[Tuple[ListType, str]]
@@ -16,16 +34,94 @@ EVENT_BLACKLIST: Set[str]
 # URL to MTASA Wiki
 HOST_URL = 'https://wiki.multitheftauto.com'
 
+# Source of the function and event lists:
+#   'api' - list page wikitext by the MediaWiki API (a few small requests),
+#       the rendered page is parsed, if the API request fails
+#   'html' - the rendered list page
+LIST_SOURCE = 'api'
+
 # Amount of pages, that will be fetched per a one request
-# The limit is 50
+# (the first request, if the batch size is adaptive)
 BATCH_SIZE = 50
 
+# Maximal amount of pages per a one request (the API title limit).
+# The limit is 50, or 500 for accounts with the `apihighlimits` right (bots)
+BATCH_SIZE_LIMIT = 50
+
+# Adapt the batch size to the server:
+#   it is halved after a batch slower than {BATCH_TARGET_LATENCY} seconds,
+#   larger than {BATCH_MAX_PAYLOAD} bytes or refused because of the lag,
+#   and grows after fast batches (up to {BATCH_SIZE_LIMIT})
+# Set False to fetch {BATCH_SIZE} pages per request
+ADAPTIVE_BATCH_SIZE = True
+BATCH_TARGET_LATENCY = 5.0
+BATCH_MAX_PAYLOAD = 4 * 1024 * 1024
+
+# Amount of batches, that will be fetched concurrently
+# Set 1 to fetch batches one by one
+FETCH_WORKERS = 4
+
+# Politeness limits for a one host:
+#   the maximum amount of simultaneous requests
+#   and the minimal interval (in seconds) between two requests
+HOST_MAX_CONNECTIONS = 4
+HOST_REQUEST_INTERVAL = 0.1
+
+# Timeout (in seconds) for a one HTTP request
+REQUEST_TIMEOUT = 60
+
+# Amount of retries for a failed HTTP request
+#   (connection errors, 429 and 5xx responses)
+REQUEST_RETRIES = 5
+
+# Delay between retries is
+#   {REQUEST_BACKOFF_FACTOR} * (2 ** {retry number - 1}) seconds
+REQUEST_BACKOFF_FACTOR = 0.5
+
+# MediaWiki `maxlag` parameter: requests are refused, while the database
+#   replication lag is larger than {REQUEST_MAXLAG} seconds.
+#   Refused batches are retried after the `Retry-After` delay
+# Set None to disable
+REQUEST_MAXLAG = 5
+
+# Fetch only pages changed since the last crawl.
+# Revisions of the cached pages are stored next to the dump_html files
+INCREMENTAL_FETCH = True
+
+# Skip pages, that could not be fetched (missing or renamed pages),
+#   instead of stopping the crawl. A failed batch is split to find
+#   the failed pages. They are listed in dump_html/failures_<subfolder>.json
+ISOLATE_FETCH_FAILURES = True
+
+# Fetched pages are written to the disk in a background thread.
+#   The writer keeps at most {WRITE_QUEUE_SIZE} pages waiting,
+#   the fetching waits, if the disk is slower
+# Set 0 to write pages in the fetching thread
+WRITE_QUEUE_SIZE = 64
+
+# Layout of the fetched pages inside dump_html:
+#   'files' - a plain text file per page: <subfolder>/<XX>/<Name>
+#   'objects' - content-addressed blobs: objects/<hash[:2]>/<hash>
+#       and a <page name, blob> manifest per subfolder
+# Unchanged pages are not rewritten in both layouts
+DUMP_STORAGE = 'files'
+
+# Compression of the blobs in the 'objects' layout: None or 'gzip'
+DUMP_COMPRESSION = None
+
+# URL lists are saved as JSON lines: url_list_<subfolder>.jsonl
+# Set True to also write them into dump_html/__init__.py
+#   (URL_LIST and EVENT_URL_LIST), like the older versions did
+DUMP_URL_LIST_PY = False
+
 FUNCTION_SUBFOLDER = 'functions'
 
 # What function will be the start point.
 # (ListType.SERVER, 'setMarkerType'), for example,
 #   will start from the setMarkerType function
 # Set None to start from the beginning
+# An interrupted crawl is resumed from the crawl journal
+#   (dump_html/journal_<subfolder>.jsonl) without this option
 FUNCTION_START_FROM = \
     None
 
@@ -53,6 +149,8 @@ EVENT_SUBFOLDER = 'events'
 # (ListType.SERVER, 'onMarkerHit'), for example,
 #   will start from the onMarkerHit event
 # Set None to start from the beginning
+# An interrupted crawl is resumed from the crawl journal
+#   (dump_html/journal_<subfolder>.jsonl) without this option
 EVENT_START_FROM = \
     None
 
@@ -0,0 +1,82 @@
+import threading
+from typing import Optional
+
+
+class AdaptiveBatchSize:
+    """
+    Amount of pages per a one API request.
+    Adapts to the server with additive increase / multiplicative decrease:
+    - the size is halved after a slow batch (longer than target_latency),
+      a large batch (more than max_payload bytes) or a server lag;
+    - the size grows by a quarter after a full batch, that was faster
+      than a half of target_latency and smaller than a half of max_payload.
+    Without target_latency and max_payload the size is fixed
+    """
+
+    def __init__(self,
+                 initial: int,
+                 minimum: int = 1,
+                 maximum: int = 50,
+                 target_latency: Optional[float] = None,
+                 max_payload: Optional[int] = None):
+        """
+        :param initial: Size of the first batch
+        :param minimum: Minimal size
+        :param maximum: Maximal size (the API title limit:
+         50, or 500 for accounts with the `apihighlimits` right)
+        :param target_latency: Response time (in seconds) of a one batch
+        :param max_payload: Response size (in bytes) of a one batch
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.target_latency = target_latency
+        self.max_payload = max_payload
+
+        self.lock = threading.Lock()
+        self.size = self.clamp(initial)
+
+    @staticmethod
+    def fixed(size: int) -> 'AdaptiveBatchSize':
+        return AdaptiveBatchSize(initial=size, minimum=size, maximum=size)
+
+    def clamp(self, size: int) -> int:
+        return min(self.maximum, max(self.minimum, size))
+
+    def get(self) -> int:
+        with self.lock:
+            return self.size
+
+    def shrink(self):
+        """
+        Halves the size (on the server lag or a slow batch)
+        """
+        with self.lock:
+            self.size = self.clamp(self.size // 2)
+
+    def observe(self, size: int, latency: float, payload: int):
+        """
+        Adapts the size to the finished batch
+        :param size: Amount of pages in the batch
+        :param latency: Response time (in seconds)
+        :param payload: Response size (in bytes)
+        """
+        is_slow = self.target_latency is not None \
+            and latency > self.target_latency
+        is_large = self.max_payload is not None \
+            and payload > self.max_payload
+        if is_slow or is_large:
+            self.shrink()
+            return
+
+        if self.target_latency is None and self.max_payload is None:
+            return
+
+        is_fast = self.target_latency is None \
+            or latency < self.target_latency / 2
+        is_small = self.max_payload is None \
+            or payload < self.max_payload / 2
+
+        with self.lock:
+            # The last batch of the pages can be incomplete
+            if is_fast and is_small and size >= self.size:
+                self.size = self.clamp(self.size + max(1, self.size // 4))
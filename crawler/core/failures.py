@@ -0,0 +1,50 @@
+import json
+import os
+from typing import Dict
+
+
+class FetchFailureReport:
+    """
+    Pages, that could not be fetched in the last crawl, with the reasons.
+    Stored next to the dump_html files.
+    There is no report, if all pages were fetched
+    """
+
+    FILE_NAME = 'failures_{subfolder}.json'
+
+    @staticmethod
+    def get_path(dump_folder: str, subfolder: str) -> str:
+        return os.path.join(dump_folder,
+                            FetchFailureReport.FILE_NAME.format(
+                                subfolder=subfolder))
+
+    @staticmethod
+    def load(dump_folder: str, subfolder: str) -> Dict[str, str]:
+        """
+        Loads the report
+        :return: Dictionary. Key is the page name, value is the reason.
+         Empty, if there is no report
+        """
+        path = FetchFailureReport.get_path(dump_folder, subfolder)
+        if not os.path.exists(path):
+            return dict()
+
+        with open(path, encoding='UTF-8') as file:
+            return json.load(file)
+
+    @staticmethod
+    def save(dump_folder: str, subfolder: str, failures: Dict[str, str]):
+        """
+        Saves the report. Removes the report, if there are no failures
+        """
+        path = FetchFailureReport.get_path(dump_folder, subfolder)
+        if not failures:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+
+        os.makedirs(dump_folder, exist_ok=True)
+        with open(path, 'w', encoding='UTF-8', newline='\n') as file:
+            json.dump({name: failures[name] for name in sorted(failures)},
+                      file, indent=2, ensure_ascii=False)
+            file.write('\n')
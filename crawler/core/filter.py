@@ -1,14 +1,31 @@
 import abc
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple, Set
+from typing import Optional, List, Tuple, Set, Dict
 
-from crawler.core.types import ListType, PageUrl
+from crawler.core.batching import AdaptiveBatchSize
+from crawler.core.http import HttpClient
+from crawler.core.storage import PageStorage
+from crawler.core.types import ListType, PageUrl, PageRevision
 
 
 @dataclass
 class Context:
     host_url: str
-    fetch_batch_size: int
+    # Pages per a one request (shared by all fetchers of the run)
+    fetch_batch_size: AdaptiveBatchSize
+    fetch_workers: int
+    # MediaWiki `maxlag` parameter. None to disable
+    fetch_maxlag: Optional[int]
+    incremental_fetch: bool
+
+    # Shared HTTP client
+    http: HttpClient
+
+    # Storage of the fetched pages
+    storage: PageStorage
+
+    # Write URL lists into dump_html/__init__.py too
+    url_list_py: bool
 
     function_subfolder: str
     fetch_start_from: Optional[Tuple[ListType, str]]
@@ -18,11 +35,28 @@ class Context:
     event_fetch_start_from: Optional[Tuple[ListType, str]]
     event_blacklist: Set[str]
 
+    # Skip pages committed into the crawl journal by the interrupted crawl
+    resume_fetch: bool = True
+
+    # Skip pages, that could not be fetched, instead of stopping the crawl
+    isolate_fetch_failures: bool = False
+
+    # Source of the function and event lists: `api` or `html`
+    list_source: str = 'html'
+
+    # Amount of fetched pages waiting for the background writer.
+    # 0 to write pages in the fetching thread
+    write_queue_size: int = 0
+
     url_list: List[PageUrl] = field(default_factory=list)
-    fetched: List[Tuple[PageUrl, str]] = field(default_factory=list)
+    # Fetched (and already saved) pages
+    fetched: List[PageUrl] = field(default_factory=list)
+    # <normalized page name, revision>
+    revisions: Dict[str, PageRevision] = field(default_factory=dict)
 
     event_url_list: List[PageUrl] = field(default_factory=list)
-    event_fetched: List[Tuple[PageUrl, str]] = field(default_factory=list)
+    event_fetched: List[PageUrl] = field(default_factory=list)
+    event_revisions: Dict[str, PageRevision] = field(default_factory=dict)
 
 
 class FilterAbstract(metaclass=abc.ABCMeta):
@@ -0,0 +1,96 @@
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from crawler.core.throttle import HostThrottle
+
+
+class HttpClient:
+    """
+    Shared HTTP client of the crawler.
+    Keeps connections alive in a pool, negotiates compressed responses
+    and retries failed requests with a backoff.
+    Requests to the host are paused for the `Retry-After` time,
+    if a response has the header
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self,
+                 timeout: float = 60,
+                 retries: int = 0,
+                 backoff_factor: float = 0,
+                 pool_size: int = 1,
+                 throttle: Optional[HostThrottle] = None):
+        """
+        :param timeout: Timeout (in seconds) of a one request
+        :param retries: Amount of retries for a failed request
+        :param backoff_factor: Delay between retries is
+         {backoff_factor} * (2 ** {retry number - 1}) seconds
+        :param pool_size: Amount of connections kept alive per host
+        :param throttle: Per host request limits
+        """
+        self.timeout = timeout
+        self.throttle = throttle or HostThrottle(max_connections=pool_size,
+                                                 interval=0)
+
+        retry = Retry(total=retries,
+                      backoff_factor=backoff_factor,
+                      status_forcelist=self.RETRY_STATUSES,
+                      allowed_methods=frozenset({'GET'}),
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size,
+                              pool_maxsize=pool_size,
+                              max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+        })
+
+    def get(self, url: str,
+            params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        Sends GET request
+        :param url: Request URL
+        :param params: Query string parameters
+        """
+        with self.throttle.acquire(url):
+            response = self.session.get(url, params=params,
+                                        timeout=self.timeout)
+
+        retry_after = self.get_retry_after(response)
+        if retry_after:
+            self.throttle.delay(url, retry_after)
+
+        response.raise_for_status()
+        return response
+
+    @staticmethod
+    def get_retry_after(response: requests.Response) -> Optional[float]:
+        """
+        :return: Value of the `Retry-After` header (in seconds).
+         None, if there is no header
+        """
+        value = response.headers.get('Retry-After')
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        # HTTP date
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max(0.0, date.timestamp() - time.time())
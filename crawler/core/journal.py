@@ -0,0 +1,105 @@
+import json
+import os
+from typing import Dict
+
+from crawler.core.types import PageRevision
+
+
+class CrawlJournal:
+    """
+    Write-ahead journal of the unfinished crawl.
+    Stored next to the dump_html files as JSON lines,
+    a line per committed batch: {"pages": {<page name>: <revision>}}.
+
+    A batch is committed after its pages are saved, so the pages
+    of all committed batches are in the dump. An interrupted crawl
+    skips them in the next run. The journal is removed, when the crawl
+    is finished (URL list and revisions are saved)
+    """
+
+    FILE_NAME = 'journal_{subfolder}.jsonl'
+
+    @staticmethod
+    def get_path(dump_folder: str, subfolder: str) -> str:
+        return os.path.join(dump_folder,
+                            CrawlJournal.FILE_NAME.format(subfolder=subfolder))
+
+    @staticmethod
+    def load(dump_folder: str, subfolder: str) -> Dict[str, PageRevision]:
+        """
+        Loads pages of the committed batches
+        :return: Dictionary. Key is the page name, value is the revision.
+         Empty, if there is no journal
+        """
+        path = CrawlJournal.get_path(dump_folder, subfolder)
+        if not os.path.exists(path):
+            return dict()
+
+        result = dict()
+        with open(path, encoding='UTF-8') as file:
+            for line in file:
+                try:
+                    pages = json.loads(line)['pages']
+                except ValueError:
+                    # The last line is incomplete, if the crawler
+                    #   was stopped while writing it
+                    continue
+
+                for name in pages:
+                    result[name] = PageRevision(**pages[name])
+
+        return result
+
+    @staticmethod
+    def write_batch(path: str, mode: str,
+                    revisions: Dict[str, PageRevision]):
+        """
+        Writes a batch line and flushes it to the disk
+        """
+        data = {
+            name: dict(revid=revisions[name].revid,
+                       timestamp=revisions[name].timestamp)
+            for name in revisions
+        }
+
+        with open(path, mode, encoding='UTF-8', newline='\n') as file:
+            file.write(json.dumps(dict(pages=data), ensure_ascii=False))
+            file.write('\n')
+            file.flush()
+            os.fsync(file.fileno())
+
+    @staticmethod
+    def start(dump_folder: str, subfolder: str,
+              revisions: Dict[str, PageRevision]):
+        """
+        Rewrites the journal with the pages committed in the previous runs
+        as one batch (an incomplete line is dropped).
+        Removes the journal, if there are no such pages
+        """
+        if not revisions:
+            CrawlJournal.remove(dump_folder, subfolder)
+            return
+
+        path = CrawlJournal.get_path(dump_folder, subfolder)
+        CrawlJournal.write_batch(path + '.tmp', 'w', revisions)
+        os.replace(path + '.tmp', path)
+
+    @staticmethod
+    def commit(dump_folder: str, subfolder: str,
+               revisions: Dict[str, PageRevision]):
+        """
+        Appends a batch of the saved pages
+        :param revisions: Revisions of the batch pages
+        """
+        os.makedirs(dump_folder, exist_ok=True)
+        CrawlJournal.write_batch(
+            CrawlJournal.get_path(dump_folder, subfolder), 'a', revisions)
+
+    @staticmethod
+    def remove(dump_folder: str, subfolder: str):
+        """
+        Removes the journal of the finished crawl
+        """
+        path = CrawlJournal.get_path(dump_folder, subfolder)
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,67 @@
+import json
+import os
+from typing import Dict
+
+from crawler.core.types import PageRevision
+
+
+class RevisionManifest:
+    """
+    Revisions of the cached pages.
+    Stored next to the dump_html files
+    """
+
+    FILE_NAME = 'revisions_{subfolder}.json'
+
+    @staticmethod
+    def get_path(dump_folder: str, subfolder: str) -> str:
+        return os.path.join(dump_folder,
+                            RevisionManifest.FILE_NAME.format(
+                                subfolder=subfolder))
+
+    @staticmethod
+    def load(dump_folder: str, subfolder: str) -> Dict[str, PageRevision]:
+        """
+        Loads revisions
+        :return: Dictionary. Key is the page name, value is the revision.
+         Empty, if there is no manifest
+        """
+        path = RevisionManifest.get_path(dump_folder, subfolder)
+        if not os.path.exists(path):
+            return dict()
+
+        with open(path, encoding='UTF-8') as file:
+            data = json.load(file)
+
+        return {
+            name: PageRevision(**data[name])
+            for name in data
+        }
+
+    @staticmethod
+    def save(dump_folder: str, subfolder: str,
+             revisions: Dict[str, PageRevision]):
+        """
+        Saves revisions
+        """
+        path = RevisionManifest.get_path(dump_folder, subfolder)
+        data = {
+            name: dict(revid=revisions[name].revid,
+                       timestamp=revisions[name].timestamp)
+            for name in sorted(revisions)
+        }
+
+        with open(path, 'w', encoding='UTF-8', newline='\n') as file:
+            json.dump(data, file, indent=2)
+            file.write('\n')
+
+    @staticmethod
+    def update(dump_folder: str, subfolder: str,
+               revisions: Dict[str, PageRevision]):
+        """
+        Updates stored revisions with the passed ones.
+        Keeps revisions of pages, which were not fetched in this run
+        """
+        stored = RevisionManifest.load(dump_folder, subfolder)
+        stored.update(revisions)
+        RevisionManifest.save(dump_folder, subfolder, stored)
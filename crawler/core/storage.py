@@ -0,0 +1,182 @@
+import gzip
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Set
+
+
+class PageStorageError(RuntimeError):
+    pass
+
+
+class PageStorage:
+    """
+    Stores fetched pages inside the dump folder.
+
+    Layouts:
+    - `files`: a plain text file per page,
+        <dump folder>/<subfolder>/<shard>/<Name>
+    - `objects`: content-addressed blobs,
+        <dump folder>/objects/<hash[:2]>/<hash>[.gz],
+        and a manifest <page name, blob path> per subfolder,
+        <dump folder>/manifest_<subfolder>.json
+
+    Unchanged pages are never rewritten
+    """
+
+    DUMP_FOLDER = 'dump_html'
+    OBJECTS_FOLDER = 'objects'
+    MANIFEST_FILE_NAME = 'manifest_{subfolder}.json'
+
+    MODES = {'files', 'objects'}
+    COMPRESSION_EXTENSIONS = {None: '', 'gzip': '.gz'}
+
+    def __init__(self,
+                 dump_folder: str = DUMP_FOLDER,
+                 mode: str = 'files',
+                 compression: Optional[str] = None):
+        """
+        :param dump_folder: Root folder of the dump
+        :param mode: `files` or `objects`
+        :param compression: Blob compression in the `objects` mode:
+         None or `gzip`
+        """
+        if mode not in self.MODES:
+            raise PageStorageError(f'Unknown storage mode "{mode}"')
+        if compression not in self.COMPRESSION_EXTENSIONS:
+            raise PageStorageError(f'Unknown compression "{compression}"')
+
+        self.dump_folder = dump_folder
+        self.mode = mode
+        self.compression = compression
+
+        self.created_folders: Set[str] = set()
+        # <subfolder, <page name, blob path relative to the dump folder>>
+        self.manifests: Dict[str, Dict[str, str]] = dict()
+
+    def make_folder(self, folder: str):
+        """
+        Creates a folder (with parents) once per run
+        """
+        if folder in self.created_folders:
+            return
+
+        os.makedirs(folder, exist_ok=True)
+        self.created_folders.add(folder)
+
+    @staticmethod
+    def read_file(path: str) -> str:
+        """
+        Reads a stored page (plain text file or a blob)
+        """
+        if path.endswith('.gz'):
+            with gzip.open(path, 'rt', encoding='UTF-8', newline='\n') as file:
+                return file.read()
+
+        with open(path, encoding='UTF-8', newline='\n') as file:
+            return file.read()
+
+    def write_file(self, path: str, text: str) -> bool:
+        """
+        Writes a plain text file, if the content has changed
+        :return: Is the file written
+        """
+        if os.path.exists(path) and self.read_file(path) == text:
+            return False
+
+        self.make_folder(os.path.dirname(path))
+        with open(path, 'w', encoding='UTF-8', newline='\n') as file:
+            file.write(text)
+
+        return True
+
+    @staticmethod
+    def get_manifest_path(dump_folder: str, subfolder: str) -> str:
+        return os.path.join(dump_folder,
+                            PageStorage.MANIFEST_FILE_NAME.format(
+                                subfolder=subfolder))
+
+    @staticmethod
+    def load_manifest(dump_folder: str, subfolder: str) -> \
+            Optional[Dict[str, str]]:
+        """
+        Loads a manifest of the `objects` storage
+        :return: Dictionary <page name, blob path relative to the dump
+         folder>. None, if there is no manifest
+        """
+        path = PageStorage.get_manifest_path(dump_folder, subfolder)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, encoding='UTF-8') as file:
+            return json.load(file)
+
+    def get_manifest(self, subfolder: str) -> Dict[str, str]:
+        if subfolder not in self.manifests:
+            self.manifests[subfolder] = self.load_manifest(
+                self.dump_folder, subfolder) or dict()
+
+        return self.manifests[subfolder]
+
+    def save_manifest(self, subfolder: str):
+        """
+        Saves a manifest of the `objects` storage
+        """
+        if self.mode != 'objects':
+            return
+
+        manifest = self.get_manifest(subfolder)
+        self.make_folder(self.dump_folder)
+
+        path = self.get_manifest_path(self.dump_folder, subfolder)
+        with open(path, 'w', encoding='UTF-8', newline='\n') as file:
+            json.dump({name: manifest[name] for name in sorted(manifest)},
+                      file, indent=2)
+            file.write('\n')
+
+    def write_object(self, subfolder: str, name: str, text: str) -> bool:
+        """
+        Writes a blob, if there is no blob with the same content
+        :return: Is the blob written
+        """
+        data = text.encode('UTF-8')
+        digest = hashlib.sha256(data).hexdigest()
+        relative_path = os.path.join(
+            self.OBJECTS_FOLDER,
+            digest[:2],
+            digest + self.COMPRESSION_EXTENSIONS[self.compression],
+        )
+
+        manifest = self.get_manifest(subfolder)
+        manifest[name] = relative_path.replace(os.sep, '/')
+
+        path = os.path.join(self.dump_folder, relative_path)
+        if os.path.exists(path):
+            return False
+
+        self.make_folder(os.path.dirname(path))
+        if self.compression == 'gzip':
+            data = gzip.compress(data, mtime=0)
+
+        with open(path, 'wb') as file:
+            file.write(data)
+
+        return True
+
+    def save(self, subfolder: str, shard: str, name: str, text: str) -> \
+            bool:
+        """
+        Saves a page
+        :param subfolder: Folder of the page kind (functions, events)
+        :param shard: Shard folder in the `files` mode
+        :param name: Page name
+        :param text: Page content
+        :return: Is anything written
+        """
+        if self.mode == 'objects':
+            return self.write_object(subfolder, name, text)
+
+        return self.write_file(
+            os.path.join(self.dump_folder, subfolder, shard, name),
+            text
+        )
@@ -0,0 +1,40 @@
+from crawler.core.batching import AdaptiveBatchSize
+
+
+def test_fixed_batch_size():
+    size = AdaptiveBatchSize.fixed(50)
+    size.observe(50, latency=100, payload=10 ** 9)
+    assert size.get() == 50
+
+    size.shrink()
+    assert size.get() == 50
+
+
+def test_adaptive_batch_size():
+    size = AdaptiveBatchSize(initial=8, maximum=10,
+                             target_latency=2, max_payload=1000)
+
+    size.observe(8, latency=0.5, payload=100)
+    assert size.get() == 10
+
+    # Limited by the maximum
+    size.observe(10, latency=0.5, payload=100)
+    assert size.get() == 10
+
+    size.observe(10, latency=3, payload=100)
+    assert size.get() == 5
+
+    size.observe(5, latency=0.5, payload=2000)
+    assert size.get() == 2
+
+    # Neither fast nor slow
+    size.observe(2, latency=1.5, payload=100)
+    assert size.get() == 2
+
+    # The last incomplete batch
+    size.observe(1, latency=0.5, payload=100)
+    assert size.get() == 2
+
+    size.shrink()
+    size.shrink()
+    assert size.get() == 1
@@ -0,0 +1,19 @@
+import requests
+
+from crawler.core.http import HttpClient
+
+
+def create_response(headers: dict) -> requests.Response:
+    response = requests.Response()
+    response.headers.update(headers)
+    return response
+
+
+def test_get_retry_after():
+    assert HttpClient.get_retry_after(create_response({})) is None
+    assert HttpClient.get_retry_after(
+        create_response({'Retry-After': '5'})) == 5
+    assert HttpClient.get_retry_after(create_response(
+        {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0
+    assert HttpClient.get_retry_after(
+        create_response({'Retry-After': 'soon'})) is None
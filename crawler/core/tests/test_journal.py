@@ -0,0 +1,27 @@
+from crawler.core.journal import CrawlJournal
+from crawler.core.types import PageRevision
+
+
+def test_crawl_journal(tmp_path):
+    folder = str(tmp_path)
+    assert CrawlJournal.load(folder, 'functions') == dict()
+
+    first = {'SetElementData': PageRevision(revid=1, timestamp='t1')}
+    second = {'GetElementData': PageRevision(revid=2, timestamp='t2')}
+    CrawlJournal.commit(folder, 'functions', first)
+    CrawlJournal.commit(folder, 'functions', second)
+
+    # Batch line is not finished
+    with open(CrawlJournal.get_path(folder, 'functions'), 'a') as file:
+        file.write('{"pages": {"GetPe')
+
+    committed = CrawlJournal.load(folder, 'functions')
+    assert committed == {**first, **second}
+
+    CrawlJournal.start(folder, 'functions', committed)
+    third = {'GetPedArmor': PageRevision(revid=3, timestamp='t3')}
+    CrawlJournal.commit(folder, 'functions', third)
+    assert CrawlJournal.load(folder, 'functions') == {**committed, **third}
+
+    CrawlJournal.remove(folder, 'functions')
+    assert CrawlJournal.load(folder, 'functions') == dict()
@@ -0,0 +1,20 @@
+from crawler.core.types import PageUrl, ListType
+from crawler.core.url_index import UrlIndex
+
+
+def test_url_index_round_trip(tmp_path):
+    url_list = [
+        PageUrl(url='/wiki/SetElementPosition',
+                name='setElementPosition',
+                category='Element functions',
+                type=ListType.SERVER),
+        PageUrl(url='/wiki/OnClientRender',
+                name='onClientRender',
+                category='Client event "Ñ"',
+                type=ListType.CLIENT),
+    ]
+
+    UrlIndex.save(str(tmp_path), 'functions', url_list)
+
+    assert UrlIndex.load(str(tmp_path), 'functions') == url_list
+    assert UrlIndex.load(str(tmp_path), 'events') is None
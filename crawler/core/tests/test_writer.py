@@ -0,0 +1,39 @@
+import threading
+
+import pytest
+
+from crawler.core.writer import PageWriter, PageWriterError
+
+
+@pytest.mark.parametrize('queue_size', [0, 2])
+def test_page_writer_order(queue_size):
+    written = []
+    with PageWriter(queue_size) as writer:
+        for i in range(10):
+            writer.submit(written.append, i)
+
+    assert written == list(range(10))
+
+
+def test_page_writer_error():
+    written = []
+    started = threading.Event()
+
+    def fail():
+        raise OSError('disk is full')
+
+    writer = PageWriter(2)
+    # Tasks are waiting, until all of them are submitted
+    writer.submit(started.wait)
+    writer.submit(fail)
+    writer.submit(written.append, 1)
+    started.set()
+
+    with pytest.raises(PageWriterError):
+        writer.close()
+
+    # Tasks after the failed one are skipped
+    assert written == []
+
+    with pytest.raises(PageWriterError):
+        writer.submit(written.append, 2)
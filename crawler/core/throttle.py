@@ -0,0 +1,78 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+class HostState:
+    """
+    Request limits state of a single host
+    """
+
+    def __init__(self, max_connections: int):
+        self.semaphore = threading.Semaphore(max_connections)
+
+        # Time (time.monotonic) of the next allowed request
+        self.next_request = 0.0
+
+
+class HostThrottle:
+    """
+    Politeness limits for HTTP requests.
+    Limits the amount of simultaneous requests and the request rate per host
+    """
+
+    def __init__(self, max_connections: int, interval: float):
+        """
+        :param max_connections: Maximum amount of simultaneous requests
+         to a one host
+        :param interval: Minimal interval (in seconds) between two requests
+         to a one host
+        """
+        self.max_connections = max(1, max_connections)
+        self.interval = interval
+
+        self.lock = threading.Lock()
+        self.hosts: Dict[str, HostState] = dict()
+
+    def get_host_state(self, host: str) -> HostState:
+        with self.lock:
+            if host not in self.hosts:
+                self.hosts[host] = HostState(self.max_connections)
+
+            return self.hosts[host]
+
+    def wait_turn(self, state: HostState):
+        """
+        Sleeps until the request interval has passed
+        """
+        with self.lock:
+            now = time.monotonic()
+            start_at = max(now, state.next_request)
+            state.next_request = start_at + self.interval
+
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def delay(self, url: str, seconds: float):
+        """
+        Delays the next requests to the URL host
+        (the server asked to retry later)
+        """
+        state = self.get_host_state(urlsplit(url).netloc)
+
+        with self.lock:
+            state.next_request = max(state.next_request,
+                                     time.monotonic() + seconds)
+
+    @contextmanager
+    def acquire(self, url: str):
+        """
+        Blocks until a request to the URL host is allowed
+        """
+        state = self.get_host_state(urlsplit(url).netloc)
+
+        with state.semaphore:
+            self.wait_turn(state)
+            yield
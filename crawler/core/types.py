@@ -24,6 +24,22 @@ class PageUrl:
         from crawler.config import HOST_URL
         return f'{HOST_URL}{self.url}'
 
+    def to_dict(self) -> dict:
+        return dict(url=self.url,
+                    name=self.name,
+                    category=self.category,
+                    type=self.type.value)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'PageUrl':
+        """
+        Creates URL from the dictionary, made by the `to_dict` method
+        """
+        return PageUrl(url=data['url'],
+                       name=data['name'],
+                       category=data['category'],
+                       type=ListType(data['type']))
+
     def __repr__(self):
         return f'''PageUrl(
         url="{self.url}",
@@ -31,3 +47,20 @@ class PageUrl:
         category="{self.category}",
         type={repr(self.type)},
     )'''
+
+
+@dataclass
+class PageRevision:
+    """
+    Describes the revision of the MTASA Wiki page
+    """
+    revid: int
+    timestamp: str
+
+    @staticmethod
+    def from_api(revision: dict) -> 'PageRevision':
+        """
+        Creates revision from the MediaWiki API revision object
+        """
+        return PageRevision(revid=revision['revid'],
+                            timestamp=revision['timestamp'])
@@ -0,0 +1,49 @@
+import json
+import os
+from typing import List, Optional
+
+from crawler.core.types import PageUrl
+
+
+class UrlIndex:
+    """
+    Index of the fetched page URLs.
+    Stored next to the dump_html files as JSON lines, one PageUrl per line.
+    Loaded without compiling a Python module
+    """
+
+    FILE_NAME = 'url_list_{subfolder}.jsonl'
+
+    @staticmethod
+    def get_path(dump_folder: str, subfolder: str) -> str:
+        return os.path.join(dump_folder,
+                            UrlIndex.FILE_NAME.format(subfolder=subfolder))
+
+    @staticmethod
+    def load(dump_folder: str, subfolder: str) -> Optional[List[PageUrl]]:
+        """
+        Loads URL list
+        :return: List of URLs. None, if there is no index
+        """
+        path = UrlIndex.get_path(dump_folder, subfolder)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, encoding='UTF-8') as file:
+            return [
+                PageUrl.from_dict(json.loads(line))
+                for line in file
+                if line.strip()
+            ]
+
+    @staticmethod
+    def save(dump_folder: str, subfolder: str, url_list: List[PageUrl]):
+        """
+        Saves URL list
+        """
+        path = UrlIndex.get_path(dump_folder, subfolder)
+
+        with open(path, 'w', encoding='UTF-8', newline='\n') as file:
+            for url in url_list:
+                file.write(json.dumps(url.to_dict(), ensure_ascii=False))
+                file.write('\n')
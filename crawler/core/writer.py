@@ -0,0 +1,87 @@
+from queue import Queue
+from threading import Thread
+from typing import Callable, Optional
+
+
+class PageWriterError(RuntimeError):
+    pass
+
+
+class PageWriter:
+    """
+    Runs disk writes (pages, manifests, journal commits) in a background
+    thread, so they overlap with fetching. Tasks are run in the submit
+    order. The queue is bounded: fetching waits for the writer, if the
+    writer falls behind, so only queue_size pages are kept in memory.
+    Tasks submitted after a failed task are skipped,
+    the error is raised by the next submit or by close
+    """
+
+    def __init__(self, queue_size: int):
+        """
+        :param queue_size: Maximum amount of the waiting tasks.
+         0 to run tasks in the calling thread
+        """
+        self.error: Optional[BaseException] = None
+        self.thread: Optional[Thread] = None
+
+        if queue_size > 0:
+            self.queue = Queue(maxsize=queue_size)
+            self.thread = Thread(target=self.run, name='PageWriter',
+                                 daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            task = self.queue.get()
+            if task is None:
+                return
+
+            if self.error is not None:
+                continue
+
+            func, args = task
+            try:
+                func(*args)
+            except BaseException as e:
+                self.error = e
+
+    def raise_error(self):
+        if self.error is not None:
+            raise PageWriterError(
+                f'Background write failed: {self.error}') from self.error
+
+    def submit(self, func: Callable, *args):
+        self.raise_error()
+
+        if self.thread is None:
+            func(*args)
+            return
+
+        self.queue.put((func, args))
+
+    def close(self):
+        """
+        Waits for all submitted tasks
+        """
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+        self.raise_error()
+
+    def __enter__(self) -> 'PageWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+            return
+
+        # Pages fetched before the error are still written and committed.
+        #   The original error is more important than the write error
+        try:
+            self.close()
+        except PageWriterError:
+            pass
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional
 
 from bs4 import Tag
 
@@ -12,6 +12,10 @@ class FunctionListParseError(RuntimeError):
 
 
 class FilterFetchEventList(FilterFetchList):
+    PAGE_MAP = {
+        ListType.CLIENT: 'Client_Scripting_Events',
+        ListType.SERVER: 'Server_Scripting_Events',
+    }
     URL_MAP = {
         ListType.CLIENT: f'{HOST_URL}/wiki/Client_Scripting_Events',
         ListType.SERVER: f'{HOST_URL}/wiki/Server_Scripting_Events',
@@ -35,15 +39,6 @@ class FilterFetchEventList(FilterFetchList):
                            category=self.current_item_category,
                            type=self.list_type)
 
-    def download_list(self) -> List[PageUrl]:
-        categorized_links = self.download_list_tags()
-
-        result: List[PageUrl] = [self.process_list_item(tag) for tag in
-                                 categorized_links]
-        result = list(filter(lambda v: v is not None, result))
-
-        return result
-
     def apply(self):
         result = self.download_list()
         self.context.event_url_list.extend(result)
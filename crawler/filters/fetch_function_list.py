@@ -1,4 +1,6 @@
+import re
 from typing import List, Optional
+from urllib.parse import quote
 
 import requests
 from bs4 import BeautifulSoup, Tag
@@ -13,11 +15,29 @@ class FunctionListParseError(RuntimeError):
 
 
 class FilterFetchList(FilterAbstract):
+    """
+    Fetches the function list.
+    The `api` list source reads the list page wikitext (with expanded
+    templates) by the MediaWiki API: categories are the level 2 headers,
+    functions are links in the list items.
+    The `html` source parses the rendered page.
+    The `html` source is used, if the `api` source fails
+    """
+
+    PAGE_MAP = {
+        ListType.CLIENT: 'Client_Scripting_Functions',
+        ListType.SERVER: 'Server_Scripting_Functions',
+    }
     URL_MAP = {
         ListType.CLIENT: f'{HOST_URL}/wiki/Client_Scripting_Functions',
         ListType.SERVER: f'{HOST_URL}/wiki/Server_Scripting_Functions',
     }
 
+    HEADER_REGEX = re.compile(r'^==([^=].*?)==$')
+    # [[Title]] or [[Title|Label]]
+    LINK_REGEX = re.compile(r'\[\[([^\[\]|]+)(?:\|([^\[\]]*))?]]')
+    BOLD_ITALIC_REGEX = re.compile(r"'{2,}")
+
     list_type: ListType
 
     current_item_category: Optional[str] = None
@@ -46,7 +66,7 @@ class FilterFetchList(FilterAbstract):
         Download and parse byb BeautifulSoup
         :return: Tag list
         """
-        req = requests.request('GET', url=self.URL_MAP[self.list_type])
+        req = self.context.http.get(self.URL_MAP[self.list_type])
         html = req.text
         soup_list = BeautifulSoup(html, 'html.parser')
         soup_list.select_one('#toc').extract()  # Remove Table Of Content
@@ -54,7 +74,7 @@ class FilterFetchList(FilterAbstract):
         container = soup_list.select_one('#mw-content-text')
         return container.select('ul a, h2')
 
-    def download_list(self) -> List[PageUrl]:
+    def download_list_html(self) -> List[PageUrl]:
         categorized_links = self.download_list_tags()
 
         result: List[PageUrl] = [self.process_list_item(tag) for tag in
@@ -63,6 +83,104 @@ class FilterFetchList(FilterAbstract):
 
         return result
 
+    def download_list_wikitext(self) -> str:
+        """
+        Downloads the list page wikitext with expanded templates.
+        The page is transcluded, so it is read and expanded
+        by a one request
+        """
+        api_url = f'{self.context.host_url}/api.php'
+        title = self.PAGE_MAP[self.list_type]
+
+        data = self.context.http.get(api_url, params=dict(
+            action='expandtemplates',
+            title=title,
+            text=f'{{{{:{title}}}}}',
+            prop='wikitext',
+            format='json',
+        )).json()
+        text = data['expandtemplates']['wikitext']
+
+        # Transclusion of a missing page is expanded into a link to it
+        if text.strip() == f'[[:{title}]]':
+            raise FunctionListParseError(f'Page "{title}" not found')
+
+        return text
+
+    @staticmethod
+    def get_page_url(title: str) -> str:
+        """
+        :return: Page path, like in the rendered links (/wiki/Title)
+        """
+        title = title.strip().replace(' ', '_')
+        title = title[0].upper() + title[1:]
+        return f'/wiki/{quote(title, safe=";@$!*(),/~:")}'
+
+    @staticmethod
+    def clean_header(text: str) -> str:
+        """
+        Removes wiki markup from the header text
+        """
+        text = FilterFetchList.LINK_REGEX.sub(
+            lambda m: m.group(2) or m.group(1), text)
+        text = FilterFetchList.BOLD_ITALIC_REGEX.sub('', text)
+
+        return text.strip()
+
+    def parse_list_wikitext(self, text: str) -> List[PageUrl]:
+        """
+        Parses links in the list items, categorized by level 2 headers
+        """
+        category = None
+        result = []
+
+        for line in text.split('\n'):
+            line = line.strip()
+
+            header = self.HEADER_REGEX.match(line)
+            if header:
+                category = self.clean_header(header.group(1))
+                continue
+
+            if not line.startswith('*'):
+                continue
+
+            for link in self.LINK_REGEX.finditer(line):
+                title = link.group(1).strip()
+                # Files, categories and other namespaces
+                if ':' in title or title.startswith('#'):
+                    continue
+
+                if category is None:
+                    raise FunctionListParseError(
+                        'First category is not specified')
+
+                result.append(PageUrl(url=self.get_page_url(title),
+                                      name=(link.group(2) or title).strip(),
+                                      category=category,
+                                      type=self.list_type))
+
+        return result
+
+    def download_list_api(self) -> List[PageUrl]:
+        return self.parse_list_wikitext(self.download_list_wikitext())
+
+    def download_list(self) -> List[PageUrl]:
+        if self.context.list_source == 'api':
+            try:
+                result = self.download_list_api()
+                if result:
+                    return result
+
+                print('\u001b[33mThe API list is empty\u001b[0m. '
+                      'The list page HTML will be parsed')
+            except (requests.RequestException, ValueError, KeyError,
+                    FunctionListParseError) as e:
+                print(f'\u001b[33mCannot get the list by the API: '
+                      f'{e}\u001b[0m. The list page HTML will be parsed')
+
+        return self.download_list_html()
+
     def apply(self):
         result = self.download_list()
         self.context.url_list.extend(result)
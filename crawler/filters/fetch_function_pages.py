@@ -1,82 +1,322 @@
-from typing import List, Dict, Any, Tuple, Generator, Collection, Optional
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Generator, Collection, \
+    Optional, Callable, Iterable, Union
 
 import requests
 
+from crawler.core.batching import AdaptiveBatchSize
+from crawler.core.failures import FetchFailureReport
 from crawler.core.filter import FilterAbstract
-from crawler.core.types import PageUrl, ListType
+from crawler.core.http import HttpClient
+from crawler.core.journal import CrawlJournal
+from crawler.core.revisions import RevisionManifest
+from crawler.core.storage import PageStorage
+from crawler.core.types import PageUrl, ListType, PageRevision
+from crawler.core.writer import PageWriter
 
 
 class WikiPageFetchError(RuntimeError):
     pass
 
 
+class WikiServerLagError(WikiPageFetchError):
+    pass
+
+
 class WikiPageFetcher():
     """
     Fetches MTASA Wiki pages
     """
 
-    def __init__(self, pages: List[str], host: str, batch_size=16):
+    # Retries of a batch, refused because of the server lag
+    MAXLAG_RETRIES = 10
+    # Delay (in seconds) after the server lag, if there is no Retry-After
+    MAXLAG_DELAY = 5
+
+    # Errors of a batch request, that can be caused by a one page.
+    #   Connection errors and the server lag are not
+    BATCH_ERRORS = (WikiPageFetchError, requests.HTTPError,
+                    ValueError, KeyError)
+    # HTTP statuses of an overloaded server. A batch is not split,
+    #   the crawl is stopped to be resumed later
+    OVERLOAD_STATUSES = (429, 503)
+
+    def __init__(self, pages: List[str], host: str,
+                 batch_size: Union[int, AdaptiveBatchSize] = 16,
+                 workers=1, http: Optional[HttpClient] = None,
+                 maxlag: Optional[int] = None,
+                 isolate_failures: bool = False):
         """
         :param pages: URL list
         :param host: Host URL
         :param batch_size: Amount of pages will be received per one request
+         (fixed or adaptive)
+        :param workers: Amount of batches will be fetched concurrently
+        :param http: HTTP client
+        :param maxlag: MediaWiki `maxlag` parameter (in seconds).
+         None to send requests regardless of the server lag
+        :param isolate_failures: Skip missing pages and bisect failed
+         batches, instead of raising the error.
+         Skipped pages are put into self.failures
         """
         super().__init__()
 
         self.pages = pages
         self.host = host
-        self.batch_size = batch_size
+        self.batch_size = AdaptiveBatchSize.fixed(batch_size) \
+            if isinstance(batch_size, int) else batch_size
+        self.workers = max(1, workers)
+        self.http = http or HttpClient(pool_size=self.workers)
+        self.maxlag = maxlag
+        self.isolate_failures = isolate_failures
+
+        # Revisions of the fetched pages
+        self.revisions: Dict[str, PageRevision] = dict()
+        # <page name, reason> of the pages, that could not be fetched
+        self.failures: Dict[str, str] = dict()
 
     @staticmethod
     def normalize_page_name(name: str) -> str:
         return name[0].upper() + name[1:]
 
-    def fetch_batch(self, batch: List[str]) -> Dict[str, str]:
+    def request_batch(self, batch: List[str],
+                      rvprop: str) -> Tuple[dict, int]:
         """
-        Fetches a batch of the urls
-        :return: Dictionary: Key is the URL, value is the content of the page
+        Requests the last revisions of a batch of the urls.
+        Retries the request, if it is refused because of the server lag
+        :return: Decoded response and its size (in bytes)
         """
-        query_titles = '|'.join(batch)
-        url = f'{self.host}/api.php?' \
-              f'action=query&' \
-              f'prop=revisions&' \
-              f'titles={query_titles}&' \
-              f'rvslots=*&' \
-              f'rvprop=content&' \
-              f'format=json'
-
-        req = requests.request('GET', url)
-        data = req.json()
+        url = f'{self.host}/api.php'
+        params = dict(
+            action='query',
+            prop='revisions',
+            titles='|'.join(batch),
+            rvslots='*',
+            rvprop=rvprop,
+            format='json',
+        )
+        if self.maxlag is not None:
+            params['maxlag'] = self.maxlag
+
+        for retry in range(self.MAXLAG_RETRIES + 1):
+            req = self.http.get(url, params=params)
+            data = req.json()
+            error = data.get('error')
+            if error is None:
+                return data, len(req.content)
+
+            if error.get('code') != 'maxlag':
+                raise WikiPageFetchError(
+                    f'API error "{error.get("code")}": {error.get("info")}')
+            if retry == self.MAXLAG_RETRIES:
+                raise WikiServerLagError(
+                    f'Server lag: {error.get("info")}')
+
+            # HttpClient delays requests by Retry-After
+            if self.http.get_retry_after(req) is None:
+                self.http.throttle.delay(url, self.MAXLAG_DELAY)
+            self.batch_size.shrink()
+
+            print(f'Server lag: {error.get("info")}. '
+                  f'Retry [{retry + 1}/{self.MAXLAG_RETRIES}]')
+
+    def query_batch(self, batch: List[str], rvprop: str,
+                    adapt_batch_size: bool = False) -> Dict[str, dict]:
+        """
+        Queries the last revisions of a batch of the urls
+        :param rvprop: Revision properties to be received
+        :param adapt_batch_size: Adapt the batch size
+         to the response time and size
+        :return: Dictionary: Key is the URL, value is the revision object
+        """
+        # Response.elapsed stops at the headers, the body download
+        #   is included here (the response is not streamed)
+        start = time.perf_counter()
+        data, payload = self.request_batch(batch, rvprop)
+        if adapt_batch_size:
+            self.batch_size.observe(len(batch),
+                                    time.perf_counter() - start,
+                                    payload)
+
         query = data['query']
         pages = query['pages']
 
         result = dict()
         for key in pages:
             page: dict = pages[key]
-            if 'missing' in page:
-                raise WikiPageFetchError(f'Page "{page["title"]}" not found')
+            if 'missing' in page or 'invalid' in page:
+                reason = 'not found' if 'missing' in page \
+                    else f'invalid title: {page.get("invalidreason")}'
+                if not self.isolate_failures:
+                    raise WikiPageFetchError(
+                        f'Page "{page["title"]}" {reason}')
+
+                self.failures[self.normalize_page_name(page['title'])] = \
+                    reason
+                continue
 
             revisions = page["revisions"]
-            slots = revisions[0]["slots"]
+            result[page["title"]] = revisions[0]
+
+        return result
+
+    def fetch_batch(self, batch: List[str]) -> Dict[str, str]:
+        """
+        Fetches a batch of the urls.
+        Saves revisions of the fetched pages into self.revisions
+        :return: Dictionary: Key is the URL, value is the content of the page
+        """
+        revisions = self.query_batch(batch, 'content|ids|timestamp',
+                                     adapt_batch_size=True)
+
+        result = dict()
+        for title in revisions:
+            revision = revisions[title]
+            slots = revision["slots"]
             main_slot = slots["main"]
             content = main_slot["*"]
 
-            result[page["title"]] = content + '\n'
+            self.revisions[title] = PageRevision.from_api(revision)
+            result[title] = content + '\n'
 
         return result
 
-    def fetch(self) -> Generator[Tuple[str, str], Any, None]:
+    def fetch_revisions_batch(self, batch: List[str]) -> \
+            Dict[str, PageRevision]:
+        """
+        Fetches revisions (without content) of a batch of the urls
+        :return: Dictionary: Key is the URL, value is the revision
+        """
+        revisions = self.query_batch(batch, 'ids|timestamp')
+        return {
+            title: PageRevision.from_api(revisions[title])
+            for title in revisions
+        }
+
+    @staticmethod
+    def describe_error(error: Exception) -> str:
+        # HTTP error messages contain the whole URL with all titles
+        if isinstance(error, requests.HTTPError) \
+                and error.response is not None:
+            return f'HTTP {error.response.status_code} ' \
+                   f'{error.response.reason}'
+
+        return f'{type(error).__name__}: {error}'
+
+    def is_overload_error(self, error: Exception) -> bool:
+        return isinstance(error, requests.HTTPError) \
+            and error.response is not None \
+            and error.response.status_code in self.OVERLOAD_STATUSES
+
+    def isolate(self, fetch_batch: Callable[[List[str]], Dict[str, Any]]) \
+            -> Callable[[List[str]], Dict[str, Any]]:
+        """
+        Wraps the batch fetching function (in the failure isolation mode).
+        A failed batch is split into halves, until the failed pages
+        are found. Results of other pages are kept,
+        failed pages are put into self.failures.
+        Server lag and overload (HTTP 429, 503) errors stop the crawl
+        """
+        if not self.isolate_failures:
+            return fetch_batch
+
+        def fetch(batch: List[str]) -> Dict[str, Any]:
+            try:
+                return fetch_batch(batch)
+            except WikiServerLagError:
+                raise
+            except self.BATCH_ERRORS as e:
+                if self.is_overload_error(e):
+                    raise
+
+                reason = self.describe_error(e)
+                if len(batch) == 1:
+                    self.failures[self.normalize_page_name(batch[0])] = reason
+                    return dict()
+
+                print(f'Batch of {len(batch)} pages failed ({reason}). '
+                      f'Splitting the batch')
+                middle = len(batch) // 2
+                return {**fetch(batch[:middle]), **fetch(batch[middle:])}
+
+        return fetch
+
+    def fetch_batches(self,
+                      batches: Iterable[List[str]],
+                      fetch_batch: Callable[[List[str]], Dict[str, Any]]) \
+            -> Generator[Dict[str, Any], Any, None]:
+        """
+        Fetches batches in the worker pool.
+        Keeps at most 2 * workers batches in flight.
+        Batches are taken from the iterable, when they are sent
+        :param fetch_batch: Function fetching a single batch
+        :return: Batch results in the order of the passed batches
+        """
+        if self.workers == 1:
+            yield from map(fetch_batch, batches)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            in_flight = deque()
+            for batch in batches:
+                in_flight.append(executor.submit(fetch_batch, batch))
+
+                if len(in_flight) >= 2 * self.workers:
+                    yield in_flight.popleft().result()
+
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    def get_batches(self) -> Generator[List[str], Any, None]:
+        """
+        Splits pages into batches. The size of a batch is taken,
+        when the batch is requested, so it follows the adapted size
+        """
+        start = 0
+        while start < len(self.pages):
+            size = self.batch_size.get()
+            yield self.pages[start:start + size]
+            start += size
+
+    def get_revision_batches(self) -> List[List[str]]:
+        """
+        Splits pages into batches of the maximal size
+        (revisions without content are small)
+        """
+        size = self.batch_size.maximum
+        return [self.pages[x:x + size] for x in
+                range(0, len(self.pages), size)]
+
+    def fetch_by_batch(self) -> Generator[Dict[str, str], Any, None]:
         """
         Fetches all passed pages
+        :return: Batch results (see fetch_batch) in the pages order
         """
-        batches = [self.pages[x:x + self.batch_size] for x in
-                   range(0, len(self.pages), self.batch_size)]
-        for batch in batches:
-            result = self.fetch_batch(batch)
+        yield from self.fetch_batches(self.get_batches(),
+                                      self.isolate(self.fetch_batch))
 
+    def fetch(self) -> Generator[Tuple[str, str], Any, None]:
+        """
+        Fetches all passed pages
+        """
+        for result in self.fetch_by_batch():
             for key in result:
                 yield key, result[key]
 
+    def fetch_revisions(self) -> Dict[str, PageRevision]:
+        """
+        Fetches the current revisions of all passed pages
+        """
+        result = dict()
+        for revisions in self.fetch_batches(
+                self.get_revision_batches(),
+                self.isolate(self.fetch_revisions_batch)):
+            result.update(revisions)
+
+        return result
+
 
 class FilterFetchFunctionsError(RuntimeError):
     pass
@@ -124,6 +364,168 @@ class FilterFetchFunctions(FilterAbstract):
 
         return result
 
+    def create_fetcher(self, pages: List[str]) -> WikiPageFetcher:
+        """
+        Creates page fetcher configured by the context
+        """
+        return WikiPageFetcher(
+            pages,
+            self.context.host_url,
+            self.context.fetch_batch_size,
+            workers=self.context.fetch_workers,
+            http=self.context.http,
+            maxlag=self.context.fetch_maxlag,
+            isolate_failures=self.context.isolate_fetch_failures,
+        )
+
+    def select_changed_pages(self, fetcher: WikiPageFetcher,
+                             subfolder: str,
+                             revisions: Dict[str, PageRevision]):
+        """
+        Leaves in the fetcher only pages changed since the last crawl.
+        Puts stored revisions of unchanged pages into the revisions
+        :param fetcher: Fetcher with all pages to be fetched
+        :param subfolder: Subdirectory with the cached pages
+        :param revisions: Output revisions dictionary
+        """
+        stored = RevisionManifest.load(PageStorage.DUMP_FOLDER, subfolder)
+        if not stored:
+            print('No stored revisions. All pages will be fetched')
+            return
+
+        current = fetcher.fetch_revisions()
+
+        changed = []
+        for name in fetcher.pages:
+            if name in stored and name in current \
+                    and stored[name].revid == current[name].revid:
+                revisions[name] = stored[name]
+                continue
+
+            changed.append(name)
+
+        print(
+            f'Unchanged pages: \u001b[34m'
+            f'{len(fetcher.pages) - len(changed)}\u001b[0m, '
+            f'changed pages: \u001b[34m{len(changed)}\u001b[0m'
+        )
+        fetcher.pages = changed
+
+    @staticmethod
+    def get_shard(url: PageUrl) -> str:
+        """
+        :return: Shard subdirectory of the page
+        """
+        return url.name[:2].upper()
+
+    def save_page(self, url: PageUrl, content: str, subfolder: str):
+        """
+        Saves a fetched page into the page storage
+        """
+        name = WikiPageFetcher.normalize_page_name(url.name)
+        if self.context.storage.save(subfolder, self.get_shard(url), name,
+                                     content):
+            print(f'Saved "{url.name}", {url.type.name}')
+        else:
+            print(f'Unchanged "{url.name}", {url.type.name}')
+
+    def resume(self, url_dict: Dict[str, PageUrl], subfolder: str,
+               revisions: Dict[str, PageRevision]):
+        """
+        Removes pages of the batches committed by the interrupted crawl
+        from the url_dict. Puts their revisions into the revisions
+        """
+        committed = dict()
+        if self.context.resume_fetch:
+            committed = CrawlJournal.load(PageStorage.DUMP_FOLDER, subfolder)
+        CrawlJournal.start(PageStorage.DUMP_FOLDER, subfolder, committed)
+
+        if not committed:
+            return
+
+        resumed = [name for name in url_dict if name in committed]
+        for name in resumed:
+            url_dict.pop(name)
+            revisions[name] = committed[name]
+
+        print(
+            f'Resumed the interrupted crawl, already fetched pages: '
+            f'\u001b[34m{len(resumed)}\u001b[0m'
+        )
+
+    def fetch_pages(self,
+                    url_dict: Dict[str, PageUrl],
+                    subfolder: str,
+                    revisions: Dict[str, PageRevision]) -> \
+            Generator[PageUrl, Any, None]:
+        """
+        Fetches pages and saves them batch by batch
+        (in the background writer, see context.write_queue_size).
+        Every saved batch is committed into the crawl journal.
+        Fetches only changed pages in the incremental mode
+        :param url_dict: Pages to be fetched
+        :param subfolder: Subdirectory with the cached pages
+        :param revisions: Output dictionary with revisions of the pages
+        :return: Fetched pages
+        """
+        self.resume(url_dict, subfolder, revisions)
+
+        fetcher = self.create_fetcher(list(url_dict.keys()))
+        if self.context.incremental_fetch:
+            self.select_changed_pages(fetcher, subfolder, revisions)
+
+        counter = 0
+        with PageWriter(self.context.write_queue_size) as writer:
+            for result in fetcher.fetch_by_batch():
+                for name in result:
+                    if name not in url_dict:
+                        raise FilterFetchFunctionsError(
+                            f'Not found key {name} in url_dict. '
+                            f'Have you normalized the URL names?'
+                        )
+
+                    url_object = url_dict[name]
+                    counter += 1
+
+                    print(
+                        f'Fetched [{counter}/{len(fetcher.pages)}] '
+                        f'"{url_object.name}", '
+                        f'{url_object.type.name}'
+                    )
+
+                    writer.submit(self.save_page,
+                                  url_object, result[name], subfolder)
+                    yield url_object
+
+                # Pages of the batch should be found in the manifest
+                #   before the batch is committed
+                writer.submit(self.context.storage.save_manifest, subfolder)
+                writer.submit(CrawlJournal.commit,
+                              PageStorage.DUMP_FOLDER, subfolder, {
+                                  name: fetcher.revisions[name]
+                                  for name in result
+                              })
+
+        revisions.update(fetcher.revisions)
+        self.save_failures(fetcher, subfolder)
+
+    def save_failures(self, fetcher: WikiPageFetcher, subfolder: str):
+        """
+        Saves the report of the pages, that could not be fetched
+        """
+        dump_folder = PageStorage.DUMP_FOLDER
+        FetchFailureReport.save(dump_folder, subfolder, fetcher.failures)
+        if not fetcher.failures:
+            return
+
+        print(
+            f'\u001b[33mNot fetched pages: '
+            f'{len(fetcher.failures)}\u001b[0m. See '
+            f'{FetchFailureReport.get_path(dump_folder, subfolder)}'
+        )
+        for name in sorted(fetcher.failures):
+            print(f'    "{name}": {fetcher.failures[name]}')
+
     def apply(self):
         print('Functions fetch began')
 
@@ -132,27 +534,9 @@ class FilterFetchFunctions(FilterAbstract):
             blacklist=self.context.blacklist,
             start_from=self.context.fetch_start_from,
         )
-        keys = list(url_dict.keys())
-
-        counter = 0
-        for name, content in WikiPageFetcher(
-                keys,
-                self.context.host_url,
-                self.context.fetch_batch_size
-        ).fetch():
-            if name not in url_dict:
-                raise FilterFetchFunctionsError(
-                    f'Not found key {name} in url_dict. '
-                    f'Have you normalized the URL names?'
-                )
-
-            url_object = url_dict[name]
-            counter += 1
 
-            print(
-                f'Fetched [{counter}/{len(url_dict)}] '
-                f'"{url_object.name}", '
-                f'{url_object.type.name}'
-            )
-
-            self.context.fetched.append((url_dict[name], content))
+        self.context.fetched.extend(
+            self.fetch_pages(url_dict=url_dict,
+                             subfolder=self.context.function_subfolder,
+                             revisions=self.context.revisions)
+        )
@@ -5,27 +5,31 @@ from crawler.core.types import PageUrl
 
 
 class FilterRemoveDuplicates(FilterAbstract):
+    """
+    Removes URLs with the same address.
+    The last occurrence of the URL is kept
+    """
+
     def __init__(self, url_list: List):
         super().__init__()
 
         self.url_list = url_list
 
-    def filter_predicate(self):
-        def predicate(source: PageUrl):
-            for i in range(self.url_list.index(source) + 1,
-                           len(self.url_list)):
-
-                url = self.url_list[i]
-                # TODO: Decrease complexity (n^2) somehow
-                if url.url == source.url:
-                    return False
-
-            return True
-
-        return predicate
+    @staticmethod
+    def remove_duplicates(url_list: List[PageUrl]) -> List[PageUrl]:
+        """
+        Single pass deduplication by PageUrl.url. Keeps the order
+        :return: New list with the last occurrences of the URLs
+        """
+        # <url, index of the last occurrence>
+        last_index = {url.url: index for index, url in enumerate(url_list)}
+
+        return [
+            url
+            for index, url in enumerate(url_list)
+            if last_index[url.url] == index
+        ]
 
     def apply(self):
-        filtered = filter(self.filter_predicate(), self.url_list)
-
         # Replace from the origin
-        self.url_list[:] = list(filtered)
+        self.url_list[:] = self.remove_duplicates(self.url_list)
@@ -1,7 +1,10 @@
 import os
 from typing import List
 
+from crawler.core.journal import CrawlJournal
+from crawler.core.revisions import RevisionManifest
 from crawler.core.types import PageUrl
+from crawler.core.url_index import UrlIndex
 from crawler.filters.save_function_fetched import FilterSaveFetched
 
 
@@ -24,20 +27,38 @@ class FilterSaveFetchedEvents(FilterSaveFetched):
         """
         Saves fetched url list
         """
+        UrlIndex.save(self.DUMP_FOLDER,
+                      self.context.event_subfolder,
+                      self.context.event_url_list)
+
+        if self.context.url_list_py:
+            self.save_event_url_list_py()
+
+    def save_event_url_list_py(self):
+        """
+        Appends fetched url list to the Python module (compatibility mode)
+        """
         cache_file = os.path.join(self.DUMP_FOLDER, '__init__.py')
 
         with open(cache_file, 'a', encoding='UTF-8', newline='\n') as cache:
             cache.write(self.text_event_url_list(self.context.event_url_list))
 
+    def save_revisions(self):
+        """
+        Saves revisions of the cached pages
+        """
+        RevisionManifest.update(self.DUMP_FOLDER,
+                                self.context.event_subfolder,
+                                self.context.event_revisions)
+
     def apply(self):
-        for url, text in self.context.event_fetched:
-            self.save_file(
-                url,
-                text,
-                os.path.join(self.context.event_subfolder,
-                             url.name[2:4].upper())
-            )
-            print(f'Saved "{url.name}", {url.type.name}')
+        # Pages are saved by the fetch filter
+        self.context.storage.save_manifest(self.context.event_subfolder)
 
         self.save_event_url_list()
         print('Saved URL List')
+
+        self.save_revisions()
+        print('Saved revisions')
+
+        CrawlJournal.remove(self.DUMP_FOLDER, self.context.event_subfolder)
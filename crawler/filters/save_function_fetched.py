@@ -1,38 +1,16 @@
 import os
-from typing import List, Optional
+from typing import List
 
 from crawler.core.filter import FilterAbstract
+from crawler.core.journal import CrawlJournal
+from crawler.core.revisions import RevisionManifest
+from crawler.core.storage import PageStorage
 from crawler.core.types import PageUrl
-from crawler.filters.fetch_function_pages import WikiPageFetcher
+from crawler.core.url_index import UrlIndex
 
 
 class FilterSaveFetched(FilterAbstract):
-    DUMP_FOLDER = 'dump_html'
-
-    def save_file(self, url: PageUrl, result: str,
-                  subdir: Optional[str] = None):
-        """
-        Saves fetched data into a file
-        :param url: Data about the function
-        :param result: Fetched data
-        :param subdir: Subdirectory with data
-         (relative path, based on DUMP folder)
-        """
-        name = WikiPageFetcher.normalize_page_name(url.name)
-        if subdir is None:
-            subdir = os.path.join(self.DUMP_FOLDER, name[:2].upper())
-        else:
-            subdir = os.path.join(self.DUMP_FOLDER, subdir)
-
-        cache_file = os.path.join(subdir, name)
-
-        if not os.path.exists(self.DUMP_FOLDER):
-            os.mkdir(self.DUMP_FOLDER)
-        if not os.path.exists(subdir):
-            os.mkdir(subdir)
-
-        with open(cache_file, 'w', encoding='UTF-8', newline='\n') as cache:
-            cache.write(result)
+    DUMP_FOLDER = PageStorage.DUMP_FOLDER
 
     @staticmethod
     def text_url_list(url_list: List[PageUrl],
@@ -50,20 +28,38 @@ class FilterSaveFetched(FilterAbstract):
         """
         Saves fetched url list
         """
+        UrlIndex.save(self.DUMP_FOLDER,
+                      self.context.function_subfolder,
+                      self.context.url_list)
+
+        if self.context.url_list_py:
+            self.save_url_list_py()
+
+    def save_url_list_py(self):
+        """
+        Saves fetched url list as a Python module (compatibility mode)
+        """
         cache_file = os.path.join(self.DUMP_FOLDER, '__init__.py')
 
         with open(cache_file, 'w', encoding='UTF-8', newline='\n') as cache:
             cache.write(self.text_url_list(self.context.url_list))
 
+    def save_revisions(self):
+        """
+        Saves revisions of the cached pages
+        """
+        RevisionManifest.update(self.DUMP_FOLDER,
+                                self.context.function_subfolder,
+                                self.context.revisions)
+
     def apply(self):
-        for url, text in self.context.fetched:
-            self.save_file(
-                url,
-                text,
-                os.path.join(self.context.function_subfolder,
-                             url.name[:2].upper())
-            )
-            print(f'Saved "{url.name}", {url.type.name}')
+        # Pages are saved by the fetch filter
+        self.context.storage.save_manifest(self.context.function_subfolder)
 
         self.save_url_list()
         print('Saved URL List')
+
+        self.save_revisions()
+        print('Saved revisions')
+
+        CrawlJournal.remove(self.DUMP_FOLDER, self.context.function_subfolder)
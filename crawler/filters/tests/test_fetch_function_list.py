@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from crawler.core.types import ListType, PageUrl
+from crawler.filters.fetch_function_list import FilterFetchList, \
+    FunctionListParseError
+
+LIST_WIKITEXT = """__NOTOC__
+Functions of the client.
+== [[Element]] functions ==
+*[[getElementData]]
+* [[setElementData|setElementData]] (see also [[Element data]])
+*[[File:Icon.png]]
+==''Ped'' functions==
+===Deprecated===
+*[[getPedArmor]]
+"""
+
+
+def test_parse_list_wikitext():
+    list_filter = FilterFetchList(ListType.CLIENT)
+
+    assert list_filter.parse_list_wikitext(LIST_WIKITEXT) == [
+        PageUrl(url='/wiki/GetElementData',
+                name='getElementData',
+                category='Element functions',
+                type=ListType.CLIENT),
+        PageUrl(url='/wiki/SetElementData',
+                name='setElementData',
+                category='Element functions',
+                type=ListType.CLIENT),
+        PageUrl(url='/wiki/Element_data',
+                name='Element data',
+                category='Element functions',
+                type=ListType.CLIENT),
+        PageUrl(url='/wiki/GetPedArmor',
+                name='getPedArmor',
+                category='Ped functions',
+                type=ListType.CLIENT),
+    ]
+
+
+class ExpandTemplatesHttp:
+    def __init__(self, wikitext: str):
+        self.wikitext = wikitext
+        self.requests = []
+
+    def get(self, url: str, params: dict):
+        self.requests.append(params)
+        return SimpleNamespace(json=lambda: {
+            'expandtemplates': {'wikitext': self.wikitext}
+        })
+
+
+def test_download_list_wikitext():
+    http = ExpandTemplatesHttp(LIST_WIKITEXT)
+    list_filter = FilterFetchList(ListType.CLIENT)
+    list_filter.context = SimpleNamespace(host_url='http://localhost',
+                                          http=http)
+
+    assert list_filter.download_list_wikitext() == LIST_WIKITEXT
+    assert len(http.requests) == 1
+    assert http.requests[0]['action'] == 'expandtemplates'
+    assert http.requests[0]['text'] == '{{:Client_Scripting_Functions}}'
+
+
+def test_download_list_wikitext_missing():
+    http = ExpandTemplatesHttp('[[:Client_Scripting_Functions]]')
+    list_filter = FilterFetchList(ListType.CLIENT)
+    list_filter.context = SimpleNamespace(host_url='http://localhost',
+                                          http=http)
+
+    with pytest.raises(FunctionListParseError):
+        list_filter.download_list_wikitext()
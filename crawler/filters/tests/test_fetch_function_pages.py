@@ -0,0 +1,114 @@
+import os
+from types import SimpleNamespace
+from typing import List, Dict
+
+import pytest
+import requests
+
+from crawler.core.failures import FetchFailureReport
+from crawler.core.journal import CrawlJournal
+from crawler.core.storage import PageStorage
+from crawler.core.types import PageRevision, PageUrl, ListType
+from crawler.filters.fetch_function_pages import WikiPageFetcher, \
+    WikiPageFetchError, FilterFetchFunctions
+
+
+def fetch_batch(batch: List[str]) -> Dict[str, str]:
+    if 'Broken' in batch:
+        raise WikiPageFetchError('Request failed')
+
+    return {name: f'Content of {name}' for name in batch}
+
+
+def test_isolate_failures():
+    pages = ['A', 'B', 'Broken', 'C', 'D']
+    fetcher = WikiPageFetcher(pages, 'http://localhost',
+                              isolate_failures=True)
+
+    result = fetcher.isolate(fetch_batch)(pages)
+    assert list(result) == ['A', 'B', 'C', 'D']
+    assert fetcher.failures == {
+        'Broken': 'WikiPageFetchError: Request failed'
+    }
+
+
+def test_isolate_failures_normalized_names():
+    fetcher = WikiPageFetcher(['a', 'broken'], 'http://localhost',
+                              isolate_failures=True)
+
+    result = fetcher.isolate(
+        lambda batch: fetch_batch([name.capitalize() for name in batch]))(
+        ['a', 'broken'])
+    assert list(result) == ['A']
+    assert list(fetcher.failures) == ['Broken']
+
+
+@pytest.mark.parametrize('status, is_raised', [
+    (429, True),
+    (503, True),
+    (500, False),
+])
+def test_isolate_overload(status: int, is_raised: bool):
+    response = requests.Response()
+    response.status_code = status
+    calls = []
+
+    def fetch_failing(batch: List[str]) -> Dict[str, str]:
+        calls.append(batch)
+        raise requests.HTTPError(response=response)
+
+    fetcher = WikiPageFetcher(['A', 'B'], 'http://localhost',
+                              isolate_failures=True)
+    if is_raised:
+        with pytest.raises(requests.HTTPError):
+            fetcher.isolate(fetch_failing)(['A', 'B'])
+        assert calls == [['A', 'B']]
+    else:
+        assert fetcher.isolate(fetch_failing)(['A', 'B']) == dict()
+        assert list(fetcher.failures) == ['A', 'B']
+
+
+def test_failure_report(tmp_path):
+    folder = str(tmp_path)
+    FetchFailureReport.save(folder, 'functions', {'Broken': 'not found'})
+    assert FetchFailureReport.load(folder, 'functions') == {
+        'Broken': 'not found'
+    }
+
+    FetchFailureReport.save(folder, 'functions', dict())
+    assert FetchFailureReport.load(folder, 'functions') == dict()
+
+
+def get_url_dict(names: List[str]) -> Dict[str, PageUrl]:
+    return {
+        name: PageUrl(url=f'/wiki/{name}', name=name,
+                      category='Element functions', type=ListType.CLIENT)
+        for name in names
+    }
+
+
+@pytest.mark.parametrize('resume_fetch', [True, False])
+def test_resume(tmp_path, monkeypatch, resume_fetch: bool):
+    monkeypatch.chdir(tmp_path)
+    committed = PageRevision(revid=10, timestamp='2020-01-01T00:00:00Z')
+    CrawlJournal.commit(PageStorage.DUMP_FOLDER, 'functions',
+                        {'A': committed})
+
+    fetch_filter = FilterFetchFunctions()
+    fetch_filter.context = SimpleNamespace(resume_fetch=resume_fetch)
+    url_dict = get_url_dict(['A', 'B'])
+    revisions = dict()
+    fetch_filter.resume(url_dict, 'functions', revisions)
+
+    journal_path = CrawlJournal.get_path(PageStorage.DUMP_FOLDER,
+                                         'functions')
+    if resume_fetch:
+        assert list(url_dict) == ['B']
+        assert revisions == {'A': committed}
+        assert CrawlJournal.load(PageStorage.DUMP_FOLDER, 'functions') == {
+            'A': committed
+        }
+    else:
+        assert list(url_dict) == ['A', 'B']
+        assert revisions == dict()
+        assert not os.path.exists(journal_path)
@@ -0,0 +1,36 @@
+from crawler.core.types import PageUrl, ListType
+from crawler.filters.remove_duplicates import FilterRemoveDuplicates
+
+
+def page_url(url: str, list_type: ListType) -> PageUrl:
+    return PageUrl(url=url, name=url, category='Category', type=list_type)
+
+
+def test_remove_duplicates_last_occurrence_wins():
+    url_list = [
+        page_url('/wiki/A', ListType.CLIENT),
+        page_url('/wiki/B', ListType.CLIENT),
+        page_url('/wiki/A', ListType.SERVER),
+        page_url('/wiki/C', ListType.SERVER),
+        page_url('/wiki/B', ListType.SERVER),
+    ]
+
+    filt = FilterRemoveDuplicates(url_list)
+    filt.apply()
+
+    assert url_list == [
+        page_url('/wiki/A', ListType.SERVER),
+        page_url('/wiki/C', ListType.SERVER),
+        page_url('/wiki/B', ListType.SERVER),
+    ]
+
+
+def test_remove_duplicates_equal_items():
+    url_list = [
+        page_url('/wiki/A', ListType.CLIENT),
+        page_url('/wiki/A', ListType.CLIENT),
+    ]
+
+    assert FilterRemoveDuplicates.remove_duplicates(url_list) == [
+        page_url('/wiki/A', ListType.CLIENT),
+    ]
@@ -1,36 +1,97 @@
-import sys
-from typing import List, Callable
+import argparse
+from typing import List, Callable, Optional
 
 from crawler import config
+from crawler.core.batching import AdaptiveBatchSize
 from crawler.chain import get_filter_chain, get_event_filter_chain
 from crawler.core.filter import Context, FilterAbstract
+from crawler.core.http import HttpClient
+from crawler.core.storage import PageStorage
+from crawler.core.throttle import HostThrottle
+from profiling.profiler import add_profiler_arguments, run_chain
 
 
-def main(filter_chain: Callable[[Context], List[FilterAbstract]]):
+def create_http_client() -> HttpClient:
+    return HttpClient(
+        timeout=config.REQUEST_TIMEOUT,
+        retries=config.REQUEST_RETRIES,
+        backoff_factor=config.REQUEST_BACKOFF_FACTOR,
+        pool_size=max(config.FETCH_WORKERS, config.HOST_MAX_CONNECTIONS),
+        throttle=HostThrottle(
+            max_connections=config.HOST_MAX_CONNECTIONS,
+            interval=config.HOST_REQUEST_INTERVAL,
+        ),
+    )
+
+
+def create_batch_size() -> AdaptiveBatchSize:
+    if not config.ADAPTIVE_BATCH_SIZE:
+        return AdaptiveBatchSize.fixed(config.BATCH_SIZE)
+
+    return AdaptiveBatchSize(
+        initial=config.BATCH_SIZE,
+        maximum=config.BATCH_SIZE_LIMIT,
+        target_latency=config.BATCH_TARGET_LATENCY,
+        max_payload=config.BATCH_MAX_PAYLOAD,
+    )
+
+
+def count_items(context: Context) -> int:
+    return (len(context.url_list) + len(context.fetched)
+            + len(context.event_url_list) + len(context.event_fetched))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Dumps MediaWiki content about functions and events')
+    parser.add_argument('kind', choices=['functions', 'events'],
+                        help='Pages to fetch')
+    parser.add_argument('--no-resume', action='store_true',
+                        help='Fetch all pages, ignore the journal '
+                             'of the interrupted crawl')
+    add_profiler_arguments(parser)
+
+    return parser.parse_args(argv)
+
+
+def main(filter_chain: Callable[[Context], List[FilterAbstract]],
+         args: Optional[argparse.Namespace] = None):
     context = Context(host_url=config.HOST_URL,
                       function_subfolder=config.FUNCTION_SUBFOLDER,
                       fetch_start_from=config.FUNCTION_START_FROM,
-                      fetch_batch_size=config.BATCH_SIZE,
+                      fetch_batch_size=create_batch_size(),
+                      fetch_workers=config.FETCH_WORKERS,
+                      fetch_maxlag=config.REQUEST_MAXLAG,
+                      incremental_fetch=config.INCREMENTAL_FETCH,
+                      resume_fetch=args is None or not args.no_resume,
+                      isolate_fetch_failures=config.ISOLATE_FETCH_FAILURES,
+                      list_source=config.LIST_SOURCE,
+                      write_queue_size=config.WRITE_QUEUE_SIZE,
+                      http=create_http_client(),
+                      storage=PageStorage(
+                          mode=config.DUMP_STORAGE,
+                          compression=config.DUMP_COMPRESSION,
+                      ),
+                      url_list_py=config.DUMP_URL_LIST_PY,
                       blacklist=config.FUNCTION_BLACKLIST,
                       event_subfolder=config.EVENT_SUBFOLDER,
                       event_fetch_start_from=config.EVENT_START_FROM,
                       event_blacklist=config.EVENT_BLACKLIST, )
 
     print('Start filter chain')
-    for filt in filter_chain(context):
-        filt.initialize(context)
-        filt.apply()
+    run_chain(filter_chain(context), context, args,
+              chain_name=f'crawler {filter_chain.__name__}',
+              count_items=count_items)
 
     print('\u001b[32mComplete\u001b[0m')
 
 
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print('Expected 1 argv: [functions/events]', file=sys.stderr)
-        exit(1)
+    arguments = parse_args()
 
     main(
         get_filter_chain
-        if sys.argv[1] == 'functions'
-        else get_event_filter_chain
+        if arguments.kind == 'functions'
+        else get_event_filter_chain,
+        arguments
     )
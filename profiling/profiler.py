@@ -0,0 +1,241 @@
+import argparse
+import cProfile
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional, List, Callable, Any, Iterable
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPORT_VERSION = 1
+
+
+def get_peak_rss() -> Optional[int]:
+    """
+    :return: Peak resident set size of the process (in bytes).
+     None, if it is not available on the platform
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS reports bytes
+    if sys.platform != 'darwin':
+        peak *= 1024
+
+    return peak
+
+
+def get_cpu_time() -> float:
+    """
+    :return: CPU time (user and system) of the process
+     and its finished child processes
+    """
+    times = os.times()
+    return (times.user + times.system
+            + times.children_user + times.children_system)
+
+
+@dataclass
+class StageReport:
+    """
+    Measurements of a one filter
+    """
+    name: str
+    wall_time: float
+    cpu_time: float
+    # Increase of the peak RSS (in bytes). None, if it is not available
+    peak_rss_delta: Optional[int]
+    # Amount of items in the context after the stage.
+    # None, if there is no item counter
+    items: Optional[int]
+
+
+class ChainProfiler:
+    """
+    Runs a filter chain and measures every filter:
+    wall time, CPU time, peak RSS increase and amount of items
+    in the context. Optionally saves cProfile statistics per filter
+    """
+
+    def __init__(self,
+                 chain_name: str,
+                 count_items: Optional[Callable[[Any], int]] = None,
+                 cprofile_folder: Optional[str] = None):
+        """
+        :param chain_name: Name of the chain in the report
+        :param count_items: Function, that counts items in the context
+        :param cprofile_folder: Folder for the .pstats files.
+         None to disable cProfile
+        """
+        self.chain_name = chain_name
+        self.count_items = count_items
+        self.cprofile_folder = cprofile_folder
+
+        self.stages: List[StageReport] = []
+
+    def get_stage_name(self, filt) -> str:
+        name = type(filt).__name__
+        context_type = getattr(filt, 'context_type', None)
+        if context_type is not None:
+            name += f'({context_type})'
+
+        names = {stage.name for stage in self.stages}
+        if name not in names:
+            return name
+
+        index = 2
+        while f'{name}#{index}' in names:
+            index += 1
+
+        return f'{name}#{index}'
+
+    def save_stats(self, profile: cProfile.Profile, name: str):
+        os.makedirs(self.cprofile_folder, exist_ok=True)
+        file_name = f'{len(self.stages) + 1:02}_{name}.pstats'
+        profile.dump_stats(os.path.join(self.cprofile_folder, file_name))
+
+    def run_filter(self, filt, context):
+        name = self.get_stage_name(filt)
+        profile = cProfile.Profile() if self.cprofile_folder else None
+
+        rss_before = get_peak_rss()
+        cpu_before = get_cpu_time()
+        wall_before = time.perf_counter()
+
+        if profile is not None:
+            profile.enable()
+
+        filt.initialize(context)
+        filt.apply()
+
+        if profile is not None:
+            profile.disable()
+
+        wall_time = time.perf_counter() - wall_before
+        cpu_time = get_cpu_time() - cpu_before
+        rss_after = get_peak_rss()
+
+        if profile is not None:
+            self.save_stats(profile, name)
+
+        self.stages.append(StageReport(
+            name=name,
+            wall_time=wall_time,
+            cpu_time=cpu_time,
+            peak_rss_delta=None if rss_before is None
+            else rss_after - rss_before,
+            items=None if self.count_items is None
+            else self.count_items(context),
+        ))
+
+    def run(self, filters: Iterable, context):
+        for filt in filters:
+            self.run_filter(filt, context)
+
+    def print_summary(self):
+        rows = [
+            (stage.name,
+             f'{stage.wall_time:.3f}',
+             f'{stage.cpu_time:.3f}',
+             '-' if stage.peak_rss_delta is None
+             else f'{stage.peak_rss_delta / 2 ** 20:.1f}',
+             '-' if stage.items is None else str(stage.items))
+            for stage in self.stages
+        ]
+        rows.append((
+            'Total',
+            f'{sum(stage.wall_time for stage in self.stages):.3f}',
+            f'{sum(stage.cpu_time for stage in self.stages):.3f}',
+            '', '',
+        ))
+
+        header = ('Filter', 'Wall, s', 'CPU, s', 'Peak RSS +, MiB', 'Items')
+        widths = [max(len(row[i]) for row in [header, *rows])
+                  for i in range(len(header))]
+
+        def format_row(row) -> str:
+            return '  '.join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+
+        print(f'\u001b[1mProfile of the "{self.chain_name}" chain\u001b[0m')
+        print(f'\u001b[34m{format_row(header)}\u001b[0m')
+        for row in rows:
+            print(format_row(row))
+
+    def get_report(self) -> dict:
+        return dict(
+            version=REPORT_VERSION,
+            chain=self.chain_name,
+            wall_time=round(sum(stage.wall_time for stage in self.stages), 6),
+            cpu_time=round(sum(stage.cpu_time for stage in self.stages), 6),
+            peak_rss=get_peak_rss(),
+            stages=[
+                dict(asdict(stage),
+                     wall_time=round(stage.wall_time, 6),
+                     cpu_time=round(stage.cpu_time, 6))
+                for stage in self.stages
+            ],
+        )
+
+    def save_report(self, path: str):
+        """
+        Saves report as JSON
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with open(path, 'w', encoding='UTF-8', newline='\n') as file:
+            json.dump(self.get_report(), file, indent=2)
+            file.write('\n')
+
+
+def add_profiler_arguments(parser: argparse.ArgumentParser):
+    """
+    Adds profiling options to the command line parser
+    """
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', action='store_true',
+                       help='Measure filters and print a summary table')
+    group.add_argument('--profile-report', metavar='PATH',
+                       help='Save measurements of filters as JSON '
+                            '(enables --profile)')
+    group.add_argument('--cprofile', metavar='FOLDER',
+                       help='Save cProfile statistics of every filter '
+                            'into the folder (enables --profile)')
+
+
+def run_chain(filters: Iterable, context,
+              args: Optional[argparse.Namespace],
+              chain_name: str,
+              count_items: Optional[Callable[[Any], int]] = None):
+    """
+    Applies filters. Profiles them, if it is requested by the command line
+    :param args: Parsed command line (with the profiling options).
+     None to disable profiling
+    """
+    if args is None \
+            or not (args.profile or args.profile_report or args.cprofile):
+        for filt in filters:
+            filt.initialize(context)
+            filt.apply()
+
+        return
+
+    profiler = ChainProfiler(chain_name,
+                             count_items=count_items,
+                             cprofile_folder=args.cprofile)
+    profiler.run(filters, context)
+    profiler.print_summary()
+
+    if args.profile_report:
+        profiler.save_report(args.profile_report)
@@ -0,0 +1,75 @@
+import argparse
+import json
+import time
+from typing import List
+
+from profiling.profiler import add_profiler_arguments, run_chain
+
+
+class FilterAppend:
+    def __init__(self, item: str, delay: float = 0):
+        self.item = item
+        self.delay = delay
+        self.context = None
+
+    def initialize(self, context: List[str]):
+        self.context = context
+
+    def apply(self):
+        time.sleep(self.delay)
+        self.context.append(self.item)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    add_profiler_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def test_run_chain_without_profile(capsys):
+    context = []
+    run_chain([FilterAppend('a'), FilterAppend('b')], context,
+              parse_args([]), chain_name='test', count_items=len)
+
+    assert context == ['a', 'b']
+    assert capsys.readouterr().out == ''
+
+
+def test_run_chain_report(tmp_path, capsys):
+    path = tmp_path / 'report.json'
+    context = []
+    run_chain([FilterAppend('a', delay=0.05), FilterAppend('b')], context,
+              parse_args(['--profile-report', str(path)]),
+              chain_name='test', count_items=len)
+
+    assert context == ['a', 'b']
+
+    output = capsys.readouterr().out
+    assert 'Profile of the "test" chain' in output
+    assert 'FilterAppend#2' in output
+
+    with open(path, encoding='UTF-8') as file:
+        report = json.load(file)
+
+    assert report['chain'] == 'test'
+    assert [stage['name'] for stage in report['stages']] == [
+        'FilterAppend', 'FilterAppend#2'
+    ]
+    assert [stage['items'] for stage in report['stages']] == [1, 2]
+
+    first, second = report['stages']
+    assert first['wall_time'] >= 0.05
+    assert second['wall_time'] < first['wall_time']
+    assert report['wall_time'] >= first['wall_time'] + second['wall_time'] \
+        - 1e-5
+
+
+def test_run_chain_cprofile(tmp_path):
+    folder = tmp_path / 'profiles'
+    run_chain([FilterAppend('a')], [],
+              parse_args(['--cprofile', str(folder)]),
+              chain_name='test')
+
+    assert [path.name for path in folder.iterdir()] == [
+        '01_FilterAppend.pstats'
+    ]
@@ -0,0 +1,132 @@
+"""
+Extracts documentation of every function from the dump_html pages
+with FilterParseDocs. Pages are read and parsed by wikitextparser
+before the measurement, so only the docs extraction is timed.
+Prints the timing and a digest of all docs, so two revisions
+of the extractor can be checked for identical output.
+
+Usage (from the to_python directory):
+    python -m to_python.benchmarks.docs_extraction [dump folder] [repeat]
+"""
+import contextlib
+import hashlib
+import io
+import os
+import sys
+import time
+from typing import Dict, Tuple
+
+from crawler.core.storage import PageStorage
+from to_python.core.context import Context, ContextData
+from to_python.filters.collect_files import FilterCollectDumpFiles
+from to_python.filters.data_list.doc import FilterParseDocs
+from to_python.filters.data_list.init import FilterInitInternalList
+from to_python.filters.data_list.raw_post_process import FilterRawPostProcess
+from to_python.filters.data_list.side import FilterParseFunctionSide
+from to_python.filters.data_list.wtp import FilterWikiTextParser
+
+
+def get_pages(dump_folder: str) -> Dict[str, str]:
+    """
+    :return: Dictionary <function name, file path>
+    """
+    manifest = PageStorage.load_manifest(dump_folder, 'functions')
+    if manifest is not None:
+        pages = {name: os.path.join(dump_folder, manifest[name])
+                 for name in manifest}
+    else:
+        folder = os.path.join(dump_folder, 'functions')
+        pages = {
+            name: os.path.join(root, name)
+            for root, _, files in os.walk(folder)
+            for name in files
+            if not name.endswith('.py')
+        }
+
+    return {
+        FilterCollectDumpFiles.function_name(name): pages[name]
+        for name in sorted(pages)
+    }
+
+
+def prepare(dump_folder: str) -> Tuple[Context, int]:
+    """
+    Reads pages and parses them by wikitextparser
+    :return: Context and amount of skipped pages
+    """
+    context = Context(functions=ContextData(pages=get_pages(dump_folder)),
+                      oops=dict(),
+                      events=ContextData(),
+                      verbose=False)
+
+    filters = [
+        FilterInitInternalList('functions'),
+        FilterRawPostProcess('functions'),
+        FilterParseFunctionSide(),
+        FilterWikiTextParser('functions'),
+    ]
+    for filt in filters:
+        filt.initialize(context)
+
+    skipped = 0
+    for name in list(context.functions.pages):
+        try:
+            for filt in filters:
+                filt.process(name)
+        except Exception:
+            context.functions.parsed.pop(name, None)
+            skipped += 1
+
+    return context, skipped
+
+
+def extract_all(context: Context) -> Tuple[float, str]:
+    """
+    :return: Time, digest of the extracted docs
+    """
+    docs = FilterParseDocs('functions')
+    docs.initialize(context)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), \
+            contextlib.redirect_stderr(io.StringIO()):
+        for name in docs.get_page_names():
+            docs.process(name)
+    elapsed = time.perf_counter() - start
+
+    digest = hashlib.sha256()
+    for name, data in context.functions.parsed.items():
+        digest.update(f'{name}\0'.encode())
+        for _, side in data:
+            doc = side[0].docs
+            digest.update(f'{doc.description}\0{doc.result}\0'.encode())
+            for argument, text in doc.arguments.items():
+                digest.update(f'{argument}\0{text}\0'.encode())
+        digest.update(b'\n')
+
+    return elapsed, digest.hexdigest()
+
+
+def main(dump_folder: str, repeat: int):
+    context, skipped = prepare(dump_folder)
+    pages = len(context.functions.parsed)
+    if not pages:
+        print(f'No function pages found in "{dump_folder}"', file=sys.stderr)
+        exit(1)
+
+    timings = []
+    for _ in range(repeat):
+        elapsed, digest = extract_all(context)
+        timings.append(elapsed)
+
+    best = min(timings)
+    print(f'Pages: {pages} ({skipped} skipped)')
+    print(f'Best of {repeat}: {best:.4f}s, '
+          f'{best / pages * 1e6:.1f}us per page')
+    print(f'Docs digest: {digest}')
+
+
+if __name__ == '__main__':
+    main(dump_folder=sys.argv[1] if len(sys.argv) > 1
+         else FilterCollectDumpFiles.DUMP_ROOT,
+         repeat=int(sys.argv[2]) if len(sys.argv) > 2 else 5)
@@ -0,0 +1,96 @@
+"""
+Loads the whole JSON dump (as to_typescript does) and prints
+the memory taken by the loaded data and the time of a full walk
+over all function types. Run it on two revisions
+of to_python.core.types to compare them.
+
+Usage (from the repository root):
+    python -m to_python.benchmarks.dump_memory [dump folder] [repeat]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Tuple
+
+from to_python.core.dump import DumpStorage, DUMP_TYPES
+from to_python.core.types import FunctionData
+
+
+def load(dump_folder: str) -> Tuple[Dict[str, List[Any]], int]:
+    """
+    :return: Dictionary <kind, data list>, allocated bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+    dump = {kind: DumpStorage(dump_folder).load(kind) for kind in DUMP_TYPES}
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return dump, allocated
+
+
+def walk_function(data: FunctionData) -> int:
+    count = 0
+    signature = data.signature
+    for return_type in signature.return_types.return_types:
+        count += len(return_type.names) + return_type.is_optional
+    for argument_list in signature.arguments.arguments:
+        for argument in argument_list:
+            if argument.argument_type is not None:
+                count += len(argument.argument_type.names)
+
+    return count
+
+
+def walk(dump: Dict[str, List[Any]]) -> int:
+    """
+    Reads every type of every function, event and OOP method
+    :return: Amount of type names
+    """
+    count = 0
+    for compound in dump['functions']:
+        for _, data_list in compound:
+            for data in data_list:
+                count += walk_function(data)
+
+    for compound in dump['oops']:
+        for _, data_list in compound:
+            for oop in data_list:
+                if oop.method is not None:
+                    count += walk_function(oop.method)
+
+    for compound in dump['events']:
+        for _, data_list in compound:
+            for event in data_list:
+                for argument_list in event.arguments.arguments:
+                    count += len(argument_list)
+
+    return count
+
+
+def main(dump_folder: str, repeat: int):
+    if DumpStorage(dump_folder).load_index() is None:
+        print(f'No JSON dump found in "{dump_folder}"', file=sys.stderr)
+        exit(1)
+
+    dump, allocated = load(dump_folder)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        names = walk(dump)
+        timings.append(time.perf_counter() - start)
+
+    items = ', '.join(f'{kind}: {len(dump[kind])}' for kind in dump)
+    print(f'Loaded {items}')
+    print(f'Memory: {allocated / 2 ** 20:.2f} MiB')
+    print(f'Walk over {names} type names, best of {repeat}: '
+          f'{min(timings):.4f}s')
+
+
+if __name__ == '__main__':
+    main(dump_folder=sys.argv[1] if len(sys.argv) > 1
+         else 'to_python/dump',
+         repeat=int(sys.argv[2]) if len(sys.argv) > 2 else 5)
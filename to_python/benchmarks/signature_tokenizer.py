@@ -0,0 +1,112 @@
+"""
+Tokenizes every signature from the dump_html pages with SignatureTokenizer.
+Prints the timing and a digest of all token streams, so two revisions
+of the tokenizer can be checked for identical output.
+
+Usage (from the to_python directory):
+    python -m to_python.benchmarks.signature_tokenizer [dump folder] [repeat]
+"""
+import contextlib
+import hashlib
+import io
+import os
+import re
+import sys
+import time
+from typing import List, Tuple
+
+from crawler.core.storage import PageStorage
+from to_python.core.signature import SignatureTokenizer, \
+    SignatureTokenizerError
+from to_python.filters.collect_files import FilterCollectDumpFiles
+from to_python.filters.data_list.raw_post_process import FilterRawPostProcess
+from to_python.filters.data_list.signature import \
+    FilterParseFunctionSignature
+
+
+def get_page_files(dump_folder: str, context_type: str) -> List[str]:
+    manifest = PageStorage.load_manifest(dump_folder, context_type)
+    if manifest is not None:
+        return [os.path.join(dump_folder, manifest[name])
+                for name in sorted(manifest)]
+
+    folder = os.path.join(dump_folder, context_type)
+    return sorted(
+        os.path.join(root, name)
+        for root, _, files in os.walk(folder)
+        for name in files
+        if not name.endswith('.py')
+    )
+
+
+def collect_signatures(dump_folder: str) -> List[str]:
+    """
+    Collects code of all lua code blocks before the "See Also"
+    and "Examples" sections. Event parameters are wrapped,
+    like FilterParseEventSignature does
+    """
+    post_process = FilterRawPostProcess('functions').post_process
+
+    signatures = []
+    for context_type in ('functions', 'events'):
+        for path in get_page_files(dump_folder, context_type):
+            raw = post_process(PageStorage.read_file(path))
+            for match in re.finditer(
+                    FilterParseFunctionSignature.SELECT_CODE_REGEX, raw):
+                code = FilterParseFunctionSignature.clean_code(
+                    match.group(1).strip())
+                if context_type == 'events':
+                    code = f'void eventCallback( {code} )'
+
+                signatures.append(code)
+
+    return signatures
+
+
+def tokenize_all(signatures: List[str]) -> Tuple[float, int, str]:
+    """
+    :return: Time, amount of failed signatures, digest of token streams
+    """
+    digest = hashlib.sha256()
+    failed = 0
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), \
+            contextlib.redirect_stderr(io.StringIO()):
+        for code in signatures:
+            try:
+                tokenized = SignatureTokenizer(code).tokenize()
+            except (SignatureTokenizerError, IndexError):
+                failed += 1
+                digest.update(b'error\0')
+                continue
+
+            for token in tokenized:
+                digest.update(f'{token.type.value}:{token.value}\0'.encode())
+            digest.update(b'\n')
+
+    return time.perf_counter() - start, failed, digest.hexdigest()
+
+
+def main(dump_folder: str, repeat: int):
+    signatures = collect_signatures(dump_folder)
+    if not signatures:
+        print(f'No signatures found in "{dump_folder}"', file=sys.stderr)
+        exit(1)
+
+    timings = []
+    for _ in range(repeat):
+        elapsed, failed, digest = tokenize_all(signatures)
+        timings.append(elapsed)
+
+    best = min(timings)
+    print(f'Signatures: {len(signatures)} ({failed} failed)')
+    print(f'Best of {repeat}: {best:.4f}s, '
+          f'{best / len(signatures) * 1e6:.1f}us per signature')
+    print(f'Token streams digest: {digest}')
+
+
+if __name__ == '__main__':
+    main(dump_folder=sys.argv[1] if len(sys.argv) > 1
+         else FilterCollectDumpFiles.DUMP_ROOT,
+         repeat=int(sys.argv[2]) if len(sys.argv) > 2 else 5)
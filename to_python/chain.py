@@ -1,6 +1,7 @@
 from typing import List
 
 from to_python.core.filter import FilterAbstract
+from to_python.filters.cache import FilterLoadParseCache, FilterSaveParseCache
 from to_python.filters.collect_files import FilterCollectDumpFiles
 from to_python.filters.data_list.doc import FilterParseDocs
 from to_python.filters.data_list.init import FilterInitInternalList
@@ -17,32 +18,45 @@ from to_python.filters.event_data_list.signature import \
     FilterParseEventSignature
 from to_python.filters.get_urls import FilterGetFunctionUrls, \
     FilterGetEventUrls
+from to_python.filters.parallel import FilterParallel
+from to_python.filters.stream import FilterStreamPages
 
 FILTER_CHAIN: List[FilterAbstract]
 
 FILTER_CHAIN = [
     FilterGetFunctionUrls(),
     FilterCollectDumpFiles('functions'),
-    FilterInitInternalList('functions'),
-    FilterRawPostProcess('functions'),
-    FilterParseFunctionSide(),
-    FilterWikiTextParser('functions'),
-    FilterParseDocs('functions'),
+    FilterParallel('functions', [
+        FilterStreamPages('functions', [
+            FilterInitInternalList('functions'),
+            FilterRawPostProcess('functions'),
+            FilterLoadParseCache('functions'),
+            FilterParseFunctionSide(),
+            FilterWikiTextParser('functions'),
+            FilterParseDocs('functions'),
+            FilterParseFunctionSignature(),
+            FilterParseFunctionOOP(),
+            FilterSaveParseCache('functions'),
+        ]),
+    ]),
 
-    FilterParseFunctionSignature(),
     FilterSaveFunctionData(),
-
-    FilterParseFunctionOOP(),
     FilterSaveFunctionOOPData(),
 
     FilterGetEventUrls(),
     FilterCollectDumpFiles('events'),
-    FilterInitInternalList('events'),
-    FilterRawPostProcess('events'),
-    FilterParseEventSide(),
-    FilterWikiTextParser('events'),
-    FilterParseDocs('events'),
+    FilterParallel('events', [
+        FilterStreamPages('events', [
+            FilterInitInternalList('events'),
+            FilterRawPostProcess('events'),
+            FilterLoadParseCache('events'),
+            FilterParseEventSide(),
+            FilterWikiTextParser('events'),
+            FilterParseDocs('events'),
+            FilterParseEventSignature(),
+            FilterSaveParseCache('events'),
+        ]),
+    ]),
 
-    FilterParseEventSignature(),
     FilterSaveEventData(),
 ]
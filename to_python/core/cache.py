@@ -0,0 +1,100 @@
+import glob
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass
+from typing import Optional, Any
+
+from to_python.core.types import CompoundOOPData
+
+# Bump, if parsing changes in a way that is not visible
+#   in the to_python sources (for example, the wikitextparser update)
+PARSE_CACHE_VERSION = 1
+
+
+@dataclass
+class ParseCacheEntry:
+    """
+    Finished parse result of a one page
+    """
+    # CompoundFunctionData or CompoundEventData
+    parsed: Any
+    oop: Optional[CompoundOOPData] = None
+
+
+class ParseCache:
+    """
+    On disk cache of the parse results.
+    Key is a hash of the page raw text, page name and the parser version.
+    Entries are stored as pickles: <folder>/<key[:2]>/<key>.pickle
+    """
+
+    def __init__(self, folder: str, salt: Optional[str] = None):
+        """
+        :param folder: Cache folder
+        :param salt: Parser version salt.
+         By default, it is made from PARSE_CACHE_VERSION
+         and the to_python sources
+        """
+        self.folder = folder
+        self.salt = self.get_parser_salt() if salt is None else salt
+
+    @staticmethod
+    def get_parser_salt() -> str:
+        """
+        Hashes PARSE_CACHE_VERSION and the to_python sources,
+        so any change of the parser invalidates the cache
+        """
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        digest = hashlib.sha256(str(PARSE_CACHE_VERSION).encode())
+
+        paths = [
+            path
+            for folder in ('core', 'filters')
+            for path in glob.iglob(os.path.join(root, folder, '**', '*.py'),
+                                   recursive=True)
+            if f'{os.sep}tests{os.sep}' not in path
+        ]
+        for path in sorted(paths):
+            with open(path, 'rb') as file:
+                digest.update(file.read())
+
+        return digest.hexdigest()
+
+    def get_key(self, context_type: str, name: str, raw: str) -> str:
+        digest = hashlib.sha256()
+        for part in (self.salt, context_type, name, raw):
+            digest.update(part.encode('UTF-8'))
+            digest.update(b'\0')
+
+        return digest.hexdigest()
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.folder, key[:2], f'{key}.pickle')
+
+    def load(self, key: str) -> Optional[ParseCacheEntry]:
+        """
+        :return: Cached entry. None, if there is no entry
+         or it cannot be read
+        """
+        path = self.get_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as file:
+                return pickle.load(file)
+        except Exception:
+            return None
+
+    def save(self, key: str, entry: ParseCacheEntry):
+        path = self.get_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write and rename, so an interrupted run
+        #   does not leave a broken entry
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as file:
+            pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_path, path)
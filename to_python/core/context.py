@@ -6,8 +6,10 @@ from typing import Optional, Tuple, Any, Dict, TypeVar, Generic
 from wikitextparser import WikiText
 
 from crawler.core.types import PageUrl
+from to_python.core.cache import ParseCache, ParseCacheEntry
 from to_python.core.types import CompoundFunctionData, CompoundEventData, \
     CompoundOOPData
+from to_python.core.wiki import WikiSectionIndex
 
 CompoundDataType = TypeVar('CompoundDataType')
 
@@ -43,6 +45,13 @@ class WikiSide(IterableSide):
     client: Optional[WikiText]
 
 
+@dataclass
+class WikiSideIndex(IterableSide):
+    side: ParseFunctionSide
+    server: Optional[WikiSectionIndex]
+    client: Optional[WikiSectionIndex]
+
+
 @dataclass
 class ContextData(Generic[CompoundDataType]):
     """
@@ -67,9 +76,19 @@ class ContextData(Generic[CompoundDataType]):
     # Side data parsed by wtp
     wiki_side: Dict[str, WikiSide] = field(default_factory=dict)
 
+    # Section indexes of the side data
+    wiki_index: Dict[str, WikiSideIndex] = field(default_factory=dict)
+
     # URLs from URL List
     urls: Dict[str, PageUrl] = field(default_factory=dict)
 
+    # Parse cache keys <function name, key>
+    cache_keys: Dict[str, str] = field(default_factory=dict)
+
+    # Pages loaded from the parse cache <function name, cache entry>.
+    # These pages are not in `parsed` until the cache is saved
+    cached: Dict[str, ParseCacheEntry] = field(default_factory=dict)
+
 
 @dataclass
 class Context:
@@ -83,3 +102,12 @@ class Context:
 
     # Verbose mode
     verbose: bool
+
+    # Amount of processes for the wiki text parsing
+    jobs: int = 1
+
+    # Parse results cache. None, if disabled
+    cache: Optional[ParseCache] = None
+
+    # Save the dump as Python modules too (besides JSON)
+    py_dump: bool = True
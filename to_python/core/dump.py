@@ -0,0 +1,121 @@
+import json
+import os
+from typing import List, Optional, Dict, Any, Iterable
+
+from to_python.core.types import CompoundFunctionData, CompoundEventData, \
+    CompoundOOPData
+
+# Bump, if the format of `to_dict` changes
+DUMP_SCHEMA_VERSION = 1
+
+# <kind, compound data type>
+DUMP_TYPES = dict(functions=CompoundFunctionData,
+                  events=CompoundEventData,
+                  oops=CompoundOOPData)
+
+
+class DumpSchemaError(RuntimeError):
+    pass
+
+
+class DumpStorage:
+    """
+    Parsed data stored as JSON, a file per category:
+    <folder>/<kind>/<category>.json.
+    <folder>/index.json lists categories of every kind.
+    Loaded without compiling Python modules
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, folder: str):
+        """
+        :param folder: Dump folder
+        """
+        self.folder = folder
+
+    def get_index_path(self) -> str:
+        return os.path.join(self.folder, self.INDEX_FILE)
+
+    def get_path(self, kind: str, category: str) -> str:
+        return os.path.join(self.folder, kind, f'{category}.json')
+
+    @staticmethod
+    def read_json(path: str) -> Dict[str, Any]:
+        with open(path, encoding='UTF-8') as file:
+            data = json.load(file)
+
+        version = data.get('version')
+        if version != DUMP_SCHEMA_VERSION:
+            raise DumpSchemaError(
+                f'Unsupported dump schema version {version} in "{path}" '
+                f'(expected {DUMP_SCHEMA_VERSION}). Run to_python again')
+
+        return data
+
+    @staticmethod
+    def write_json(path: str, data: Dict[str, Any]):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, 'w', encoding='UTF-8', newline='\n') as file:
+            json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+            file.write('\n')
+
+    def load_index(self) -> Optional[Dict[str, List[str]]]:
+        """
+        :return: Dictionary <kind, categories>. None, if there is no index
+        """
+        path = self.get_index_path()
+        if not os.path.exists(path):
+            return None
+
+        return self.read_json(path)['categories']
+
+    def save_index(self, kind: str, categories: List[str]):
+        """
+        Replaces categories of the kind in the index
+        """
+        index = self.load_index() or dict()
+        index[kind] = sorted(categories)
+
+        self.write_json(self.get_index_path(),
+                        dict(version=DUMP_SCHEMA_VERSION, categories=index))
+
+    def load_category(self, kind: str, category: str) -> List[Any]:
+        """
+        :return: List of CompoundFunctionData, CompoundEventData
+         or CompoundOOPData (depends on kind)
+        """
+        data = self.read_json(self.get_path(kind, category))
+        from_dict = DUMP_TYPES[kind].from_dict
+
+        return [from_dict(item) for item in data['items']]
+
+    def save_category(self, kind: str, category: str, data_list: List[Any]):
+        self.write_json(self.get_path(kind, category), dict(
+            version=DUMP_SCHEMA_VERSION,
+            kind=kind,
+            category=category,
+            items=[data.to_dict() for data in data_list],
+        ))
+
+    def load(self, kind: str,
+             categories: Optional[Iterable[str]] = None) -> \
+            Optional[List[Any]]:
+        """
+        Loads categories of the kind (in the index order).
+        Only files of the requested categories are read
+        :param categories: Categories to load. None to load all categories
+        :return: List of the compound data. None, if there is no index
+        """
+        index = self.load_index()
+        if index is None:
+            return None
+
+        selected = None if categories is None else set(categories)
+        return [
+            data
+            for category in index.get(kind, [])
+            if selected is None or category in selected
+            for data in self.load_category(kind, category)
+        ]
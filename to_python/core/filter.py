@@ -1,5 +1,5 @@
 import abc
-from typing import Union
+from typing import Union, List
 
 from to_python.core.context import Context, ContextData
 from to_python.core.types import CompoundFunctionData, CompoundEventData
@@ -31,3 +31,43 @@ class FilterAbstract(metaclass=abc.ABCMeta):
         Applies filter
         """
         pass
+
+
+class FilterPageAbstract(FilterAbstract):
+    """
+    Filter, that processes pages one by one.
+    Can be applied to all pages at once (`apply`) or page by page
+    inside the FilterStreamPages
+    """
+
+    def get_page_names(self) -> List[str]:
+        """
+        :return: Names of the pages to process
+        """
+        return list(self.context_data.parsed)
+
+    def start(self):
+        """
+        Called before the first page
+        """
+        pass
+
+    @abc.abstractmethod
+    def process(self, name: str):
+        """
+        Processes a single page.
+        Page can be removed from `parsed` to skip the next filters
+        """
+        pass
+
+    def finish(self):
+        """
+        Called after the last page
+        """
+        pass
+
+    def apply(self):
+        self.start()
+        for name in self.get_page_names():
+            self.process(name)
+        self.finish()
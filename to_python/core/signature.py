@@ -1,6 +1,8 @@
 import enum
 import re
 import sys
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict, Any, Set
 
@@ -61,6 +63,41 @@ class SignatureTokenizer:
         type: 'SignatureTokenizer.TokenType'
         value: str
 
+    # Tokens, that can be placed between return types
+    RETURN_SEPARATORS = frozenset({
+        TokenType.TYPE_UNION_SIGN,  # Example: table/xmlnode
+        TokenType.COMMA_SIGN,
+        # Example: STRING, STRING getPedAnimation ( ped thePed )
+        TokenType.OPTIONAL_START,
+        TokenType.OPTIONAL_END,
+        # Example: INT, INT [, INT] dxGetMaterialSize
+    })
+
+    # Tokens, that end a default value
+    DEFAULT_VALUE_END = frozenset({
+        TokenType.COMMA_SIGN,
+        TokenType.ARGUMENT_END,
+        TokenType.OPTIONAL_END,
+        TokenType.OPTIONAL_START,
+    })
+
+    # Tokens, that are followed by an argument
+    ARGUMENT_KEY_TOKENS = frozenset({
+        TokenType.COMMA_SIGN,  # ,
+        TokenType.ARGUMENT_START,  # (
+        TokenType.TYPE_UNION_SIGN
+        # Example object theObject / int modelId
+    })
+    OPTIONAL_BRACKETS = frozenset({
+        TokenType.OPTIONAL_START,
+        TokenType.OPTIONAL_END,
+    })
+    ARGUMENT_END_TOKENS = frozenset({
+        TokenType.COMMA_SIGN,
+        TokenType.VARARGS_SIGN,
+        TokenType.ARGUMENT_END,
+    })
+
     @staticmethod
     def split(code: str, chars_to_split):
         """
@@ -121,14 +158,7 @@ class SignatureTokenizer:
             self.tokenized[index - 1].type = self.TokenType.FUNCTION_NAME
             for i in range(0, index - 1):
                 in_token = self.tokenized[i]
-                if in_token.type in {
-                    self.TokenType.TYPE_UNION_SIGN,  # Example: table/xmlnode
-                    self.TokenType.COMMA_SIGN,
-                    # Example: STRING, STRING getPedAnimation ( ped thePed )
-                    self.TokenType.OPTIONAL_START,
-                    self.TokenType.OPTIONAL_END,
-                    # Example: INT, INT [, INT] dxGetMaterialSize
-                }:
+                if in_token.type in self.RETURN_SEPARATORS:
                     continue
 
                 # Variable return values. Example: VAR... call
@@ -143,126 +173,146 @@ class SignatureTokenizer:
 
     def default_value_tokenize(self):
         """
-        After equal sign there is always a default value
+        After equal sign there is always a default value.
+        The value is marked in the same pass, the tokens are walked once
         """
-        for index, token in enumerate(self.tokenized):
+        index = 0
+        while index < len(self.tokenized):
+            token = self.tokenized[index]
             if token.type != self.TokenType.EQUAL_SIGN:
+                index += 1
                 continue
 
-            if self.tokenized[index + 1].type != self.TokenType.DEFAULT_VALUE:
-                self.token_should_have_type(self.tokenized[index + 1],
-                                            self.TokenType.UNDEFINED)
-            self.tokenized[index + 1].type = self.TokenType.DEFAULT_VALUE
+            if index + 2 >= len(self.tokenized):
+                raise SignatureTokenizerError(
+                    f'Default value is not finished on position {index}. '
+                    f'Function signature:\n{self.code}')
+
+            value = self.tokenized[index + 1]
+            if value.type != self.TokenType.DEFAULT_VALUE:
+                self.token_should_have_type(value, self.TokenType.UNDEFINED)
+            value.type = self.TokenType.DEFAULT_VALUE
 
             # Default value is a function call. Example: getRootElement()
-            if self.tokenized[index + 2].type == self.TokenType.ARGUMENT_START:
-                for i in range(index + 3, len(self.tokenized)):
-                    in_token = self.tokenized[i]
-                    if in_token.type == self.TokenType.ARGUMENT_END:
-                        in_token.type = self.TokenType.DEFAULT_VALUE
-                        break
+            is_call = \
+                self.tokenized[index + 2].type == self.TokenType.ARGUMENT_START
+            # Default value is a formula. Example: vehiclesDistance * 2.14
+            is_formula = True
+            # Default value is a string. Commas and other
+            #   chars should be covered. Example: "world,vehicle,object,other"
+            is_string = value.value == '"'
 
-                    in_token.type = self.TokenType.DEFAULT_VALUE
+            equal_index = index
+            index += 2
+            while index < len(self.tokenized) \
+                    and (is_call or is_formula or is_string):
+                in_token = self.tokenized[index]
+                index += 1
 
-            # Default value is a formula. Example: vehiclesDistance * 2.14
-            for i in range(index + 2, len(self.tokenized)):
-                in_token = self.tokenized[i]
-                if in_token.type in {self.TokenType.COMMA_SIGN,
-                                     self.TokenType.ARGUMENT_END,
-                                     self.TokenType.OPTIONAL_END,
-                                     self.TokenType.OPTIONAL_START}:
-                    break
+                # The call covers everything up to the closing bracket
+                is_value = is_call
+                if is_call \
+                        and in_token.type == self.TokenType.ARGUMENT_END:
+                    is_call = False
 
-                in_token.type = self.TokenType.DEFAULT_VALUE
+                if is_formula and not is_value:
+                    if in_token.type in self.DEFAULT_VALUE_END:
+                        is_formula = False
+                    else:
+                        is_value = True
 
-            # Default value is a string. Commas and other
-            #   chars should be covered. Example: "world,vehicle,object,other"
-            if self.tokenized[index + 1].value == '"':
-                for i in range(index + 2, len(self.tokenized)):
-                    in_token = self.tokenized[i]
+                if is_string:
                     if in_token.value == '"':
-                        break
+                        is_string = False
+                    else:
+                        is_value = True
 
+                if is_value:
                     in_token.type = self.TokenType.DEFAULT_VALUE
 
+            if is_call or is_string:
+                raise SignatureTokenizerError(
+                    f'Default value on position {equal_index} is not closed. '
+                    f'Function signature:\n{self.code}')
+
     def arguments_tokenize(self):
         """
         Tokenizes function arguments.
         After comma sign expected: [optional start/optional end]
-          + type + argument name
+          + type + argument name.
+        Types and names are marked in the same pass, the tokens
+        are walked once
         """
         arguments = False
+        arguments_start = None
+        # The argument list is over (it is empty, or ends with a comma)
+        arguments_end = False
+        # Type of the next argument token.
+        #   None, if the argument is marked (or is not started)
+        current_type: Optional[SignatureTokenizer.TokenType] = None
 
         for index, token in enumerate(self.tokenized):
+            if current_type is not None:
+                if token.type in self.OPTIONAL_BRACKETS:
+                    continue
+
+                if token.type in self.ARGUMENT_END_TOKENS:
+                    # The separator is handled below
+                    current_type = None
+                elif token.type == self.TokenType.TYPE_UNION_SIGN \
+                        and current_type == self.TokenType.ARGUMENT_NAME:
+                    # Type unions. Example: "string / table"
+                    current_type = self.TokenType.ARGUMENT_TYPE
+                    continue
+                else:
+                    self.token_should_have_type(token,
+                                                self.TokenType.UNDEFINED)
+                    token.type = current_type
+
+                    if current_type == self.TokenType.ARGUMENT_TYPE:
+                        current_type = self.TokenType.ARGUMENT_NAME
+                    else:
+                        current_type = None
+                    continue
+
+            # ARGUMENT_NAME should be before the VARARGS_SIGN
+            # Example: [arguments...]
+            if token.type == self.TokenType.VARARGS_SIGN and index > 0 \
+                    and self.tokenized[index - 1].type == \
+                    self.TokenType.ARGUMENT_TYPE:
+                self.tokenized[index - 1].type = self.TokenType.ARGUMENT_NAME
+
             # Works only in round brackets
             #   (between TokenType.ARGUMENT_START and TokenType.ARGUMENT_END)
             if token.type == self.TokenType.ARGUMENT_START:
                 arguments = True
+                arguments_start = index
             if token.type == self.TokenType.ARGUMENT_END:
                 arguments = False
-            if not arguments:
+            if not arguments or arguments_end:
                 continue
 
-            # Key tokens
-            if token.type not in {
-                self.TokenType.COMMA_SIGN,  # ,
-                self.TokenType.ARGUMENT_START,  # (
-                self.TokenType.TYPE_UNION_SIGN
-                # Example object theObject / int modelId
-            }:
+            # Key tokens. The last one is reported as the not closed
+            #   argument list below
+            if token.type not in self.ARGUMENT_KEY_TOKENS \
+                    or index + 1 == len(self.tokenized):
                 continue
 
-            if token.type == self.TokenType.TYPE_UNION_SIGN and self.tokenized[
-                index + 1].type not in {
-                self.TokenType.UNDEFINED
-            }:
+            if token.type == self.TokenType.TYPE_UNION_SIGN \
+                    and self.tokenized[index + 1].type != \
+                    self.TokenType.UNDEFINED:
                 continue
 
             if self.tokenized[index + 1].type == self.TokenType.ARGUMENT_END:
-                break
-
-            current_type = self.TokenType.ARGUMENT_TYPE
-            for i in range(index + 1, len(self.tokenized)):
-                in_token = self.tokenized[i]
-                if in_token.type in {self.TokenType.OPTIONAL_START,
-                                     self.TokenType.OPTIONAL_END}:
-                    continue
-                if in_token.type in {
-                    self.TokenType.COMMA_SIGN,
-                    self.TokenType.VARARGS_SIGN,
-                    self.TokenType.ARGUMENT_END
-                }:
-                    break
-
-                # Type unions. Example: "string / table"
-                if in_token.type in {self.TokenType.TYPE_UNION_SIGN} \
-                        and current_type == self.TokenType.ARGUMENT_NAME:
-                    current_type = self.TokenType.ARGUMENT_TYPE
-                    continue
-
-                self.token_should_have_type(self.tokenized[i],
-                                            self.TokenType.UNDEFINED)
-                in_token.type = current_type
-
-                if current_type == self.TokenType.ARGUMENT_TYPE:
-                    current_type = self.TokenType.ARGUMENT_NAME
-                else:
-                    break
-
-        # ARGUMENT_NAME should be before the VARARGS_SIGN
-        # Example: [arguments...]
-        for index, token in enumerate(self.tokenized):
-            if token.type != self.TokenType.VARARGS_SIGN:
+                arguments_end = True
                 continue
 
-            if self.tokenized[index - 1].type == self.TokenType.ARGUMENT_TYPE:
-                self.tokenized[index - 1].type = self.TokenType.ARGUMENT_NAME
-
-            if token.type != self.TokenType.VARARGS_SIGN:
-                continue
+            current_type = self.TokenType.ARGUMENT_TYPE
 
-            if self.tokenized[index - 1].type == self.TokenType.ARGUMENT_TYPE:
-                self.tokenized[index - 1].type = self.TokenType.ARGUMENT_NAME
+        if arguments:
+            raise SignatureTokenizerError(
+                f'Arguments on position {arguments_start} are not closed. '
+                f'Function signature:\n{self.code}')
 
         # VARARGS_SIGN can be used in argument name
         # Example: int amount/weapon/model
@@ -281,10 +331,7 @@ class SignatureTokenizer:
             while i < len(self.tokenized):
                 # expected TYPE + NAME + UNION + TYPE + NAME + UNION + ... +
                 #   separator (bracket, comma)
-                separators = {self.TokenType.COMMA_SIGN,
-                              self.TokenType.ARGUMENT_END,
-                              self.TokenType.OPTIONAL_END,
-                              self.TokenType.OPTIONAL_START}
+                separators = self.DEFAULT_VALUE_END
                 if self.tokenized[i].type in separators:
                     break
 
@@ -309,21 +356,19 @@ class SignatureTokenizer:
     @staticmethod
     def concat_neighbours_tokenize(tokenized: List, allowed: Set):
         """
-        Concat neighbor tokens into a single one, if allowed
+        Concat neighbor tokens into a single one, if allowed.
+        The list is rebuilt in a single pass
         """
-        index = 0
-        while index < len(tokenized):
-            token = tokenized[index]
-            if token.type not in allowed:
-                index += 1
+        result = []
+        for token in tokenized:
+            if result and token.type in allowed \
+                    and result[-1].type == token.type:
+                result[-1].value += token.value
                 continue
 
-            if tokenized[index + 1].type == token.type:
-                token.value += tokenized[index + 1].value
-                tokenized.pop(index + 1)
-                continue
+            result.append(token)
 
-            index += 1
+        tokenized[:] = result
 
     def brackets_check(self, exception: bool = True):
         """
@@ -376,24 +421,28 @@ class SignatureTokenizer:
         )
         self.brackets_check(False)
 
-        # No UNDEFINED Tokens
-        for index, token in enumerate(self.tokenized):
-            if token.type != self.TokenType.UNDEFINED:
-                continue
-            raise SignatureTokenizerError(
-                'Undefined token. Function signature: \n' + self.code)
-
-        # Exactly one FUNCTION_NAME expected
+        # No UNDEFINED Tokens, exactly one FUNCTION_NAME expected
         function_name_counter = 0
-        for index, token in enumerate(self.tokenized):
-            if token.type != self.TokenType.FUNCTION_NAME:
-                continue
-            function_name_counter += 1
+        for token in self.tokenized:
+            if token.type == self.TokenType.UNDEFINED:
+                raise SignatureTokenizerError(
+                    'Undefined token. Function signature: \n' + self.code)
+            if token.type == self.TokenType.FUNCTION_NAME:
+                function_name_counter += 1
+
         if function_name_counter != 1:
             raise SignatureTokenizerError(
                 'Expected only one FUNCTION_NAME. '
                 'Function signature: \n' + self.code)
 
+        # Nothing but brackets is expected after the arguments.
+        #   Example of a stray quote: bool f ( int x ) "
+        if self.tokenized[-1].type in {self.TokenType.DEFAULT_VALUE,
+                                       self.TokenType.ARGUMENT_NAME}:
+            raise SignatureTokenizerError(
+                f'Unexpected {self.tokenized[-1].type} at the end. '
+                f'Function signature: \n{self.code}')
+
         # ARGUMENT_TYPE => ARGUMENT_TYPE + [UNION_TYPE SIGN + ARGUMENT_TYPE]
         #   + ARGUMENT_NAME in pair expected
         for index, token in enumerate(self.tokenized):
@@ -625,3 +674,55 @@ class SignatureParser:
             arguments=self.get_arguments(),
             return_types=self.get_returns(),
         )
+
+
+class SignatureMemo:
+    """
+    LRU memo of the tokenized and parsed signatures.
+    Key is the cleaned code. Many wiki signatures are identical
+    (shared client/server pages, for example)
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        :param maxsize: Maximum amount of memorized signatures
+        """
+        self.maxsize = maxsize
+        # <code, (tokens, signature)>
+        self.entries: OrderedDict = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def parse(self, code: str) -> \
+            Tuple[List[SignatureTokenizer.Token], FunctionSignature]:
+        """
+        Tokenizes and parses the code, or takes the result from the memo
+        :return: Tokens (should not be changed) and a signature.
+         The signature is a deep copy, it can be changed
+        """
+        entry = self.entries.get(code)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(code)
+        else:
+            self.misses += 1
+            tokenized = SignatureTokenizer(code).tokenize()
+            entry = tokenized, SignatureParser(tokenized=tokenized).parse()
+
+            self.entries[code] = entry
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+        tokenized, signature = entry
+        return tokenized, deepcopy(signature)
+
+    def get_stats(self) -> str:
+        return (f'hits \u001b[34m{self.hits}\u001b[0m, '
+                f'misses \u001b[34m{self.misses}\u001b[0m, '
+                f'hit rate \u001b[34m{self.hit_rate:.0%}\u001b[0m')
@@ -0,0 +1,25 @@
+from to_python.core.cache import ParseCache, ParseCacheEntry
+from to_python.core.types import CompoundFunctionData
+
+
+def test_parse_cache_round_trip(tmp_path):
+    cache = ParseCache(str(tmp_path), salt='1')
+    key = cache.get_key('functions', 'getPedArmor', 'raw text')
+
+    assert cache.load(key) is None
+
+    entry = ParseCacheEntry(parsed=CompoundFunctionData(server=[], client=[]))
+    cache.save(key, entry)
+
+    assert cache.load(key) == entry
+
+
+def test_parse_cache_key():
+    cache = ParseCache('', salt='1')
+    key = cache.get_key('functions', 'getPedArmor', 'raw text')
+
+    assert key == cache.get_key('functions', 'getPedArmor', 'raw text')
+    assert key != cache.get_key('functions', 'getPedArmor', 'raw text 2')
+    assert key != cache.get_key('events', 'getPedArmor', 'raw text')
+    assert key != ParseCache('', salt='2').get_key(
+        'functions', 'getPedArmor', 'raw text')
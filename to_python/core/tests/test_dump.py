@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from to_python.core.dump import DumpStorage, DumpSchemaError
+from to_python.core.types import CompoundFunctionData, CompoundOOPData, \
+    FunctionData, FunctionSignature, FunctionReturnTypes, FunctionType, \
+    FunctionArgumentValues, FunctionArgument, FunctionDoc, FunctionOOP
+
+FUNCTION = FunctionData(
+    signature=FunctionSignature(
+        name='getPedArmor',
+        return_types=FunctionReturnTypes(
+            return_types=[FunctionType(names=['float'], is_optional=False)],
+            variable_length=False,
+        ),
+        arguments=FunctionArgumentValues(
+            arguments=[[FunctionArgument(
+                name='thePed',
+                argument_type=FunctionType(names=['ped'], is_optional=False),
+                default_value=None,
+            )]],
+            variable_length=False,
+        ),
+    ),
+    docs=FunctionDoc(description='Gets the armor',
+                     arguments=dict(thePed='The ped'),
+                     result='Armor'),
+    url='getPedArmor',
+)
+
+
+def test_dump_storage_round_trip(tmp_path):
+    storage = DumpStorage(str(tmp_path))
+    assert storage.load('functions') is None
+
+    functions = [CompoundFunctionData(server=[FUNCTION], client=[FUNCTION])]
+    oops = [CompoundOOPData(server=[FunctionOOP(
+        description=None,
+        class_name='ped',
+        base_function_name='getPedArmor',
+        method=FUNCTION,
+        field=None,
+        is_static=False,
+    )], client=[])]
+
+    storage.save_category('functions', 'ped_functions', functions)
+    storage.save_index('functions', ['ped_functions'])
+    storage.save_category('oops', 'ped_functions', oops)
+    storage.save_index('oops', ['ped_functions'])
+
+    assert storage.load_index() == dict(functions=['ped_functions'],
+                                        oops=['ped_functions'])
+    assert storage.load('functions') == functions
+    assert storage.load('oops') == oops
+    assert storage.load('events') == []
+
+    assert storage.load('functions', categories=['ped_functions']) == \
+        functions
+    assert storage.load('functions', categories=['vehicle_functions']) == []
+
+
+def test_dump_storage_schema_version(tmp_path):
+    storage = DumpStorage(str(tmp_path))
+    with open(storage.get_index_path(), 'w') as file:
+        json.dump(dict(version=0, categories=dict()), file)
+
+    with pytest.raises(DumpSchemaError):
+        storage.load_index()
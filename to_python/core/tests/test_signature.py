@@ -1,6 +1,7 @@
 import pytest
 
-from to_python.core.signature import SignatureTokenizer, SignatureParser
+from to_python.core.signature import SignatureTokenizer, SignatureParser, \
+    SignatureMemo, SignatureTokenizerError
 from to_python.core.tests.utils import compare_lists
 from to_python.core.types import FunctionSignature, FunctionReturnTypes, \
     FunctionType, FunctionArgument, \
@@ -1034,6 +1035,27 @@ def test_signature_tokenizer_function(code, expected):
     compare_lists(SignatureTokenizer(code).tokenize(), expected)
 
 
+@pytest.mark.parametrize("code", [
+    # Not closed string default value
+    'int getElementModel ( string modelId = " ] )',
+    # Not closed function call default value
+    'bool setElementParent ( element theElement = getRootElement( )',
+    'bool setElementParent ( element theElement = getRootElement(',
+    # Not closed argument list
+    'string, string getPedAnimation( ped thePed',
+    'bool isPedDead ( ped thePed ,',
+    'bool isPedDead ( ped thePed [ , int x ]',
+    # Stray quote after the arguments
+    'bool isPedDead ( ped thePed ) "',
+    # Not finished default value
+    'bool setElementAlpha ( element theElement, int alpha =',
+    'bool setElementAlpha ( element theElement, int alpha = 255',
+])
+def test_signature_tokenizer_malformed(code):
+    with pytest.raises(SignatureTokenizerError):
+        SignatureTokenizer(code).tokenize()
+
+
 @pytest.mark.parametrize("code,expected", [
     (
             'string mixed/texture [,int...] synthetic '
@@ -1187,3 +1209,22 @@ def test_signature_parser(code, expected):
     result = SignatureParser(tokenized).parse()
 
     assert result == expected
+
+
+def test_signature_memo():
+    code = 'bool setElementData ( element theElement, string key, var value )'
+    memo = SignatureMemo(maxsize=1)
+
+    _, first = memo.parse(code)
+    _, second = memo.parse(code)
+    assert (memo.hits, memo.misses) == (1, 1)
+    assert first == second
+
+    # Returned signatures are independent
+    first.arguments.arguments[0][0].name = 'changed'
+    assert second.arguments.arguments[0][0].name == 'theElement'
+    assert memo.parse(code)[1] == second
+
+    memo.parse('int getPedArmor ( ped thePed )')
+    memo.parse(code)
+    assert (memo.hits, memo.misses) == (2, 3)
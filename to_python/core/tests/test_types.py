@@ -1,4 +1,8 @@
-from to_python.core.types import CompoundFunctionData
+from copy import deepcopy
+
+from to_python.core.types import CompoundFunctionData, FunctionData, \
+    FunctionSignature, FunctionReturnTypes, FunctionType, \
+    FunctionArgumentValues, FunctionArgument, FunctionGeneric, FunctionDoc
 
 
 def test_compound_function_data():
@@ -7,3 +11,44 @@ def test_compound_function_data():
 
     data = CompoundFunctionData(server=[], client=[''])
     assert [side for side, _ in data] == ['client']
+
+
+def test_function_data_deepcopy():
+    data = FunctionData(
+        signature=FunctionSignature(
+            name='setTimer',
+            return_types=FunctionReturnTypes(
+                return_types=[FunctionType(names=['timer'],
+                                           is_optional=False)],
+                variable_length=False,
+            ),
+            arguments=FunctionArgumentValues(
+                arguments=[[FunctionArgument(
+                    name='timeInterval',
+                    argument_type=FunctionType(names=['int'],
+                                               is_optional=True),
+                    default_value='50',
+                )]],
+                variable_length=True,
+            ),
+            generic_types=[FunctionGeneric(name='T', extends=None,
+                                           default_value=None)],
+        ),
+        docs=FunctionDoc(description='Creates a timer',
+                         arguments={'timeInterval': 'Interval'},
+                         result='Timer'),
+        url='setTimer',
+    )
+
+    copied = deepcopy(data)
+    assert copied == data
+
+    copied.signature.arguments.arguments[0][0].argument_type.names.append('a')
+    copied.signature.return_types.return_types[0].is_optional = True
+    copied.signature.generic_types[0].name = 'K'
+    copied.docs.arguments['timeInterval'] = ''
+    assert data.signature.arguments.arguments[0][0].argument_type.names == \
+        ['int']
+    assert not data.signature.return_types.return_types[0].is_optional
+    assert data.signature.generic_types[0].name == 'T'
+    assert data.docs.arguments['timeInterval'] == 'Interval'
@@ -0,0 +1,35 @@
+import wikitextparser as wtp
+
+from to_python.core.wiki import WikiSectionIndex
+
+PAGE = '''Description
+==Syntax==
+<syntaxhighlight lang="lua">int getPedArmor ( ped thePed )</syntaxhighlight>
+===Required Arguments===
+* thePed: The ped
+===Returns===
+Returns an int
+==Example==
+Example
+'''
+
+
+def test_wiki_section_index_find():
+    index = WikiSectionIndex(wtp.parse(PAGE))
+
+    assert [i for _, i in index.find('syntax')] == [1]
+    assert [i for _, i in index.find('argument')] == [2]
+    assert index.find('see also') == []
+
+    # Search results are memorized, but returned as a copy
+    index.find('syntax').clear()
+    assert [i for _, i in index.find('syntax')] == [1]
+
+
+def test_wiki_section_index_get_text():
+    index = WikiSectionIndex(wtp.parse(PAGE))
+    section, section_index = index.find('returns')[0]
+
+    assert index.get_text(section.span[0], section_index) == \
+        '===Returns===\nReturns an int\n'
+    assert index.get_text(0, len(index.sections) - 1) == PAGE
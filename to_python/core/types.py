@@ -1,11 +1,30 @@
 import abc
-from copy import copy
-from dataclasses import dataclass, field
+import sys
+from copy import copy, deepcopy
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Optional, Any
 
 from crawler.core.types import ListType
 
 
+def dataclass_slots(cls: type) -> type:
+    """
+    Recreates the dataclass with __slots__, so instances have no __dict__.
+    `dataclass(slots=True)` is not available before Python 3.10.
+    Should be applied above the @dataclass decorator
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = names
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionType:
     """
@@ -24,7 +43,23 @@ class FunctionType:
         return FunctionType(names=copy(self.names),
                             is_optional=self.is_optional)
 
+    def __deepcopy__(self, memo):
+        return FunctionType(names=list(self.names),
+                            is_optional=self.is_optional)
+
+    def to_dict(self) -> dict:
+        return dict(names=self.names,
+                    is_optional=self.is_optional)
 
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionType':
+        # Type names repeat through the whole dump
+        return FunctionType(names=[sys.intern(name)
+                                   for name in data['names']],
+                            is_optional=data['is_optional'])
+
+
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionArgument:
     """
@@ -46,7 +81,30 @@ class FunctionArgument:
                                 argument_type=copy(self.argument_type),
                                 default_value=self.default_value)
 
+    def __deepcopy__(self, memo):
+        return FunctionArgument(name=self.name,
+                                argument_type=deepcopy(self.argument_type,
+                                                       memo),
+                                default_value=self.default_value)
+
+    def to_dict(self) -> dict:
+        return dict(name=self.name,
+                    argument_type=None if self.argument_type is None
+                    else self.argument_type.to_dict(),
+                    default_value=self.default_value)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionArgument':
+        argument_type = data['argument_type']
+        return FunctionArgument(
+            name=data['name'],
+            argument_type=None if argument_type is None
+            else FunctionType.from_dict(argument_type),
+            default_value=data['default_value'],
+        )
+
 
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionArgumentValues:
     """
@@ -76,7 +134,28 @@ class FunctionArgumentValues:
         return FunctionArgumentValues(arguments=copy(self.arguments),
                                       variable_length=self.variable_length)
 
+    def __deepcopy__(self, memo):
+        return FunctionArgumentValues(
+            arguments=[[deepcopy(argument, memo) for argument in v]
+                       for v in self.arguments],
+            variable_length=self.variable_length,
+        )
+
+    def to_dict(self) -> dict:
+        return dict(arguments=[[argument.to_dict() for argument in v]
+                               for v in self.arguments],
+                    variable_length=self.variable_length)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionArgumentValues':
+        return FunctionArgumentValues(
+            arguments=[[FunctionArgument.from_dict(argument) for argument in v]
+                       for v in data['arguments']],
+            variable_length=data['variable_length'],
+        )
 
+
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionReturnTypes:
     """
@@ -99,7 +178,26 @@ class FunctionReturnTypes:
         return FunctionReturnTypes(return_types=copy(self.return_types),
                                    variable_length=self.variable_length)
 
+    def __deepcopy__(self, memo):
+        return FunctionReturnTypes(
+            return_types=[deepcopy(v, memo) for v in self.return_types],
+            variable_length=self.variable_length,
+        )
+
+    def to_dict(self) -> dict:
+        return dict(return_types=[v.to_dict() for v in self.return_types],
+                    variable_length=self.variable_length)
 
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionReturnTypes':
+        return FunctionReturnTypes(
+            return_types=[FunctionType.from_dict(v)
+                          for v in data['return_types']],
+            variable_length=data['variable_length'],
+        )
+
+
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionGeneric:
     """
@@ -116,7 +214,24 @@ class FunctionGeneric:
                         default_value={repr(self.default_value)},
                     )'''
 
+    def __deepcopy__(self, memo):
+        return FunctionGeneric(name=self.name,
+                               extends=self.extends,
+                               default_value=self.default_value)
+
+    def to_dict(self) -> dict:
+        return dict(name=self.name,
+                    extends=self.extends,
+                    default_value=self.default_value)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionGeneric':
+        return FunctionGeneric(name=data['name'],
+                               extends=data['extends'],
+                               default_value=data['default_value'])
+
 
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionSignature:
     """
@@ -143,7 +258,32 @@ class FunctionSignature:
                                  return_types=copy(self.return_types),
                                  arguments=copy(self.arguments))
 
+    def __deepcopy__(self, memo):
+        return FunctionSignature(
+            name=self.name,
+            return_types=deepcopy(self.return_types, memo),
+            arguments=deepcopy(self.arguments, memo),
+            generic_types=[deepcopy(v, memo) for v in self.generic_types],
+        )
+
+    def to_dict(self) -> dict:
+        return dict(name=self.name,
+                    return_types=self.return_types.to_dict(),
+                    arguments=self.arguments.to_dict(),
+                    generic_types=[v.to_dict() for v in self.generic_types])
+
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionSignature':
+        return FunctionSignature(
+            name=data['name'],
+            return_types=FunctionReturnTypes.from_dict(data['return_types']),
+            arguments=FunctionArgumentValues.from_dict(data['arguments']),
+            generic_types=[FunctionGeneric.from_dict(v)
+                           for v in data['generic_types']],
+        )
+
 
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionDoc:
     """
@@ -169,7 +309,24 @@ class FunctionDoc:
                 result={repr(self.result)} ,
             )'''
 
+    def __deepcopy__(self, memo):
+        return FunctionDoc(description=self.description,
+                           arguments=dict(self.arguments),
+                           result=self.result)
+
+    def to_dict(self) -> dict:
+        return dict(description=self.description,
+                    arguments=self.arguments,
+                    result=self.result)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionDoc':
+        return FunctionDoc(description=data['description'],
+                           arguments=data['arguments'],
+                           result=data['result'])
+
 
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionOOPField:
     """
@@ -192,7 +349,23 @@ class FunctionOOPField:
         return FunctionOOPField(name=self.name,
                                 types=copy(self.types))
 
+    def __deepcopy__(self, memo):
+        return FunctionOOPField(name=self.name,
+                                types=[deepcopy(v, memo) for v in self.types])
+
+    def to_dict(self) -> dict:
+        return dict(name=self.name,
+                    types=[v.to_dict() for v in self.types])
+
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionOOPField':
+        return FunctionOOPField(
+            name=data['name'],
+            types=[FunctionType.from_dict(v) for v in data['types']],
+        )
+
 
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionOOP:
     """
@@ -220,7 +393,40 @@ class FunctionOOP:
                 is_static={self.is_static},
             )'''
 
+    def __deepcopy__(self, memo):
+        return FunctionOOP(description=self.description,
+                           class_name=self.class_name,
+                           base_function_name=self.base_function_name,
+                           method=deepcopy(self.method, memo),
+                           field=deepcopy(self.field, memo),
+                           is_static=self.is_static)
+
+    def to_dict(self) -> dict:
+        return dict(description=self.description,
+                    class_name=self.class_name,
+                    base_function_name=self.base_function_name,
+                    method=None if self.method is None
+                    else self.method.to_dict(),
+                    field=None if self.field is None
+                    else self.field.to_dict(),
+                    is_static=self.is_static)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionOOP':
+        method = data['method']
+        oop_field = data['field']
+        return FunctionOOP(
+            description=data['description'],
+            class_name=data['class_name'],
+            base_function_name=data['base_function_name'],
+            method=None if method is None else FunctionData.from_dict(method),
+            field=None if oop_field is None
+            else FunctionOOPField.from_dict(oop_field),
+            is_static=data['is_static'],
+        )
 
+
+@dataclass_slots
 @dataclass(repr=False)
 class FunctionData:
     """
@@ -241,6 +447,24 @@ class FunctionData:
             url={repr(self.url)},
         )'''
 
+    def __deepcopy__(self, memo):
+        return FunctionData(signature=deepcopy(self.signature, memo),
+                            docs=deepcopy(self.docs, memo),
+                            url=self.url)
+
+    def to_dict(self) -> dict:
+        return dict(signature=self.signature.to_dict(),
+                    docs=self.docs.to_dict(),
+                    url=self.url)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'FunctionData':
+        return FunctionData(
+            signature=FunctionSignature.from_dict(data['signature']),
+            docs=FunctionDoc.from_dict(data['docs']),
+            url=data['url'],
+        )
+
 
 @dataclass(repr=False)
 class CompoundDataAbstract(metaclass=abc.ABCMeta):
@@ -281,6 +505,10 @@ class CompoundDataAbstract(metaclass=abc.ABCMeta):
 
         return None
 
+    def to_dict(self) -> dict:
+        return dict(server=[v.to_dict() for v in self.server],
+                    client=[v.to_dict() for v in self.client])
+
 
 @dataclass(repr=False)
 class CompoundFunctionData(CompoundDataAbstract):
@@ -290,6 +518,13 @@ class CompoundFunctionData(CompoundDataAbstract):
     server: List[FunctionData] = field(default_factory=list)
     client: List[FunctionData] = field(default_factory=list)
 
+    @staticmethod
+    def from_dict(data: dict) -> 'CompoundFunctionData':
+        return CompoundFunctionData(
+            server=[FunctionData.from_dict(v) for v in data['server']],
+            client=[FunctionData.from_dict(v) for v in data['client']],
+        )
+
 
 @dataclass(repr=False)
 class CompoundOOPData(CompoundDataAbstract):
@@ -299,7 +534,15 @@ class CompoundOOPData(CompoundDataAbstract):
     server: List[FunctionOOP] = field(default_factory=list)
     client: List[FunctionOOP] = field(default_factory=list)
 
+    @staticmethod
+    def from_dict(data: dict) -> 'CompoundOOPData':
+        return CompoundOOPData(
+            server=[FunctionOOP.from_dict(v) for v in data['server']],
+            client=[FunctionOOP.from_dict(v) for v in data['client']],
+        )
+
 
+@dataclass_slots
 @dataclass(repr=False)
 class EventData:
     """
@@ -316,6 +559,24 @@ class EventData:
             arguments={repr(self.arguments)},
         )'''
 
+    def __deepcopy__(self, memo):
+        return EventData(arguments=deepcopy(self.arguments, memo),
+                         docs=deepcopy(self.docs, memo),
+                         name=self.name)
+
+    def to_dict(self) -> dict:
+        return dict(arguments=self.arguments.to_dict(),
+                    docs=self.docs.to_dict(),
+                    name=self.name)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'EventData':
+        return EventData(
+            arguments=FunctionArgumentValues.from_dict(data['arguments']),
+            docs=FunctionDoc.from_dict(data['docs']),
+            name=data['name'],
+        )
+
 
 @dataclass(repr=False)
 class CompoundEventData(CompoundDataAbstract):
@@ -324,3 +585,10 @@ class CompoundEventData(CompoundDataAbstract):
     """
     server: List[EventData] = field(default_factory=list)
     client: List[EventData] = field(default_factory=list)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'CompoundEventData':
+        return CompoundEventData(
+            server=[EventData.from_dict(v) for v in data['server']],
+            client=[EventData.from_dict(v) for v in data['client']],
+        )
@@ -0,0 +1,56 @@
+from typing import List, Tuple, Dict, Optional
+
+from wikitextparser import WikiText, Section
+
+
+class WikiSectionIndex:
+    """
+    Sections of a one wiki page (or a part of the page).
+    Built once per page and shared by the extraction filters:
+    the page string, the section list and the section titles
+    are computed once, title searches are memorized
+    """
+
+    def __init__(self, wiki: WikiText):
+        self.wiki = wiki
+
+        # str(wiki) rebuilds the string from the parser tree
+        self.text = str(wiki)
+        self.sections: List[Section] = wiki.sections
+        self.titles: List[Optional[str]] = [
+            section.title.lower() if section.title else None
+            for section in self.sections
+        ]
+
+        # <title part, [(section, index)]>
+        self.found: Dict[str, List[Tuple[Section, int]]] = dict()
+
+    def find(self, expected: str) -> List[Tuple[Section, int]]:
+        """
+        Finds sections, which title contains the expected string
+        (in lower case)
+        :return: List of <section, section index>
+        """
+        if expected not in self.found:
+            self.found[expected] = [
+                (self.sections[index], index)
+                for index, title in enumerate(self.titles)
+                if title and expected in title
+            ]
+
+        return list(self.found[expected])
+
+    def get_text(self, start_index: int, section_index: int) -> str:
+        """
+        :param start_index: Start position in the page string
+        :param section_index: Index of the section.
+         Text ends at the next section
+        :return: Page text from the start position
+         to the end of the section
+        """
+        if section_index + 1 < len(self.sections):
+            end_index = self.sections[section_index + 1].span[0]
+        else:
+            end_index = len(self.text)
+
+        return self.text[start_index:end_index]
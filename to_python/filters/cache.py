@@ -0,0 +1,100 @@
+from to_python.core.cache import ParseCacheEntry
+from to_python.core.filter import FilterPageAbstract
+
+
+class FilterLoadParseCache(FilterPageAbstract):
+    """
+    Loads parse results of the unchanged pages from the parse cache.
+    Cached pages are removed from context.parsed and context.raw_data,
+    so the parsing filters skip them
+    """
+
+    def __init__(self, context_type: str):
+        """
+        :param context_type: `functions` or `events`
+        """
+        super().__init__(context_type)
+
+    def process(self, name: str):
+        cache = self.context.cache
+        if cache is None:
+            return
+
+        key = cache.get_key(self.context_type, name,
+                            self.context_data.raw_data[name])
+        self.context_data.cache_keys[name] = key
+
+        entry = cache.load(key)
+        if entry is None:
+            return
+
+        self.context_data.cached[name] = entry
+        del self.context_data.parsed[name]
+        del self.context_data.raw_data[name]
+
+    def finish(self):
+        if self.context.cache is None:
+            return
+
+        print(
+            f'Loaded from parse cache (context '
+            f'\u001b[34m{self.context_type}\u001b[0m): \u001b[34m'
+            f'{len(self.context_data.cached)}\u001b[0m of \u001b[34m'
+            f'{len(self.context_data.cache_keys)}\u001b[0m items\u001b[0m'
+        )
+
+
+class FilterSaveParseCache(FilterPageAbstract):
+    """
+    Saves parse results of the parsed pages into the parse cache.
+    Merges cached pages back into context.parsed (and context.oops)
+    in the original order
+    """
+
+    def __init__(self, context_type: str):
+        """
+        :param context_type: `functions` or `events`
+        """
+        super().__init__(context_type)
+
+    def process(self, name: str):
+        if self.context.cache is None:
+            return
+
+        self.context.cache.save(
+            self.context_data.cache_keys[name],
+            ParseCacheEntry(parsed=self.context_data.parsed[name],
+                            oop=self.context.oops.get(name)
+                            if self.context_type == 'functions'
+                            else None)
+        )
+
+    def merge_cached(self):
+        parsed = self.context_data.parsed
+        cached = self.context_data.cached
+
+        self.context_data.parsed = {
+            name: cached[name].parsed if name in cached else parsed[name]
+            for name in self.context_data.cache_keys
+        }
+
+        if self.context_type != 'functions':
+            return
+
+        oops = self.context.oops
+        self.context.oops = dict()
+        for name in self.context_data.cache_keys:
+            oop = cached[name].oop if name in cached else oops.get(name)
+            if oop is not None:
+                self.context.oops[name] = oop
+
+    def finish(self):
+        if self.context.cache is None:
+            return
+
+        self.merge_cached()
+
+        print(
+            f'Saved into parse cache (context '
+            f'\u001b[34m{self.context_type}\u001b[0m)\u001b[0m'
+        )
@@ -1,15 +1,18 @@
 import glob
 import os
-from typing import List
+from typing import List, Tuple
 
+from crawler.core.storage import PageStorage
 from to_python.core.filter import FilterAbstract
 
 
 class FilterCollectDumpFiles(FilterAbstract):
     """
-    Accumulates all files inside DUMP_DIRECTORY into context.functions
+    Accumulates all files inside DUMP_DIRECTORY into context.functions.
+    Uses the storage manifest, if pages are stored as content-addressed blobs
     """
 
+    DUMP_ROOT = '../crawler/dump_html'
     DUMP_DIRECTORY = dict(functions='../crawler/dump_html/functions/**',
                           events='../crawler/dump_html/events/**')
 
@@ -27,9 +30,26 @@ class FilterCollectDumpFiles(FilterAbstract):
             if '__pycache__' not in f
         ]
 
+    def get_page_list(self) -> List[Tuple[str, str]]:
+        """
+        :return: List of <page name, file path>
+        """
+        manifest = PageStorage.load_manifest(self.DUMP_ROOT,
+                                             self.context_type)
+        if manifest is not None:
+            return [
+                (name, os.path.join(self.DUMP_ROOT, manifest[name]))
+                for name in manifest
+            ]
+
+        return [
+            (os.path.basename(file), file)
+            for file in self.get_file_list()
+        ]
+
     def apply(self):
-        for file in self.get_file_list():
-            function_name = self.function_name(os.path.basename(file))
+        for page_name, file in self.get_page_list():
+            function_name = self.function_name(page_name)
 
             # Skip function if it is not defined
             # in the __init__.py declaration list
@@ -5,11 +5,12 @@ from typing import Dict, Optional, Tuple, List
 
 from wikitextparser import WikiText, Section
 
-from to_python.core.filter import FilterAbstract
+from to_python.core.filter import FilterPageAbstract
 from to_python.core.types import FunctionDoc
+from to_python.core.wiki import WikiSectionIndex
 
 
-class FilterParseDocs(FilterAbstract):
+class FilterParseDocs(FilterPageAbstract):
     """
     Parse function documentation
     """
@@ -30,53 +31,48 @@ class FilterParseDocs(FilterAbstract):
 
         return arg_sections
 
+    CLEAN_LINE_REGEX = re.compile(r'[\[\]\'\"]')
+
+    # Lines without documentation: empty lines, headers, comments,
+    #   templates, links, "None" and "no arguments" notes
+    SKIP_LINE_REGEX = re.compile(
+        r'(?:$|}}$|=|<!--|.*-->$|\{\{|\[\[.+\]\]$'
+        r'|.?.?.?none|.+no arguments.+)',
+        re.IGNORECASE
+    )
+
+    NOTOC_REGEX = re.compile(r'__NOTOC__\n?', re.IGNORECASE)
+
     @staticmethod
     def clean_line(line: str) -> str:
-        return re.sub(r'[\[\]\'\"]', '', line).strip()
+        return FilterParseDocs.CLEAN_LINE_REGEX.sub('', line).strip()
 
     @staticmethod
     def section_line_can_be_skipped(line: str) -> bool:
-        if line == '' or line == '}}':
-            return True
-
-        if line.startswith('=') \
-                or line.startswith('<!--') \
-                or line.endswith('-->'):
-            return True
-
-        if re.match(r'^\{\{.*\}?\}?$', line):
-            return True
-
-        if re.match(r'^\[\[.+\]\]$', line):
-            return True
-
-        if re.match(r'.?.?.?None', line, re.IGNORECASE):
-            return True
-
-        if re.match(r'.+no arguments.+', line, re.IGNORECASE):
-            return True
+        """
+        :param line: Stripped line
+        """
+        return FilterParseDocs.SKIP_LINE_REGEX.match(line) is not None
 
     @staticmethod
     def filter_raw_text(raw: str) -> str:
-        result = ''
-        for line in raw.split('\n'):
-            line = line.strip()
-            if FilterParseDocs.section_line_can_be_skipped(line):
-                continue
-            result += FilterParseDocs.clean_line(line) + '\n'
+        result = [
+            FilterParseDocs.clean_line(line)
+            for line in map(str.strip, raw.split('\n'))
+            if not FilterParseDocs.section_line_can_be_skipped(line)
+        ]
 
-        return result.strip()
+        return '\n'.join(result).strip()
 
-    def get_return_docs(self, f_name: str, raw: str, wiki: WikiText) -> str:
+    def get_return_docs(self, f_name: str, raw: str,
+                        index: WikiSectionIndex) -> str:
         """
         Accumulates documentation about returning value
         """
-        arg_sections = self.get_sections_title_contains(wiki, 'return')
+        arg_sections = index.find('return')
 
-        result = ''
-        for section, _ in arg_sections:
-            content = str(section).lower()
-            result += content + '\n'
+        result = '\n'.join(str(section).lower()
+                           for section, _ in arg_sections)
 
         return self.filter_raw_text(result)
 
@@ -88,7 +84,8 @@ class FilterParseDocs(FilterAbstract):
         Parses single section to arguments dictionary and misc
         :return: Dictionary <argument name, docs> and misc (undetermined)
         """
-        result = dict()
+        # Lines of the arguments docs
+        result: Dict[str, List[str]] = dict()
         misc = ''
 
         name: Optional[str] = None
@@ -98,7 +95,7 @@ class FilterParseDocs(FilterAbstract):
             if self.section_line_can_be_skipped(line):
                 continue
 
-            arg_name = re.search(self.ARG_NAME_REGEX, line)
+            arg_name = self.ARG_NAME_REGEX.search(line)
             if arg_name is None:
                 if name is None:
                     if 'optional' not in section.title.lower():
@@ -110,7 +107,7 @@ class FilterParseDocs(FilterAbstract):
 
                     continue
 
-                result[name] += line + '\n'
+                result[name].append(line)
                 continue
 
             name = arg_name.group(1)
@@ -119,14 +116,15 @@ class FilterParseDocs(FilterAbstract):
             line = line[arg_name.end():].strip()
             line = self.clean_line(line)
 
-            result[name] = line + '\n'
+            result[name] = [line]
 
-        for key in result:
-            result[key] = result[key].strip()
+        return {
+            key: '\n'.join(lines).strip()
+            for key, lines in result.items()
+        }, misc
 
-        return result, misc
-
-    def get_args_docs(self, f_name: str, raw: str, wiki: WikiText) -> \
+    def get_args_docs(self, f_name: str, raw: str,
+                      index: WikiSectionIndex) -> \
             Tuple[Dict[str, str], str]:
         """
         Accumulates arguments description
@@ -134,26 +132,26 @@ class FilterParseDocs(FilterAbstract):
         from to_python.filters.data_list.signature import \
             FilterParseFunctionSignature
 
-        arg_sections = self.get_sections_title_contains(wiki, 'argument')
+        arg_sections = index.find('argument')
         if not arg_sections:
-            arg_sections = deepcopy(
-                self.get_sections_title_contains(wiki, 'parameters'))
+            # Sections are shared with other filters, change a copy
+            arg_sections = deepcopy(index.find('parameters'))
 
             # Clear section from code
             for section_info in arg_sections:
                 section_info[0].contents = \
-                    re.sub(FilterParseFunctionSignature.SELECT_CODE_REGEX, "",
-                           section_info[0].contents)
+                    FilterParseFunctionSignature.SELECT_CODE_REGEX.sub(
+                        '', section_info[0].contents)
 
         result = dict()
-        misc_doc = ''
+        misc_doc = []
         # TODO: filter code for events parameters
         for section, _ in arg_sections:
             partial, misc = self.parse_section_to_args(f_name, section)
-            misc_doc += misc + '\n'
+            misc_doc.append(misc)
             result.update(partial)
 
-        return result, self.filter_raw_text(misc_doc)
+        return result, self.filter_raw_text('\n'.join(misc_doc))
 
     def get_docs(self, wiki_raw, f_name: str) -> str:
         """
@@ -162,50 +160,49 @@ class FilterParseDocs(FilterAbstract):
         wiki = wiki_raw[f_name]
         description_raw = str(wiki.sections[0])
 
-        description_raw = re.sub(r'__NOTOC__\n?', '', description_raw,
-                                 re.IGNORECASE)
+        description_raw = self.NOTOC_REGEX.sub('', description_raw)
         description_raw = description_raw.replace(str(wiki.templates[0]), '')
         description_raw = description_raw.strip()
         return self.filter_raw_text(description_raw)
 
-    def apply(self):
-        for f_name in self.context_data.parsed:
-            raw_content = self.context_data.side_data[f_name]
-            wiki_content = self.context_data.wiki_side[f_name]
-            description = self.get_docs(self.context_data.wiki_raw, f_name)
-            if not description:
-                print(f'[ERROR] Page without a description: {f_name}',
-                      file=sys.stderr)
-
-            # TODO: refactor
-            if raw_content.client is not None:
-                return_doc = self.get_return_docs(f_name, raw_content.client,
-                                                  wiki_content.client)
-                args_doc, description_mixin = self.get_args_docs(
-                    f_name,
-                    raw_content.client,
-                    wiki_content.client
-                )
-                self.context_data.parsed[f_name].client[0].docs = FunctionDoc(
-                    description=(
-                            description + '\n' + description_mixin).strip(),
-                    arguments=args_doc,
-                    result=return_doc
-                )
-
-            if raw_content.server is not None:
-                return_doc = self.get_return_docs(f_name, raw_content.server,
-                                                  wiki_content.server)
-                args_doc, description_mixin = self.get_args_docs(
-                    f_name,
-                    raw_content.server,
-                    wiki_content.server
-                )
-                self.context_data.parsed[f_name].server[0].docs = FunctionDoc(
-                    description=(
-                            description + '\n' + description_mixin).strip(),
-                    arguments=args_doc,
-                    result=return_doc
-                )
-
+    def process(self, f_name: str):
+        raw_content = self.context_data.side_data[f_name]
+        wiki_content = self.context_data.wiki_index[f_name]
+        description = self.get_docs(self.context_data.wiki_raw, f_name)
+        if not description:
+            print(f'[ERROR] Page without a description: {f_name}',
+                  file=sys.stderr)
+
+        # TODO: refactor
+        if raw_content.client is not None:
+            return_doc = self.get_return_docs(f_name, raw_content.client,
+                                              wiki_content.client)
+            args_doc, description_mixin = self.get_args_docs(
+                f_name,
+                raw_content.client,
+                wiki_content.client
+            )
+            self.context_data.parsed[f_name].client[0].docs = FunctionDoc(
+                description=(
+                        description + '\n' + description_mixin).strip(),
+                arguments=args_doc,
+                result=return_doc
+            )
+
+        if raw_content.server is not None:
+            return_doc = self.get_return_docs(f_name, raw_content.server,
+                                              wiki_content.server)
+            args_doc, description_mixin = self.get_args_docs(
+                f_name,
+                raw_content.server,
+                wiki_content.server
+            )
+            self.context_data.parsed[f_name].server[0].docs = FunctionDoc(
+                description=(
+                        description + '\n' + description_mixin).strip(),
+                arguments=args_doc,
+                result=return_doc
+            )
+
+    def finish(self):
         print('Docs parse complete\u001b[0m')
@@ -1,8 +1,11 @@
-from to_python.core.filter import FilterAbstract
+from typing import List
+
+from crawler.core.storage import PageStorage
+from to_python.core.filter import FilterPageAbstract
 from to_python.core.types import CompoundFunctionData, CompoundEventData
 
 
-class FilterInitInternalList(FilterAbstract):
+class FilterInitInternalList(FilterPageAbstract):
     """
     Initializes context.parsed and fills context.raw_data
     """
@@ -15,8 +18,7 @@ class FilterInitInternalList(FilterAbstract):
 
     @staticmethod
     def read_file(filepath: str) -> str:
-        with open(filepath, encoding='UTF-8', newline='\n') as file:
-            return file.read()
+        return PageStorage.read_file(filepath)
 
     def initialize_parsed_value(self):
         if self.context_type == 'events':
@@ -24,10 +26,13 @@ class FilterInitInternalList(FilterAbstract):
         if self.context_type == 'functions':
             return CompoundFunctionData()
 
-    def apply(self):
-        for name in self.context_data.pages:
-            filepath = self.context_data.pages[name]
-            self.context_data.parsed[name] = self.initialize_parsed_value()
-            self.context_data.raw_data[name] = self.read_file(filepath)
+    def get_page_names(self) -> List[str]:
+        return list(self.context_data.pages)
+
+    def process(self, name: str):
+        filepath = self.context_data.pages[name]
+        self.context_data.parsed[name] = self.initialize_parsed_value()
+        self.context_data.raw_data[name] = self.read_file(filepath)
 
+    def finish(self):
         print('Internal list init complete\u001b[0m')
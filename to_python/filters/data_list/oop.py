@@ -1,19 +1,18 @@
 import re
-from copy import deepcopy
+from dataclasses import replace
 from typing import Optional, List
 
-from wikitextparser import WikiText
-
-from to_python.core.filter import FilterAbstract
+from to_python.core.filter import FilterPageAbstract
 from to_python.core.format import colorize_oop_token_list
 from to_python.core.oop import OOPTokenizer, OOPParser
 from to_python.core.types import FunctionOOP, CompoundOOPData, FunctionData, \
     FunctionReturnTypes, \
     FunctionOOPField
+from to_python.core.wiki import WikiSectionIndex
 from to_python.filters.data_list.signature import WikiGetSyntaxSection
 
 
-class FilterParseFunctionOOP(FilterAbstract):
+class FilterParseFunctionOOP(FilterPageAbstract):
     OOP_REGEX = re.compile(r'(\{\{OOP.*\}\})', re.IGNORECASE)
 
     def __init__(self):
@@ -22,14 +21,16 @@ class FilterParseFunctionOOP(FilterAbstract):
     @staticmethod
     def prepare_oop_method(oop_metadata: OOPParser.OutputData,
                            method: FunctionData) -> Optional[FunctionData]:
+        """
+        The method shares arguments, return types and docs
+        with the function data, only the signature is replaced
+        """
         method_name = oop_metadata.method_data.method_name
         if method_name is None:
             return None
 
-        method = deepcopy(method)
-        method.signature.name = method_name
-
-        return method
+        return replace(method,
+                       signature=replace(method.signature, name=method_name))
 
     @staticmethod
     def prepare_oop_field(oop_metadata: OOPParser.OutputData,
@@ -79,23 +80,23 @@ class FilterParseFunctionOOP(FilterAbstract):
         )]
 
     def pick_oop_container(self, f_name: str, raw_data: str,
-                           wiki: WikiText) -> str:
+                           index: WikiSectionIndex) -> str:
         """
         Picks media wiki code, containing OOP definition
         """
         syntax_picker = WikiGetSyntaxSection(self.context_data, f_name,
-                                             raw_data, wiki)
+                                             raw_data, index)
         syntax_picker.get()
         code_inside = syntax_picker.pick_text()
 
         return code_inside
 
-    def pick_oop(self, f_name: str, raw_data: str, wiki: WikiText) -> \
-            Optional[str]:
+    def pick_oop(self, f_name: str, raw_data: str,
+                 index: WikiSectionIndex) -> Optional[str]:
         """
         Picks out function signature code from an entire data
         """
-        container = self.pick_oop_container(f_name, raw_data, wiki)
+        container = self.pick_oop_container(f_name, raw_data, index)
 
         signature_match = re.search(self.OOP_REGEX, container)
         if signature_match is None:
@@ -114,26 +115,27 @@ class FilterParseFunctionOOP(FilterAbstract):
 
         return signature.strip()
 
-    def apply(self):
+    def start(self):
         print('\n\n ============ Parse OOP ============')
 
-        for f_name in self.context_data.parsed:
-            raw_content = self.context_data.side_data[f_name]
-            wiki_content = self.context_data.wiki_side[f_name]
-
-            data = CompoundOOPData(
-                client=self.parse_oop(
-                    self.pick_oop(f_name, raw_content.client,
-                                  wiki_content.client),
-                    self.context_data.parsed[f_name].client[0],
-                ) if raw_content.client is not None else [],
-                server=self.parse_oop(
-                    self.pick_oop(f_name, raw_content.server,
-                                  wiki_content.server),
-                    self.context_data.parsed[f_name].server[0],
-                ) if raw_content.server is not None else [],
-            )
+    def process(self, f_name: str):
+        raw_content = self.context_data.side_data[f_name]
+        wiki_content = self.context_data.wiki_index[f_name]
+
+        data = CompoundOOPData(
+            client=self.parse_oop(
+                self.pick_oop(f_name, raw_content.client,
+                              wiki_content.client),
+                self.context_data.parsed[f_name].client[0],
+            ) if raw_content.client is not None else [],
+            server=self.parse_oop(
+                self.pick_oop(f_name, raw_content.server,
+                              wiki_content.server),
+                self.context_data.parsed[f_name].server[0],
+            ) if raw_content.server is not None else [],
+        )
 
-            self.context.oops[f_name] = data
+        self.context.oops[f_name] = data
 
+    def finish(self):
         print('Function signature parsing complete\u001b[0m')
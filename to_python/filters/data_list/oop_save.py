@@ -5,6 +5,7 @@ from typing import DefaultDict, List, Set
 
 from crawler.filters.save_function_fetched import FilterSaveFetched
 from to_python.core.context import ContextData
+from to_python.core.dump import DumpStorage
 from to_python.core.filter import FilterAbstract
 from to_python.core.types import CompoundOOPData
 
@@ -19,6 +20,7 @@ class FilterSaveFunctionOOPData(FilterAbstract):
     """
     DUMP_FOLDER_ROOT = 'dump'
     DUMP_FOLDER = 'dump/oops'
+    DUMP_KIND = 'oops'
 
     def get_context_data(self) -> ContextData:
         return getattr(self.context, self.context_type)
@@ -49,6 +51,18 @@ class FilterSaveFunctionOOPData(FilterAbstract):
         name = re.sub(r'[ \]\[\-=+.,:;]', '_', name)
         return name.lower().strip()
 
+    def save_category_json(self, category: str):
+        """
+        Saves all parsed data for a single category as JSON
+        """
+        data_list = self.categories[category]
+
+        category = self.clean_file_name(category)
+        self.files_to_import.add(category)
+
+        DumpStorage(self.DUMP_FOLDER_ROOT).save_category(
+            self.DUMP_KIND, category, data_list)
+
     def save_category_data(self, category: str):
         """
         Saves all parsed data for a single category
@@ -124,14 +138,30 @@ DUMP_OOPS = [
                  self.get_context_data().urls]
             ))
 
+    def save_index(self):
+        """
+        Saves categories into the JSON dump index
+        """
+        DumpStorage(self.DUMP_FOLDER_ROOT).save_index(
+            self.DUMP_KIND, list(self.files_to_import))
+
     def save_data(self):
         """
         Saves all parsed data from self.context.parsed into the files
         """
+        py_dump = self.context.py_dump
         for category in self.categories:
-            self.save_category_data(category)
+            self.save_category_json(category)
+            if py_dump:
+                self.save_category_data(category)
         print('Saved data\u001b[0m')
 
+        self.save_index()
+        print('Saved index.json file\u001b[0m')
+
+        if not py_dump:
+            return
+
         self.save_init_file()
         print('Generated __init__.py file\u001b[0m')
 
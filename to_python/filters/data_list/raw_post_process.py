@@ -1,9 +1,9 @@
 import re
 
-from to_python.core.filter import FilterAbstract
+from to_python.core.filter import FilterPageAbstract
 
 
-class FilterRawPostProcess(FilterAbstract):
+class FilterRawPostProcess(FilterPageAbstract):
     """
     Cleans raw data (from context.raw_data)
     """
@@ -24,9 +24,9 @@ class FilterRawPostProcess(FilterAbstract):
 
         return raw
 
-    def apply(self):
-        for name in self.context_data.raw_data:
-            raw = self.context_data.raw_data[name]
-            self.context_data.raw_data[name] = self.post_process(raw)
+    def process(self, name: str):
+        raw = self.context_data.raw_data[name]
+        self.context_data.raw_data[name] = self.post_process(raw)
 
+    def finish(self):
         print('Raw Post Process complete\u001b[0m')
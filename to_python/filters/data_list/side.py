@@ -2,7 +2,7 @@ import re
 from typing import Optional
 
 from to_python.core.context import ParseFunctionSide, RawSide
-from to_python.core.filter import FilterAbstract
+from to_python.core.filter import FilterPageAbstract
 from to_python.core.types import CompoundFunctionData, FunctionData
 
 
@@ -10,7 +10,7 @@ class FilterParseSideSharedFileSectionsInvalid(RuntimeError):
     pass
 
 
-class FilterParseFunctionSide(FilterAbstract):
+class FilterParseFunctionSide(FilterPageAbstract):
     """
     Determines function side (client/server/shared).
     Puts client and server content into context.side_data
@@ -115,23 +115,23 @@ class FilterParseFunctionSide(FilterAbstract):
                            server=raw,
                            client=None)
 
-    def apply(self):
-        for name in self.context_data.parsed:
-            data = self.parse_file(name)
-            self.context_data.side_data[name] = data
+    def process(self, name: str):
+        data = self.parse_file(name)
+        self.context_data.side_data[name] = data
 
-            # Init parsed data objects
-            kwargs = dict()
-            if data.client is not None:
-                kwargs['client'] = [
-                    FunctionData(None, None, name)
-                ]
+        # Init parsed data objects
+        kwargs = dict()
+        if data.client is not None:
+            kwargs['client'] = [
+                FunctionData(None, None, name)
+            ]
 
-            if data.server is not None:
-                kwargs['server'] = [
-                    FunctionData(None, None, name)
-                ]
+        if data.server is not None:
+            kwargs['server'] = [
+                FunctionData(None, None, name)
+            ]
 
-            self.context_data.parsed[name] = CompoundFunctionData(**kwargs)
+        self.context_data.parsed[name] = CompoundFunctionData(**kwargs)
 
+    def finish(self):
         print('Functions parse complete\u001b[0m')
@@ -1,14 +1,14 @@
 import re
 from typing import Optional
 
-from wikitextparser import WikiText, Section
+from wikitextparser import Section
 
 from to_python.core.context import ParseFunctionSide, ContextData
-from to_python.core.filter import FilterAbstract
+from to_python.core.filter import FilterPageAbstract
 from to_python.core.format import colorize_token_list
-from to_python.core.signature import SignatureParser, SignatureTokenizer
+from to_python.core.signature import SignatureMemo
 from to_python.core.types import FunctionSignature
-from to_python.filters.data_list.doc import FilterParseDocs
+from to_python.core.wiki import WikiSectionIndex
 
 
 class WikiGetSyntaxSection:
@@ -19,11 +19,12 @@ class WikiGetSyntaxSection:
     # TODO: Think about transforming that utility class into a filter
 
     def __init__(self, context: ContextData, f_name: str, raw_data: str,
-                 wiki: WikiText):
+                 index: WikiSectionIndex):
         self.context = context
         self.f_name = f_name
         self.raw_data = raw_data
-        self.wiki = wiki
+        self.index = index
+        self.wiki = index.wiki
 
         self.section_index = 0
         self.start_index = 0
@@ -63,10 +64,7 @@ class WikiGetSyntaxSection:
         Finds syntax section in wiki page (or part of wiki page)
         :return:
         """
-        syntax = FilterParseDocs.get_sections_title_contains(
-            self.wiki,
-            paragraph_title_part
-        )
+        syntax = self.index.find(paragraph_title_part)
         if not syntax:
             self.no_syntax_section()
         else:
@@ -75,27 +73,17 @@ class WikiGetSyntaxSection:
         return self.section
 
     def pick_text(self) -> str:
-        try:
-            next_section: Optional[WikiText] = self.wiki.sections[
-                self.section_index + 1]
-        except IndexError:
-            next_section = None
-
-        if next_section is None:
-            end_index = len(str(self.wiki))
-        else:
-            end_index = next_section.span[0]
-
-        return str(self.wiki)[self.start_index:end_index]
+        return self.index.get_text(self.start_index, self.section_index)
 
 
-class FilterParseFunctionSignature(FilterAbstract):
+class FilterParseFunctionSignature(FilterPageAbstract):
     """
     Parses function signature
     """
 
     def __init__(self):
         super().__init__('functions')
+        self.memo = SignatureMemo()
 
     @staticmethod
     def clean_code(code: str) -> str:
@@ -113,23 +101,21 @@ class FilterParseFunctionSignature(FilterAbstract):
         """
         code = self.clean_code(code)
 
-        tokenized = SignatureTokenizer(code).tokenize()
+        tokenized, signature = self.memo.parse(code)
 
         if self.context.verbose:
             colors = colorize_token_list(tokenized)
             print(f'[V] {code: <175}', f'[V] {colors: <175}\n', sep='\n')
 
-        return SignatureParser(
-            tokenized=tokenized
-        ).parse()
+        return signature
 
     def pick_signature_container(self, f_name: str, raw_data: str,
-                                 wiki: WikiText) -> str:
+                                 index: WikiSectionIndex) -> str:
         """
         Picks media wiki code, containing signature
         """
         syntax_picker = WikiGetSyntaxSection(self.context_data, f_name,
-                                             raw_data, wiki)
+                                             raw_data, index)
         syntax_picker.get()
         code_inside = syntax_picker.pick_text()
 
@@ -144,34 +130,36 @@ class FilterParseFunctionSignature(FilterAbstract):
     SELECT_CODE_REGEX = re.compile(
         r'<syntaxhighlight[^>]*lua[^>]*>([\s\S]+?)</syntaxhighlight>')
 
-    def pick_signature(self, f_name: str, raw_data: str, wiki: WikiText) -> \
-            str:
+    def pick_signature(self, f_name: str, raw_data: str,
+                       index: WikiSectionIndex) -> str:
         """
         Picks out function signature code from an entire data
         """
-        container = self.pick_signature_container(f_name, raw_data, wiki)
+        container = self.pick_signature_container(f_name, raw_data, index)
         signature = re.search(self.SELECT_CODE_REGEX, container).group(1)
         return signature.strip()
 
-    def apply(self):
+    def start(self):
         print('\n\n ============ Parse Functions ============')
 
-        for f_name in self.context_data.parsed:
-            raw_content = self.context_data.side_data[f_name]
-            wiki_content = self.context_data.wiki_side[f_name]
+    def process(self, f_name: str):
+        raw_content = self.context_data.side_data[f_name]
+        wiki_content = self.context_data.wiki_index[f_name]
 
-            if raw_content.client is not None:
-                self.context_data.parsed[f_name].client[
-                    0].signature = self.parse_signature(
-                    self.pick_signature(f_name, raw_content.client,
-                                        wiki_content.client)
-                )
+        if raw_content.client is not None:
+            self.context_data.parsed[f_name].client[
+                0].signature = self.parse_signature(
+                self.pick_signature(f_name, raw_content.client,
+                                    wiki_content.client)
+            )
 
-            if raw_content.server is not None:
-                self.context_data.parsed[f_name].server[
-                    0].signature = self.parse_signature(
-                    self.pick_signature(f_name, raw_content.server,
-                                        wiki_content.server)
-                )
+        if raw_content.server is not None:
+            self.context_data.parsed[f_name].server[
+                0].signature = self.parse_signature(
+                self.pick_signature(f_name, raw_content.server,
+                                    wiki_content.server)
+            )
 
+    def finish(self):
+        print(f'Signature memo: {self.memo.get_stats()}\u001b[0m')
         print('Function signature parsing complete\u001b[0m')
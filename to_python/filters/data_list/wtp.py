@@ -2,11 +2,12 @@ from typing import Optional
 
 import wikitextparser as wtp
 
-from to_python.core.context import WikiSide
-from to_python.core.filter import FilterAbstract
+from to_python.core.context import WikiSide, WikiSideIndex
+from to_python.core.filter import FilterPageAbstract
+from to_python.core.wiki import WikiSectionIndex
 
 
-class FilterWikiTextParser(FilterAbstract):
+class FilterWikiTextParser(FilterPageAbstract):
     def __init__(self, context_type: str):
         """
         :param context_type: `functions` or `events`
@@ -20,17 +21,28 @@ class FilterWikiTextParser(FilterAbstract):
 
         return wtp.parse(code)
 
-    def apply(self):
-        for f_name in self.context_data.raw_data:
-            self.context_data.wiki_raw[f_name] = self.parse(
-                self.context_data.raw_data[f_name])
+    @staticmethod
+    def create_index(wiki: Optional[wtp.WikiText]) -> \
+            Optional[WikiSectionIndex]:
+        if wiki is None:
+            return None
+
+        return WikiSectionIndex(wiki)
+
+    def process(self, name: str):
+        self.context_data.wiki_raw[name] = self.parse(
+            self.context_data.raw_data[name])
 
-        for f_name in self.context_data.side_data:
-            data = self.context_data.side_data[f_name]
-            self.context_data.wiki_side[f_name] = WikiSide(side=data.side,
-                                                           server=self.parse(
-                                                               data.server),
-                                                           client=self.parse(
-                                                               data.client))
+        data = self.context_data.side_data[name]
+        wiki_side = WikiSide(side=data.side,
+                             server=self.parse(data.server),
+                             client=self.parse(data.client))
+        self.context_data.wiki_side[name] = wiki_side
+        self.context_data.wiki_index[name] = WikiSideIndex(
+            side=data.side,
+            server=self.create_index(wiki_side.server),
+            client=self.create_index(wiki_side.client),
+        )
 
+    def finish(self):
         print('Wiki Text Parse complete\u001b[0m')
@@ -2,7 +2,7 @@ import re
 from typing import Optional
 
 from to_python.core.context import ParseFunctionSide, RawSide
-from to_python.core.filter import FilterAbstract
+from to_python.core.filter import FilterPageAbstract
 from to_python.core.types import EventData, CompoundEventData
 from to_python.filters.data_list.side import FilterParseFunctionSide
 
@@ -11,7 +11,7 @@ class FilterParseSideSharedFileSectionsInvalid(RuntimeError):
     pass
 
 
-class FilterParseEventSide(FilterAbstract):
+class FilterParseEventSide(FilterPageAbstract):
     """
     Determines function side (client/server/shared).
     Puts client and server content into context.side_data
@@ -70,17 +70,17 @@ class FilterParseEventSide(FilterAbstract):
                            server=raw,
                            client=None)
 
-    def apply(self):
-        for name in self.context_data.parsed:
-            data = self.parse_file(name)
-            self.context_data.side_data[name] = data
+    def process(self, name: str):
+        data = self.parse_file(name)
+        self.context_data.side_data[name] = data
 
-            # Init parsed data objects
-            kwargs = dict()
-            if data.client is not None:
-                kwargs['client'] = [EventData(None, None, name)]
-            if data.server is not None:
-                kwargs['server'] = [EventData(None, None, name)]
-            self.context_data.parsed[name] = CompoundEventData(**kwargs)
+        # Init parsed data objects
+        kwargs = dict()
+        if data.client is not None:
+            kwargs['client'] = [EventData(None, None, name)]
+        if data.server is not None:
+            kwargs['server'] = [EventData(None, None, name)]
+        self.context_data.parsed[name] = CompoundEventData(**kwargs)
 
+    def finish(self):
         print('Parse event side complete\u001b[0m')
@@ -1,23 +1,23 @@
 import re
 
-from wikitextparser import WikiText
-
 from to_python.core.context import ContextData
-from to_python.core.filter import FilterAbstract
+from to_python.core.filter import FilterPageAbstract
 from to_python.core.format import colorize_token_list
-from to_python.core.signature import SignatureParser, SignatureTokenizer
+from to_python.core.signature import SignatureMemo
 from to_python.core.types import FunctionArgumentValues, CompoundEventData
+from to_python.core.wiki import WikiSectionIndex
 from to_python.filters.data_list.signature import WikiGetSyntaxSection, \
     FilterParseFunctionSignature
 
 
-class FilterParseEventSignature(FilterAbstract):
+class FilterParseEventSignature(FilterPageAbstract):
     """
     Parses function signature
     """
 
     def __init__(self):
         super().__init__('events')
+        self.memo = SignatureMemo()
 
     def parse_signature(self, code: str) -> FunctionArgumentValues:
         """
@@ -29,25 +29,21 @@ class FilterParseEventSignature(FilterAbstract):
         #   tokenize and then inject arguments only
         code = f'void eventCallback( {code} )'
 
-        tokenized = SignatureTokenizer(code).tokenize()
+        tokenized, function_signature = self.memo.parse(code)
 
-        colors = colorize_token_list(tokenized)
         if self.context.verbose:
+            colors = colorize_token_list(tokenized)
             print(f'[V] {code: <175}', f'[V] {colors: <175}\n', sep='\n')
 
-        function_signature = SignatureParser(
-            tokenized=tokenized
-        ).parse()
-
         return function_signature.arguments
 
     def pick_signature_container(self, f_name: str, raw_data: str,
-                                 wiki: WikiText) -> str:
+                                 index: WikiSectionIndex) -> str:
         """
         Picks media wiki code, containing signature
         """
         syntax_picker = WikiGetSyntaxSection(self.context_data, f_name,
-                                             raw_data, wiki)
+                                             raw_data, index)
         syntax_picker.get('parameters')
         code_inside = syntax_picker.pick_text()
 
@@ -64,36 +60,38 @@ class FilterParseEventSignature(FilterAbstract):
 
         return code_inside
 
-    def pick_signature(self, f_name: str, raw_data: str, wiki: WikiText) -> \
-            str:
+    def pick_signature(self, f_name: str, raw_data: str,
+                       index: WikiSectionIndex) -> str:
         """
         Picks out function signature code from an entire data
         """
-        container = self.pick_signature_container(f_name, raw_data, wiki)
+        container = self.pick_signature_container(f_name, raw_data, index)
         signature = re.search(FilterParseFunctionSignature.SELECT_CODE_REGEX,
                               container).group(1)
         return signature.strip()
 
-    def apply(self):
+    def start(self):
         self.context_data: ContextData[CompoundEventData]
         print('\n\n ============ Parse Events ============')
 
-        for f_name in self.context_data.parsed:
-            raw_content = self.context_data.side_data[f_name]
-            wiki_content = self.context_data.wiki_side[f_name]
+    def process(self, f_name: str):
+        raw_content = self.context_data.side_data[f_name]
+        wiki_content = self.context_data.wiki_index[f_name]
 
-            if raw_content.client is not None:
-                self.context_data.parsed[f_name].client[
-                    0].arguments = self.parse_signature(
-                    self.pick_signature(f_name, raw_content.client,
-                                        wiki_content.client)
-                )
+        if raw_content.client is not None:
+            self.context_data.parsed[f_name].client[
+                0].arguments = self.parse_signature(
+                self.pick_signature(f_name, raw_content.client,
+                                    wiki_content.client)
+            )
 
-            if raw_content.server is not None:
-                self.context_data.parsed[f_name].server[
-                    0].arguments = self.parse_signature(
-                    self.pick_signature(f_name, raw_content.server,
-                                        wiki_content.server)
-                )
+        if raw_content.server is not None:
+            self.context_data.parsed[f_name].server[
+                0].arguments = self.parse_signature(
+                self.pick_signature(f_name, raw_content.server,
+                                    wiki_content.server)
+            )
 
+    def finish(self):
+        print(f'Signature memo: {self.memo.get_stats()}\u001b[0m')
         print('Events parse complete\u001b[0m')
@@ -1,9 +1,33 @@
+import abc
+from typing import List
+
+from crawler.core.types import PageUrl
+from crawler.core.url_index import UrlIndex
 from to_python.core.filter import FilterAbstract
+from to_python.filters.collect_files import FilterCollectDumpFiles
 
 
-class FilterGetFunctionUrls(FilterAbstract):
-    def __init__(self):
-        super().__init__('functions')
+class FilterGetUrls(FilterAbstract):
+    @abc.abstractmethod
+    def get_url_list_py(self) -> List[PageUrl]:
+        """
+        Imports URL list from the dump_html Python module
+        (compatibility mode of the crawler)
+        """
+        pass
+
+    def get_url_list(self) -> List[PageUrl]:
+        """
+        Loads URL list from the crawler URL index.
+        Falls back to the dump_html Python module,
+        if there is no index
+        """
+        url_list = UrlIndex.load(FilterCollectDumpFiles.DUMP_ROOT,
+                                 self.context_type)
+        if url_list is not None:
+            return url_list
+
+        return self.get_url_list_py()
 
     def get_urls(self) -> int:
         """
@@ -11,34 +35,36 @@ class FilterGetFunctionUrls(FilterAbstract):
         and saves it into the context
         :return: Length of the collected URL array
         """
-        from crawler.dump_html import URL_LIST
+        url_list = self.get_url_list()
 
-        for url in URL_LIST:
+        for url in url_list:
             self.context_data.urls[url.name] = url
 
-        return len(URL_LIST)
+        return len(url_list)
+
+
+class FilterGetFunctionUrls(FilterGetUrls):
+    def __init__(self):
+        super().__init__('functions')
+
+    def get_url_list_py(self) -> List[PageUrl]:
+        from crawler.dump_html import URL_LIST
+
+        return URL_LIST
 
     def apply(self):
         length = self.get_urls()
         print(f'Got all function URLs: \x1b[34m{length}\x1b[0m items')
 
 
-class FilterGetEventUrls(FilterAbstract):
+class FilterGetEventUrls(FilterGetUrls):
     def __init__(self):
         super().__init__('events')
 
-    def get_urls(self) -> int:
-        """
-        Gets urls, collects them into a dictionary
-        and saves it into the context
-        :return: Length of the collected URL array
-        """
+    def get_url_list_py(self) -> List[PageUrl]:
         from crawler.dump_html import EVENT_URL_LIST
 
-        for url in EVENT_URL_LIST:
-            self.context_data.urls[url.name] = url
-
-        return len(EVENT_URL_LIST)
+        return EVENT_URL_LIST
 
     def apply(self):
         length = self.get_urls()
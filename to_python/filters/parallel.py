@@ -0,0 +1,110 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional
+
+from to_python.core.cache import ParseCache
+from to_python.core.context import Context, ContextData
+from to_python.core.filter import FilterAbstract
+from to_python.core.types import CompoundOOPData
+
+
+def apply_filters(context_type: str,
+                  filters: List[FilterAbstract],
+                  verbose: bool,
+                  cache: Optional[ParseCache],
+                  context_data: ContextData) -> \
+        Tuple[Dict, Dict[str, CompoundOOPData]]:
+    """
+    Applies filters to the part of pages (inside a worker process)
+    :return: Parsed data and OOP data of the pages
+    """
+    context = Context(functions=ContextData(),
+                      oops=dict(),
+                      events=ContextData(),
+                      verbose=verbose,
+                      cache=cache)
+    setattr(context, context_type, context_data)
+
+    for filt in filters:
+        filt.initialize(context)
+        filt.apply()
+
+    return context_data.parsed, context.oops
+
+
+class FilterParallel(FilterAbstract):
+    """
+    Applies CPU heavy filters (reading, wiki text parsing
+    and the data extraction) in a process pool.
+    Pages are split into a chunk per process.
+    Wiki text objects are not picklable, so they are created, used
+    and dropped inside the worker. Only parsed data is sent back
+    """
+
+    def __init__(self, context_type: str, filters: List[FilterAbstract]):
+        """
+        :param context_type: `functions` or `events`
+        :param filters: Filters to apply. Filters should fill
+         only context.parsed and context.oops with the results
+        """
+        super().__init__(context_type)
+        self.filters = filters
+
+    def get_chunks(self, jobs: int) -> List[ContextData]:
+        """
+        Splits the context data into the chunks of pages
+        """
+        names = list(self.context_data.pages)
+        size = -(-len(names) // jobs)
+
+        chunks = []
+        for start in range(0, len(names), size):
+            chunk_names = names[start:start + size]
+            chunk = ContextData(urls=self.context_data.urls)
+
+            for field in ('pages', 'parsed', 'raw_data', 'side_data'):
+                data = getattr(self.context_data, field)
+                setattr(chunk, field, {
+                    name: data[name]
+                    for name in chunk_names
+                    if name in data
+                })
+
+            chunks.append(chunk)
+
+        return chunks
+
+    def apply_sequential(self):
+        for filt in self.filters:
+            filt.initialize(self.context)
+            filt.apply()
+
+    def apply_parallel(self):
+        chunks = self.get_chunks(self.context.jobs)
+
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            results = executor.map(
+                apply_filters,
+                [self.context_type] * len(chunks),
+                [self.filters] * len(chunks),
+                [self.context.verbose] * len(chunks),
+                [self.context.cache] * len(chunks),
+                chunks,
+            )
+
+            # Chunks are merged in order, so the result
+            # is the same as in the sequential mode
+            for parsed, oops in results:
+                self.context_data.parsed.update(parsed)
+                self.context.oops.update(oops)
+
+    def apply(self):
+        if self.context.jobs <= 1 or len(self.context_data.pages) <= 1:
+            self.apply_sequential()
+            return
+
+        self.apply_parallel()
+        print(
+            f'Parallel parse complete (context '
+            f'\u001b[34m{self.context_type}\u001b[0m, '
+            f'\u001b[34m{self.context.jobs}\u001b[0m processes)\u001b[0m'
+        )
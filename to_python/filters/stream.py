@@ -0,0 +1,49 @@
+from typing import List
+
+from to_python.core.filter import FilterAbstract, FilterPageAbstract
+
+
+class FilterStreamPages(FilterAbstract):
+    """
+    Passes pages through the filters one by one:
+    the next page starts after the previous one is finished.
+    Intermediate data of a finished page (raw text, side data
+    and wiki text objects) is dropped, only context.parsed is kept
+    """
+
+    def __init__(self, context_type: str, filters: List[FilterPageAbstract]):
+        """
+        :param context_type: `functions` or `events`
+        :param filters: Page filters. Page names are taken
+         from the first filter
+        """
+        super().__init__(context_type)
+        self.filters = filters
+
+    def drop_intermediate(self, name: str):
+        self.context_data.raw_data.pop(name, None)
+        self.context_data.side_data.pop(name, None)
+        self.context_data.wiki_raw.pop(name, None)
+        self.context_data.wiki_side.pop(name, None)
+        self.context_data.wiki_index.pop(name, None)
+
+    def process(self, name: str):
+        for filt in self.filters:
+            filt.process(name)
+
+            # Page is skipped by the filter
+            if name not in self.context_data.parsed:
+                break
+
+        self.drop_intermediate(name)
+
+    def apply(self):
+        for filt in self.filters:
+            filt.initialize(self.context)
+            filt.start()
+
+        for name in self.filters[0].get_page_names():
+            self.process(name)
+
+        for filt in self.filters:
+            filt.finish()
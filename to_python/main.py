@@ -1,27 +1,61 @@
-import sys
-from typing import List
+import argparse
+import os
+from typing import List, Optional
 
+from profiling.profiler import add_profiler_arguments, run_chain
 from to_python.chain import FILTER_CHAIN
+from to_python.core.cache import ParseCache
 from to_python.core.context import Context, ContextData
 
+PARSE_CACHE_FOLDER = 'parse_cache'
 
-def main(argc: int, argv: List[str]):
-    verbose_mode = False
 
-    if argc >= 2:
-        verbose_mode = 'v' in argv[1]
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Transforms Media Wiki content into Python objects')
+    parser.add_argument('mode', nargs='?', default='',
+                        help='Legacy mode flags: "v" enables verbose mode')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Print tokenized signatures')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Amount of processes for the wiki text parsing '
+                             '(default: CPU count). Set 1 to parse pages '
+                             'in the main process')
+    parser.add_argument('--cache-dir', default=PARSE_CACHE_FOLDER,
+                        help='Folder of the parse results cache '
+                             f'(default: {PARSE_CACHE_FOLDER})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Parse all pages, do not use the parse cache')
+    parser.add_argument('--no-py-dump', action='store_true',
+                        help='Save the dump only as JSON, '
+                             'do not generate Python modules')
+    add_profiler_arguments(parser)
+
+    return parser.parse_args(argv)
+
+
+def count_items(context: Context) -> int:
+    return len(context.functions.parsed) + len(context.events.parsed)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
 
     context = Context(functions=ContextData(),
                       oops=dict(),
                       events=ContextData(),
-                      verbose=verbose_mode)
+                      verbose=args.verbose or 'v' in args.mode,
+                      jobs=max(1, args.jobs),
+                      cache=None if args.no_cache else ParseCache(
+                          args.cache_dir),
+                      py_dump=not args.no_py_dump)
 
-    for filt in FILTER_CHAIN:
-        filt.initialize(context)
-        filt.apply()
+    run_chain(FILTER_CHAIN, context, args,
+              chain_name='to_python',
+              count_items=count_items)
 
     print('\u001b[32mComplete\u001b[0m')
 
 
 if __name__ == '__main__':
-    main(len(sys.argv), sys.argv)
+    main()
@@ -1,10 +1,11 @@
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, DefaultDict
+from typing import Dict, List, DefaultDict, Optional, Set
 
 from crawler.core.types import PageUrl
 from to_python.core.types import CompoundFunctionData, CompoundEventData, \
     CompoundOOPData
+from to_typescript.core.name_index import DumpNameIndex
 
 # <category, <client/server, <declaration>>>
 DictType = DefaultDict[str, DefaultDict[str, List[str]]]
@@ -48,6 +49,9 @@ class Context:
     events: List[CompoundEventData] = field(default_factory=list)
     oops: List[CompoundOOPData] = field(default_factory=list)
 
+    # Functions and OOP data by name
+    name_index: DumpNameIndex = field(default_factory=DumpNameIndex)
+
     # URLs from URL List
     urls: Dict[str, PageUrl] = field(default_factory=dict)
 
@@ -59,3 +63,19 @@ class Context:
     # < category , < client/server, [event data] > >
     events_declarations: 'ContextDeclarations.DictType' = field(
         default_factory=default_dict_factory)
+
+    # Dump categories to process (like `ped_functions`).
+    # None to process all categories
+    categories: Optional[Set[str]] = None
+
+    # Sides to process
+    sides: List[str] = field(default_factory=lambda: ['client', 'server'])
+
+    # Amount of processes for the declaration generation
+    jobs: int = 1
+
+    def is_partial(self) -> bool:
+        """
+        :return: True, if only a part of the dump is processed
+        """
+        return self.categories is not None or len(self.sides) < 2
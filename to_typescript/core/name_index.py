@@ -0,0 +1,78 @@
+from collections import defaultdict
+from typing import DefaultDict, List, Tuple
+
+from crawler.core.types import ListType
+from to_python.core.types import CompoundFunctionData, CompoundOOPData
+
+SIDES = (ListType.SERVER, ListType.CLIENT)
+
+
+class DumpNameIndex:
+    """
+    Functions by (side, function name) and OOP data
+    by (side, base function name). Lists keep the dump order.
+    Filters, that add or remove functions, update the index
+    """
+
+    def __init__(self):
+        self.functions: DefaultDict[
+            Tuple[ListType, str], List[CompoundFunctionData]] = \
+            defaultdict(list)
+        self.oops: DefaultDict[
+            Tuple[ListType, str], List[CompoundOOPData]] = \
+            defaultdict(list)
+
+    def build(self,
+              functions: List[CompoundFunctionData],
+              oops: List[CompoundOOPData]):
+        self.functions.clear()
+        self.oops.clear()
+
+        for function in functions:
+            self.add_function(function)
+
+        for oop in oops:
+            self.add_oop(oop)
+
+    def add_function(self, function: CompoundFunctionData):
+        """
+        Adds the function after all functions with the same name
+        """
+        for side in SIDES:
+            if function[side]:
+                self.functions[side, function[side][0].name].append(function)
+
+    def remove_function(self, function: CompoundFunctionData):
+        for side in SIDES:
+            if not function[side]:
+                continue
+
+            key = side, function[side][0].name
+            self.functions[key] = [
+                data for data in self.functions[key]
+                if data is not function
+            ]
+
+    def add_oop(self, oop: CompoundOOPData):
+        for side in SIDES:
+            if oop[side]:
+                self.oops[side, oop[side][0].base_function_name].append(oop)
+
+    def get_functions(self, side: ListType, name: str) -> \
+            List[CompoundFunctionData]:
+        return [
+            data for data in self.functions.get((side, name), [])
+            if data[side] and data[side][0].name == name
+        ]
+
+    def get_oops(self, side: ListType, base_function_name: str) -> \
+            List[CompoundOOPData]:
+        """
+        OOP declarations can be removed from the data while processing,
+        so the data is checked again
+        """
+        return [
+            data for data in self.oops.get((side, base_function_name), [])
+            if data[side]
+            and data[side][0].base_function_name == base_function_name
+        ]
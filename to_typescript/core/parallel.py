@@ -0,0 +1,35 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, TypeVar
+
+ItemType = TypeVar('ItemType')
+ResultType = TypeVar('ResultType')
+
+
+def generate_in_pool(
+        generate: Callable[[str, List[ItemType]], List[ResultType]],
+        host_name: str,
+        items: List[ItemType],
+        jobs: int) -> List[ResultType]:
+    """
+    Applies the generator to the items in a process pool.
+    Items are split into a chunk per process, chunk results are merged
+    in order, so the result is the same as `generate(host_name, items)`
+    :param generate: Module level function (it is sent to the workers).
+     Returns a result per item
+    :param jobs: Amount of processes. 1 to generate in the main process
+    """
+    if jobs <= 1 or len(items) <= 1:
+        return generate(host_name, items)
+
+    size = -(-len(items) // jobs)
+    chunks = [items[start:start + size]
+              for start in range(0, len(items), size)]
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        return [
+            result
+            for chunk_results in executor.map(generate,
+                                              [host_name] * len(chunks),
+                                              chunks)
+            for result in chunk_results
+        ]
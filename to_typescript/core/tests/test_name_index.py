@@ -0,0 +1,67 @@
+from crawler.core.types import ListType
+from to_python.core.types import CompoundFunctionData, CompoundOOPData, \
+    FunctionData, FunctionSignature, FunctionReturnTypes, \
+    FunctionArgumentValues, FunctionOOP
+from to_typescript.core.name_index import DumpNameIndex
+
+
+def create_function(name: str) -> FunctionData:
+    return FunctionData(
+        signature=FunctionSignature(
+            name=name,
+            return_types=FunctionReturnTypes(return_types=[],
+                                             variable_length=False),
+            arguments=FunctionArgumentValues(arguments=[],
+                                             variable_length=False),
+        ),
+        docs=None,
+        url=name,
+    )
+
+
+def create_oop(base_function_name: str) -> FunctionOOP:
+    return FunctionOOP(description=None,
+                       class_name='element',
+                       base_function_name=base_function_name,
+                       method=None,
+                       field=None,
+                       is_static=False)
+
+
+def test_name_index_functions():
+    shared = CompoundFunctionData(server=[create_function('setTimer')],
+                                  client=[create_function('setTimer')])
+    client = CompoundFunctionData(server=[],
+                                  client=[create_function('dxCreateTexture')])
+
+    index = DumpNameIndex()
+    index.build([shared, client], [])
+
+    assert index.get_functions(ListType.SERVER, 'setTimer') == [shared]
+    assert index.get_functions(ListType.CLIENT, 'setTimer') == [shared]
+    assert index.get_functions(ListType.SERVER, 'dxCreateTexture') == []
+
+    mixin = CompoundFunctionData(server=[],
+                                 client=[create_function('dxCreateTexture')])
+    index.add_function(mixin)
+    found = index.get_functions(ListType.CLIENT, 'dxCreateTexture')
+    assert found[0] is client and found[1] is mixin
+
+    index.remove_function(shared)
+    assert index.get_functions(ListType.SERVER, 'setTimer') == []
+    assert index.get_functions(ListType.CLIENT, 'setTimer') == []
+
+
+def test_name_index_oops():
+    oop = CompoundOOPData(server=[create_oop('setTimer')],
+                          client=[create_oop('setTimer')])
+
+    index = DumpNameIndex()
+    index.build([], [oop])
+
+    assert index.get_oops(ListType.SERVER, 'setTimer') == [oop]
+
+    # Declarations can be removed while processing
+    oop.server.pop()
+    assert index.get_oops(ListType.SERVER, 'setTimer') == []
+    assert index.get_oops(ListType.CLIENT, 'setTimer') == [oop]
@@ -0,0 +1,16 @@
+from typing import List
+
+from to_typescript.core.parallel import generate_in_pool
+
+
+def generate_names(host_name: str, items: List[int]) -> List[str]:
+    return [f'{host_name}/{item}' for item in items]
+
+
+def test_generate_in_pool_order():
+    items = list(range(10))
+    expected = generate_names('host', items)
+
+    assert generate_in_pool(generate_names, 'host', items, 1) == expected
+    assert generate_in_pool(generate_names, 'host', items, 3) == expected
+    assert generate_in_pool(generate_names, 'host', [], 3) == []
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Optional
 
 from crawler.core.types import PageUrl
@@ -18,7 +17,7 @@ class TypeScriptOOPGenerator:
     MAX_DOC_LINE_LENGTH = 90
 
     def __init__(self, data: FunctionOOP, url: PageUrl, host_name: str):
-        self.data = deepcopy(data)
+        self.data = data
         self.url = url
         self.host_name = host_name
         self.generator = TypeScriptFunctionGenerator(data.method, self.url,
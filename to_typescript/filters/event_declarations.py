@@ -1,5 +1,5 @@
 import os
-from copy import deepcopy
+from dataclasses import replace
 from typing import List
 
 from to_python.core.types import EventData, FunctionArgument, FunctionType
@@ -48,11 +48,9 @@ import { EventNames } from './all_event_names';
         for data_list in data_list:
             data = data_list[0]
             name = FilterEventSaveNames.normalize_enum_variable_name(data.name)
-            arguments = deepcopy(data.arguments)
 
-            # Add this:void argument
-            arguments.arguments.insert(
-                0,
+            # Add this:void argument. The event data is not changed
+            arguments = replace(data.arguments, arguments=[
                 [FunctionArgument(
                     name='this',
                     argument_type=FunctionType(
@@ -61,7 +59,8 @@ import { EventNames } from './all_event_names';
                     ),
                     default_value=None,
                 )],
-            )
+                *data.arguments.arguments,
+            ])
 
             function_type = TypeScriptFunctionGenerator.generate_arguments(
                 arguments)
@@ -88,7 +87,7 @@ export interface {name} extends GenericEventHandler {{
             cache.write(content)
 
     def apply(self):
-        for side in ['client', 'server']:
+        for side in self.context.sides:
             for category in self.context.events_declarations:
                 data: List[List[EventData]] = \
                     self.context.events_declarations[category][side]
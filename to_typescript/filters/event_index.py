@@ -52,12 +52,16 @@ export { Event };
 ''')
 
     def apply(self):
-        for side in ['client', 'server']:
+        if self.context.categories is not None:
+            print(f'Partial run, {self.EVENT_FILE_NAME} is not saved\u001b[0m')
+            return
+
+        for side in self.context.sides:
             FilterEventSaveIndex.append_index(side)
 
         print(f'Append event data into {self.FILE_NAME} (index file)\u001b[0m')
 
-        for side in ['client', 'server']:
+        for side in self.context.sides:
             self.save_file_event(side)
 
         print('Generate event.d.ts files\u001b[0m')
@@ -49,7 +49,12 @@ class FilterEventSaveNames(FilterAbstract):
             cache.write(content)
 
     def apply(self):
-        for side in ['client', 'server']:
+        if self.context.categories is not None:
+            print('Partial run, event name declaration files '
+                  'are not saved\u001b[0m')
+            return
+
+        for side in self.context.sides:
             all_events_by_side: List[List[EventData]] = []
             for category in self.context.events_declarations:
                 data: List[List[EventData]] = \
@@ -1,11 +1,26 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from crawler.core.types import PageUrl
 from to_python.core.types import CompoundFunctionData, FunctionData
 from to_typescript.core.filter import FilterAbstract
+from to_typescript.core.parallel import generate_in_pool
 from to_typescript.core.transform.function import TypeScriptFunctionGenerator
 
 
+def generate_declarations(host_name: str,
+                          items: List[Tuple[FunctionData, PageUrl]]) -> \
+        List[str]:
+    """
+    Generates declarations of the functions (inside a worker process)
+    """
+    return [
+        TypeScriptFunctionGenerator(host_name=host_name,
+                                    data=data,
+                                    url=url).generate()
+        for data, url in items
+    ]
+
+
 class FilterGenerateFunctionDeclarations(FilterAbstract):
     @staticmethod
     def get_dts_file_name(category: str) -> str:
@@ -17,8 +32,12 @@ class FilterGenerateFunctionDeclarations(FilterAbstract):
                 .split(' ')[0]
                 .lower())
 
-    def generate_declaration(self, compound: CompoundFunctionData,
-                             url: PageUrl):
+    def get_declaration_items(self, compound: CompoundFunctionData,
+                              url: PageUrl) -> \
+            List[Tuple[str, FunctionData, PageUrl]]:
+        """
+        :return: List of (side, function data, URL) to generate
+        """
         # TODO: use CompoundFunctionData __iter__ (loop)
 
         sides: Dict[str, List[FunctionData]] = dict()
@@ -27,16 +46,11 @@ class FilterGenerateFunctionDeclarations(FilterAbstract):
         if compound.client:
             sides['client'] = compound.client
 
-        for side in sides:
-            for data in sides[side]:
-                declaration = TypeScriptFunctionGenerator(
-                    host_name=self.context.host_name,
-                    data=data,
-                    url=url).generate()
-
-                category = self.get_dts_file_name(url.category)
-                self.context.declarations.function[category][side].append(
-                    declaration)
+        return [
+            (side, data, url)
+            for side in sides
+            for data in sides[side]
+        ]
 
     def save_function_for_index(self, compound: CompoundFunctionData,
                                 url: PageUrl):
@@ -50,11 +64,23 @@ class FilterGenerateFunctionDeclarations(FilterAbstract):
                 url.name)
 
     def apply(self):
+        items = []
         for function in self.context.functions:
             name = (function.server or function.client)[0].url
             url = self.context.urls[name]
-            self.generate_declaration(function, url)
+            items.extend(self.get_declaration_items(function, url))
 
             self.save_function_for_index(function, url)
 
+        declarations = generate_in_pool(
+            generate_declarations,
+            self.context.host_name,
+            [(data, url) for _, data, url in items],
+            self.context.jobs,
+        )
+        for (side, _, url), declaration in zip(items, declarations):
+            category = self.get_dts_file_name(url.category)
+            self.context.declarations.function[category][side].append(
+                declaration)
+
         print('Function Declarations generated\u001b[0m')
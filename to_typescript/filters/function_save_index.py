@@ -56,7 +56,11 @@ export * from './variables';
             cache.write(text)
 
     def apply(self):
-        for side in ['client', 'server']:
+        if self.context.categories is not None:
+            print(f'Partial run, {self.FILE_NAME} is not saved\u001b[0m')
+            return
+
+        for side in self.context.sides:
             self.save_file_index(side)
 
         print(f'Generated {self.FILE_NAME} (index file)\u001b[0m')
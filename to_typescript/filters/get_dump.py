@@ -1,7 +1,85 @@
+import glob
+import importlib.util
+import os
+from types import ModuleType
+from typing import List, Any
+
+from to_python.core.dump import DumpStorage
 from to_typescript.core.filter import FilterAbstract
 
 
 class FilterGetDump(FilterAbstract):
+    """
+    Loads the to_python dump. Prefers the JSON dump,
+    Python modules are used only if there is no JSON index.
+    If context.categories is set, only these category files are loaded
+    """
+
+    DUMP_FOLDER = '../to_python/dump'
+    KINDS = ('functions', 'events', 'oops')
+
+    def set_dump(self, kind: str, data_list: List[Any]):
+        setattr(self.context, kind, data_list)
+
+    def get_json_dump(self) -> bool:
+        """
+        Gets dumped data from JSON
+        :return: False, if there is no JSON dump
+        """
+        storage = DumpStorage(self.DUMP_FOLDER)
+        if storage.load_index() is None:
+            return False
+
+        for kind in self.KINDS:
+            self.set_dump(kind, storage.load(kind, self.context.categories))
+
+        return True
+
+    @staticmethod
+    def load_module_file(name: str, path: str) -> ModuleType:
+        """
+        Loads a dump module by path. The `to_python.dump` package
+        is not imported, so other categories are not loaded
+        """
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        return module
+
+    def load_module(self, kind: str, category: str) -> List[Any]:
+        """
+        Loads a single category module
+        """
+        return self.load_module_file(
+            f'to_python.dump.{kind}.{category}',
+            os.path.join(self.DUMP_FOLDER, kind, f'{category}.py'),
+        ).DUMP_PARTIAL
+
+    def get_module_categories(self, kind: str) -> List[str]:
+        files = glob.glob(os.path.join(self.DUMP_FOLDER, kind, '*.py'))
+        categories = sorted(
+            os.path.splitext(os.path.basename(path))[0]
+            for path in files
+        )
+
+        return [
+            category
+            for category in categories
+            if category in self.context.categories
+        ]
+
+    def get_partial_dump(self):
+        """
+        Gets dumped data from modules of the selected categories
+        """
+        for kind in self.KINDS:
+            self.set_dump(kind, [
+                data
+                for category in self.get_module_categories(kind)
+                for data in self.load_module(kind, category)
+            ])
+
     def get_dump(self):
         """
         Gets dumped
@@ -14,8 +92,44 @@ class FilterGetDump(FilterAbstract):
         self.context.events = DUMP_EVENTS
         self.context.oops = DUMP_OOPS
 
+    def filter_sides(self):
+        """
+        Removes data of the sides, that are not in context.sides
+        """
+        for kind in self.KINDS:
+            data_list = getattr(self.context, kind)
+            for data in data_list:
+                for side in ('client', 'server'):
+                    if side not in self.context.sides:
+                        setattr(data, side, [])
+
+            self.set_dump(kind, [
+                data
+                for data in data_list
+                if data.client or data.server
+            ])
+
     def apply(self):
-        self.get_dump()
+        if not self.get_json_dump():
+            if self.context.categories is None:
+                self.get_dump()
+            else:
+                self.get_partial_dump()
+
+        if len(self.context.sides) < 2:
+            self.filter_sides()
+
+        self.context.name_index.build(self.context.functions,
+                                      self.context.oops)
+
+        if self.context.is_partial():
+            categories = 'all' if self.context.categories is None \
+                else ', '.join(sorted(self.context.categories))
+            print(
+                f'Partial run, categories: \u001b[34m{categories}\u001b[0m, '
+                f'sides: \u001b[34m{", ".join(self.context.sides)}\u001b[0m'
+            )
+
         print(
             f'Got all Dumps: '
             f'\u001b[34m{len(self.context.functions)}\u001b[0m'
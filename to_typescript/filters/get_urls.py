@@ -1,23 +1,47 @@
+import os
+
+from crawler.core.url_index import UrlIndex
 from to_typescript.core.filter import FilterAbstract
+from to_typescript.filters.get_dump import FilterGetDump
 
 
 class FilterGetUrls(FilterAbstract):
+    def get_json_urls(self) -> bool:
+        """
+        Gets urls from the JSON lines indexes of the dump
+        :return: False, if there are no indexes
+        """
+        url_lists = [UrlIndex.load(FilterGetDump.DUMP_FOLDER, kind)
+                     for kind in ('functions', 'events')]
+        if None in url_lists:
+            return False
+
+        for url_list in url_lists:
+            for url in url_list:
+                self.context.urls[url.name] = url
+
+        return True
+
     def get_urls(self):
         """
         Gets urls, collects them into a dictionary
           and saves it into the context
         """
-        from to_python.dump.url_list import URL_LIST
-        from to_python.dump.url_list import URL_LIST_EVENT
+        url_list = FilterGetDump.load_module_file(
+            'to_python.dump.url_list',
+            os.path.join(FilterGetDump.DUMP_FOLDER, 'url_list.py'),
+        )
 
-        for url in URL_LIST:
+        for url in url_list.URL_LIST:
             self.context.urls[url.name] = url
 
-        for url in URL_LIST_EVENT:
+        for url in url_list.URL_LIST_EVENT:
             self.context.urls[url.name] = url
 
     def apply(self):
-        self.get_urls()
+        if not self.get_json_urls():
+            self.get_urls()
+
         print(
             f'Got all URLs (functions and events): '
             f'\u001b[34m{len(self.context.urls)}\u001b[0m'
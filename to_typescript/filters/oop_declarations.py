@@ -1,12 +1,42 @@
 from collections import defaultdict
-from typing import Set, DefaultDict, List
+from typing import Set, DefaultDict, List, Tuple, Optional
 
 from crawler.core.types import PageUrl
 from to_python.core.types import FunctionOOP
 from to_typescript.core.filter import FilterAbstract
+from to_typescript.core.parallel import generate_in_pool
 from to_typescript.core.transform.function import TypeScriptFunctionGenerator
 from to_typescript.core.transform.oop import TypeScriptOOPGenerator
 
+# Field, method and class template declarations
+OOPDeclarationType = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+def generate_oop_declarations(host_name: str,
+                              items: List[Tuple[FunctionOOP, PageUrl]]) -> \
+        List[OOPDeclarationType]:
+    """
+    Generates declarations of the OOP data (inside a worker process)
+    """
+    result = []
+    for oop_data, url in items:
+        generator = TypeScriptOOPGenerator(host_name=host_name,
+                                           data=oop_data,
+                                           url=url)
+        declaration_method = generator.generate_method()
+
+        # Adds class generic (template) string
+        template = None
+        if declaration_method and oop_data.method.name == 'constructor':
+            template = TypeScriptFunctionGenerator.generate_generics(
+                oop_data.method.signature.generic_types)
+
+        result.append((generator.generate_field(),
+                       declaration_method,
+                       template))
+
+    return result
+
 
 class FilterGenerateOOPDeclarations(FilterAbstract):
     def __init__(self):
@@ -17,18 +47,13 @@ class FilterGenerateOOPDeclarations(FilterAbstract):
             str, DefaultDict[str, Set[str]]] = defaultdict(
             lambda: defaultdict(set))
 
-    def generate_declaration(self,
-                             side: str,
-                             oop_data: FunctionOOP,
-                             url: PageUrl):
+    def save_declaration(self,
+                         side: str,
+                         oop_data: FunctionOOP,
+                         declarations: OOPDeclarationType):
         file_name = oop_data.class_name
         field_name = oop_data.field.name if oop_data.field else None
-
-        generator = TypeScriptOOPGenerator(host_name=self.context.host_name,
-                                           data=oop_data,
-                                           url=url)
-        declaration_field = generator.generate_field()
-        declaration_method = generator.generate_method()
+        declaration_field, declaration_method, template = declarations
 
         if declaration_field and field_name not in \
                 self.fields_in_class[file_name][side]:
@@ -41,26 +66,30 @@ class FilterGenerateOOPDeclarations(FilterAbstract):
             self.context.declarations.oop_methods[file_name][side].append(
                 declaration_method)
 
-            # Adds class generic (template) string
-            if oop_data.method.name == 'constructor':
-                self.context.declarations.oop_class_templates[file_name][
-                    side].append(
-                    TypeScriptFunctionGenerator.generate_generics(
-                        oop_data.method.signature.generic_types)
-                )
+        if template is not None:
+            self.context.declarations.oop_class_templates[file_name][
+                side].append(template)
 
     def apply(self):
         """
         Generates OOP declarations
         """
+        items = []
         for oop in self.context.oops:
             for side, oop_list in oop:
                 oop_list: List[FunctionOOP]
 
                 for oop_data in oop_list:
                     url = self.context.urls[oop_data.method.url]
-                    self.generate_declaration(side=side,
-                                              oop_data=oop_data,
-                                              url=url)
+                    items.append((side, oop_data, url))
+
+        declarations = generate_in_pool(
+            generate_oop_declarations,
+            self.context.host_name,
+            [(oop_data, url) for _, oop_data, url in items],
+            self.context.jobs,
+        )
+        for (side, oop_data, _), declaration in zip(items, declarations):
+            self.save_declaration(side, oop_data, declaration)
 
         print('OOP Declarations generated\u001b[0m')
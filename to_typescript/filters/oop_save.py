@@ -84,6 +84,10 @@ export class {class_name}{generic_string}{inherit_inline} {{
             cache.write(text)
 
     def apply(self):
+        if self.context.categories is not None:
+            print('Partial run, OOP .d.ts files are not saved\u001b[0m')
+            return
+
         for key in self.DUMP_FOLDERS:
             folder = self.DUMP_FOLDERS[key]
             if not os.path.exists(folder):
@@ -94,7 +98,7 @@ export class {class_name}{generic_string}{inherit_inline} {{
         keys.update(set(self.context.declarations.oop_fields.keys()))
 
         for key in sorted(keys):
-            for side in ['client', 'server']:
+            for side in self.context.sides:
                 self.save_file_category(
                     class_name=key,
                     side=side,
@@ -29,6 +29,7 @@ class FilterDumpProcessFunctions(FilterAbstract):
                 'utf8 library',
             }:
                 self.context.functions.pop(index)
+                self.context.name_index.remove_function(f)
                 continue
 
             index += 1
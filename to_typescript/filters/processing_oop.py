@@ -1,12 +1,11 @@
 import re
 from copy import deepcopy
-from typing import List, Dict
+from typing import List
 
 from crawler.core.types import ListType
 from to_python.core.types import \
     FunctionOOP, \
-    FunctionData, \
-    CompoundFunctionData
+    FunctionData
 from to_typescript.core.filter import FilterAbstract
 from to_typescript.core.transform.extra_rules import TypeConverter
 from to_typescript.filters.processing_function import \
@@ -110,15 +109,14 @@ class FilterDumpProcessOOP(FilterAbstract):
     def prepare_oop_definition(self,
                                side: ListType,
                                data_list_index: int,
-                               data_list: List[FunctionOOP],
-                               hashed_functions: Dict[
-                                   str, CompoundFunctionData]) -> int:
+                               data_list: List[FunctionOOP]) -> int:
         """
         Calls preparation method for the passed function.
         :return: New index in List[FunctionData]
         """
         data = data_list[data_list_index]
-        function_base = hashed_functions[data.base_function_name][side][0]
+        function_base = self.context.name_index.get_functions(
+            side, data.base_function_name)[-1][side][0]
 
         self.prepare_class_name(data)
         # Remove declarations without a class name
@@ -138,20 +136,6 @@ class FilterDumpProcessOOP(FilterAbstract):
         return data_list_index + increment
 
     def apply(self):
-        # TODO: Move into the context
-        hashed_functions: Dict[str, CompoundFunctionData] = {
-            **{
-                function.client[0].name: function
-                for function in self.context.functions
-                if function.client
-            },
-            **{
-                function.server[0].name: function
-                for function in self.context.functions
-                if function.server
-            }
-        }
-
         for oop in self.context.oops:
             for side, data_list in oop:
                 data_list: List[FunctionOOP]
@@ -161,7 +145,6 @@ class FilterDumpProcessOOP(FilterAbstract):
                     index = self.prepare_oop_definition(
                         side=ListType[side.upper()],
                         data_list_index=index,
-                        data_list=data_list,
-                        hashed_functions=hashed_functions)
+                        data_list=data_list)
 
         print('\u001b[32mOOP Processing complete\u001b[0m')
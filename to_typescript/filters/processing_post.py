@@ -5,6 +5,7 @@ from crawler.core.types import ListType as ListTypeOneSide
 from to_python.core.types import FunctionData, FunctionGeneric, \
     FunctionArgument, CompoundFunctionData, CompoundOOPData
 from to_typescript.core.filter import FilterAbstract
+from to_typescript.core.name_index import DumpNameIndex
 
 
 class FilterDumpProcessPostError(RuntimeError):
@@ -23,55 +24,52 @@ class ListType(enum.Enum):
             return ListTypeOneSide.SERVER
 
 
-def get_functions_from_list_by_name(f_list: List[CompoundFunctionData],
-                                    function_type: ListType,
-                                    function_name: str) -> \
+def get_functions_by_name(name_index: DumpNameIndex,
+                          function_type: ListType,
+                          function_name: str) -> \
         List[Tuple[CompoundFunctionData, ListTypeOneSide]]:
     """
     Gets function data list
     """
     if function_type == ListType.SHARED:
         return (
-                get_functions_from_list_by_name(f_list,
-                                                ListType.SERVER,
-                                                function_name)
-                + get_functions_from_list_by_name(f_list,
-                                                  ListType.CLIENT,
-                                                  function_name)
+                get_functions_by_name(name_index,
+                                      ListType.SERVER,
+                                      function_name)
+                + get_functions_by_name(name_index,
+                                        ListType.CLIENT,
+                                        function_name)
         )
 
     function_type_original = function_type.normalize()
     return [
         (f, function_type_original)
-        for f in f_list
-        if f[function_type_original]
-        and f[function_type_original][0].name == function_name
+        for f in name_index.get_functions(function_type_original,
+                                          function_name)
     ]
 
 
-def get_oops_from_list_by_name(f_list: List[CompoundOOPData],
-                               function_type: ListType,
-                               function_name: str) -> \
+def get_oops_by_name(name_index: DumpNameIndex,
+                     function_type: ListType,
+                     function_name: str) -> \
         List[Tuple[CompoundOOPData, ListTypeOneSide]]:
     """
-    Gets function data list
+    Gets OOP data list by the base function name
     """
     if function_type == ListType.SHARED:
         return (
-                get_oops_from_list_by_name(f_list,
-                                           ListType.SERVER,
-                                           function_name)
-                + get_oops_from_list_by_name(f_list,
-                                             ListType.CLIENT,
-                                             function_name)
+                get_oops_by_name(name_index,
+                                 ListType.SERVER,
+                                 function_name)
+                + get_oops_by_name(name_index,
+                                   ListType.CLIENT,
+                                   function_name)
         )
 
     function_type_original = function_type.normalize()
     return [
         (f, function_type_original)
-        for f in f_list
-        if f[function_type_original] and f[function_type_original][
-            0].base_function_name == function_name
+        for f in name_index.get_oops(function_type_original, function_name)
     ]
 
 
@@ -92,9 +90,9 @@ class FilterDumpProcessPost(FilterAbstract):
         """
         return [
             data[0][data[1]]
-            for data in get_functions_from_list_by_name(self.context.functions,
-                                                        function_type,
-                                                        function_name)
+            for data in get_functions_by_name(self.context.name_index,
+                                              function_type,
+                                              function_name)
         ]
 
     @staticmethod
@@ -227,8 +225,10 @@ class FilterDumpProcessPost(FilterAbstract):
         """
         from to_typescript.mixins.oop_mixins import mixin_oop
         from to_typescript.mixins.function_mixins import mixin_function
-        mixin_oop(self.context.oops)
-        mixin_function(self.context.functions)
+        mixin_oop(self.context.name_index)
+        mixin_function(self.context.functions,
+                       self.context.name_index,
+                       self.context.is_partial())
 
     def apply(self):
         """
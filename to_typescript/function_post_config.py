@@ -6,7 +6,8 @@ from jsonschema import validate
 
 from crawler.core.types import ListType as CrawlerListType
 from to_python.core.types import FunctionGeneric, FunctionType, \
-    FunctionArgument, FunctionData, CompoundOOPData
+    FunctionArgument, FunctionData
+from to_typescript.core.name_index import DumpNameIndex
 from to_typescript.filters.processing_post import FilterDumpProcessPost, \
     ListType, FilterDumpProcessPostError
 
@@ -19,7 +20,7 @@ def parse_side(side: str) -> ListType:
     return ListType[side.upper()]
 
 
-def get_oop_functions(oops: List[CompoundOOPData], side: ListType,
+def get_oop_functions(name_index: DumpNameIndex, side: ListType,
                       function_name: str) -> List[List[FunctionData]]:
     original_sides = [
         CrawlerListType[side.name]] if side != ListType.SHARED else [
@@ -29,14 +30,9 @@ def get_oop_functions(oops: List[CompoundOOPData], side: ListType,
 
     return [
         [data.method]
-        for data_list in [
-            oop[original_side]
-            for oop in oops
-            for original_side in original_sides
-            if oop[original_side]
-            if oop[original_side][0].base_function_name == function_name
-        ]
-        for data in data_list
+        for original_side in original_sides
+        for oop in name_index.get_oops(original_side, function_name)
+        for data in oop[original_side]
         if data.method
     ]
 
@@ -193,6 +189,10 @@ def apply_post_process(processor: FilterDumpProcessPost):
         )
 
         functions = processor.get_functions(side, function_name)
+        if not functions and processor.context.is_partial():
+            print('    Skipped, the function is not loaded (partial run)\n')
+            continue
+
         if not functions:
             raise FunctionPostConfigException(
                 f'No functions found for name {function_name}')
@@ -209,7 +209,7 @@ def apply_post_process(processor: FilterDumpProcessPost):
                 f'Applying actions to OOP with base name '
                 f'\u001b[34m{function_name} \u001b[35m({side})\u001b[0m'
             )
-            functions = get_oop_functions(processor.context.oops, side,
+            functions = get_oop_functions(processor.context.name_index, side,
                                           function_name)
             if not functions:
                 raise FunctionPostConfigException(
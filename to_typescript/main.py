@@ -1,14 +1,52 @@
+import argparse
+from typing import List, Optional
+
 from crawler import config
+from profiling.profiler import add_profiler_arguments, run_chain
+from to_python.filters.data_list.save import FilterSaveFunctionData
 from to_typescript.chain import FILTER_CHAIN
 from to_typescript.core.context import Context
 
 
-def main():
-    context = Context(host_name=config.HOST_URL)
+def count_items(context: Context) -> int:
+    return len(context.functions) + len(context.events) + len(context.oops)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Transforms Python objects into TypeScript definitions')
+    parser.add_argument('-c', '--category', action='append',
+                        help='Process only the dump category '
+                             '(like "Ped functions" or ped_functions). '
+                             'Can be repeated. Files, that combine all '
+                             'categories (index files, OOP classes), '
+                             'are not saved')
+    parser.add_argument('-s', '--side', choices=['client', 'server'],
+                        help='Process only the side')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Amount of processes for the declaration '
+                             'generation (default: 1, generate in the main '
+                             'process)')
+    add_profiler_arguments(parser)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    context = Context(
+        host_name=config.HOST_URL,
+        categories=None if args.category is None else {
+            FilterSaveFunctionData.clean_file_name(category)
+            for category in args.category
+        },
+        sides=['client', 'server'] if args.side is None else [args.side],
+        jobs=max(1, args.jobs),
+    )
 
-    for filter_item in FILTER_CHAIN:
-        filter_item.initialize(context)
-        filter_item.apply()
+    run_chain(FILTER_CHAIN, context, args,
+              chain_name='to_typescript',
+              count_items=count_items)
 
     print('\u001b[1m\u001b[32mChain complete\u001b[0m')
 
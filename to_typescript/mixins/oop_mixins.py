@@ -1,25 +1,22 @@
-from typing import List
+from to_python.core.types import FunctionOOP, FunctionType, FunctionArgument
+from to_typescript.core.name_index import DumpNameIndex
+from to_typescript.filters.processing_post import get_oops_by_name, ListType
 
-from to_python.core.types import CompoundOOPData, FunctionOOP, FunctionType, \
-    FunctionArgument
-from to_typescript.filters.processing_post import get_oops_from_list_by_name, \
-    ListType
 
-
-def each_oop_data_from_list_by_name(f_list: List[CompoundOOPData],
-                                    function_type: ListType,
-                                    function_name: str):
-    for oop_data, _ in get_oops_from_list_by_name(f_list, function_type,
-                                                  function_name):
+def each_oop_data_by_name(name_index: DumpNameIndex,
+                          function_type: ListType,
+                          function_name: str):
+    for oop_data, _ in get_oops_by_name(name_index, function_type,
+                                        function_name):
         for side, inner_list in oop_data:
             for data in inner_list:
                 data: FunctionOOP
                 yield data
 
 
-def mixin_oop(oop_list: List[CompoundOOPData]):
-    for data in each_oop_data_from_list_by_name(oop_list, ListType.SHARED,
-                                                'getColShapeSize'):
+def mixin_oop(name_index: DumpNameIndex):
+    for data in each_oop_data_by_name(name_index, ListType.SHARED,
+                                      'getColShapeSize'):
         data.method.signature.return_types.return_types = [
             FunctionType(
                 is_optional=False,
@@ -31,8 +28,8 @@ def mixin_oop(oop_list: List[CompoundOOPData]):
             )
         ]
 
-    for data in each_oop_data_from_list_by_name(oop_list, ListType.SHARED,
-                                                'setColShapeSize'):
+    for data in each_oop_data_by_name(name_index, ListType.SHARED,
+                                      'setColShapeSize'):
         data.method.signature.arguments.arguments = [
             [
                 FunctionArgument(
@@ -50,8 +47,8 @@ def mixin_oop(oop_list: List[CompoundOOPData]):
             ]
         ]
 
-    for data in each_oop_data_from_list_by_name(oop_list, ListType.SHARED,
-                                                'getElementBoundingBox'):
+    for data in each_oop_data_by_name(name_index, ListType.SHARED,
+                                      'getElementBoundingBox'):
         data.method.signature.return_types.return_types = [
             FunctionType(
                 is_optional=False,
@@ -67,8 +64,8 @@ def mixin_oop(oop_list: List[CompoundOOPData]):
             )
         ]
 
-    for data in each_oop_data_from_list_by_name(oop_list, ListType.SHARED,
-                                                'setElementBoundingBox'):
+    for data in each_oop_data_by_name(name_index, ListType.SHARED,
+                                      'setElementBoundingBox'):
         data.method.signature.arguments.arguments = [
             [
                 FunctionArgument(